@@ -0,0 +1,221 @@
+"""
+Benchmark of scheduler overhead driven by a simulated clock.
+
+Synthetic validations are scheduled like loaded ones and executed by the
+scheduler hot path, but time only moves when the simulated clock advances,
+so hours of scheduling are simulated in seconds.
+
+Usage: python -m benchmarks.scheduler_benchmark --validations 10000
+"""
+import argparse
+import datetime
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+import types
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import schedule  # noqa: E402
+
+from lifeguard import scheduler  # noqa: E402
+from lifeguard.logger import lifeguard_logger  # noqa: E402
+from lifeguard.statuses import NORMAL  # noqa: E402
+from lifeguard.validations import VALIDATIONS, ValidationResponse, validation  # noqa
+
+INTERVALS = [
+    {"seconds": 30},
+    {"minutes": 1},
+    {"minutes": 5},
+    {"minutes": 15},
+]
+
+
+class VirtualClock:
+    """
+    Clock that only moves when advanced
+    """
+
+    def __init__(self, start):
+        self.now = start
+
+    def advance(self, seconds):
+        self.now += datetime.timedelta(seconds=seconds)
+
+
+def build_virtual_datetime(clock):
+    """
+    Return a datetime class and a datetime module whose now is the clock
+    """
+
+    class VirtualDatetime(datetime.datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return clock.now
+
+    module = types.SimpleNamespace(**vars(datetime))
+    module.datetime = VirtualDatetime
+    return VirtualDatetime, module
+
+
+def build_synthetic_validations(clock, count, duration, drifts, seed):
+    """
+    Register validations that take duration simulated seconds to run
+    """
+    generator = random.Random(seed)
+    jobs = {}
+
+    def build(name):
+        def synthetic():
+            drifts.append((clock.now - jobs[name].next_run).total_seconds())
+            clock.advance(duration)
+            return ValidationResponse(NORMAL, {})
+
+        synthetic.__name__ = name
+        return synthetic
+
+    for index in range(count):
+        name = f"synthetic_{index}"
+        validation(
+            f"synthetic validation {index}",
+            actions=[],
+            schedule={"every": generator.choice(INTERVALS)},
+        )(build(name))
+    return jobs
+
+
+def build_validations_files(directory, count):
+    """
+    Create empty validations files to be checked by reload
+    """
+    validations_directory = os.path.join(directory, "validations")
+    os.makedirs(validations_directory)
+    for index in range(count):
+        file_path = os.path.join(validations_directory, f"file_{index}_validation.yaml")
+        with open(file_path, "w") as validations_file:
+            validations_file.write("validations: []\n")
+
+
+def mean(values):
+    return sum(values) / len(values) if values else 0.0
+
+
+def percentile(values, percent):
+    """
+    Return percentile interpolated between closest ranks
+    """
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * percent / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def run(arguments):
+    clock = VirtualClock(datetime.datetime(2024, 1, 1))
+    virtual_datetime, virtual_module = build_virtual_datetime(clock)
+    drifts = []
+    ticks = []
+
+    lifeguard_logger.setLevel(logging.WARNING)
+    VALIDATIONS.clear()
+    schedule.clear()
+
+    with tempfile.TemporaryDirectory() as directory, patch.object(
+        schedule, "datetime", virtual_module
+    ), patch.object(scheduler, "datetime", virtual_datetime), patch.object(
+        scheduler, "LIFEGUARD_DIRECTORY", directory
+    ), patch.object(
+        scheduler, "WATCHED_FILES", {}
+    ):
+        build_validations_files(directory, arguments.files)
+
+        jobs = build_synthetic_validations(
+            clock, arguments.validations, arguments.duration, drifts, arguments.seed
+        )
+        started = time.process_time()
+        scheduler.configure_validations()
+        configure_cpu = time.process_time() - started
+        for job in schedule.get_jobs("validation"):
+            jobs[next(tag for tag in job.tags if tag != "validation")] = job
+
+        scheduler.check_if_should_reload()
+        started = time.process_time()
+        for _ in range(arguments.reload_checks):
+            scheduler.check_if_should_reload()
+        reload_cpu = (time.process_time() - started) / arguments.reload_checks
+
+        end = clock.now + datetime.timedelta(seconds=arguments.simulated_time)
+        while clock.now < end:
+            idle_seconds = schedule.idle_seconds()
+            if idle_seconds is None:
+                break
+            if idle_seconds > 0:
+                clock.advance(idle_seconds)
+            executions = len(drifts)
+            started = time.process_time()
+            scheduler.run_pending()
+            ticks.append(time.process_time() - started)
+            if len(drifts) == executions:
+                clock.advance(0.001)
+
+        total_cpu = sum(ticks)
+        schedule.clear()
+        VALIDATIONS.clear()
+
+    print(f"validations:              {arguments.validations}")
+    print(f"simulated time:           {arguments.simulated_time}s")
+    print(f"configure_validations:    {configure_cpu * 1000:.2f}ms cpu")
+    print(
+        f"check_if_should_reload:   {reload_cpu * 1000:.3f}ms cpu "
+        f"({arguments.files} files)"
+    )
+    print(f"ticks:                    {len(ticks)}")
+    print(
+        "run_pending cpu per tick: "
+        f"mean {mean(ticks) * 1000:.3f}ms "
+        f"p99 {percentile(ticks, 99) * 1000:.3f}ms"
+    )
+    print(
+        "start drift:              "
+        f"p50 {percentile(drifts, 50):.3f}s "
+        f"p95 {percentile(drifts, 95):.3f}s "
+        f"p99 {percentile(drifts, 99):.3f}s "
+        f"max {max(drifts or [0]):.3f}s"
+    )
+    print(
+        "throughput:               "
+        f"{len(drifts)} executions, "
+        f"{len(drifts) / arguments.simulated_time:.1f}/simulated s, "
+        f"{len(drifts) / total_cpu if total_cpu else 0:.0f}/cpu s"
+    )
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Benchmark of lifeguard scheduler")
+    parser.add_argument("--validations", type=int, default=10000)
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=0.0,
+        help="simulated seconds spent by each validation execution",
+    )
+    parser.add_argument(
+        "--simulated-time", type=int, default=3600, help="simulated seconds"
+    )
+    parser.add_argument(
+        "--files", type=int, default=100, help="validations files checked by reload"
+    )
+    parser.add_argument("--reload-checks", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    run(parser.parse_args(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,12 @@ from lifeguard.settings import (
 from lifeguard.controllers import load_custom_controllers
 from lifeguard.controllers.assets import load_assets_controllers
 from lifeguard.controllers.groups import load_groups_controllers
+from lifeguard.profiler import (
+    PROFILE,
+    disable_profiler,
+    log_startup_profile,
+    profile_phase,
+)
 from lifeguard.server import enable_cors, register_custom_controller
 from lifeguard.validations import load_validations
 
@@ -41,24 +47,34 @@ def setup(lifeguard_context):
     Setup lifeguard context
     """
     # init plugins
-    lifeguard_settings = recover_settings()
+    with profile_phase("recover settings"):
+        lifeguard_settings = recover_settings()
 
     for plugin in lifeguard_settings.PLUGINS:
-        SETTINGS_MANAGER.settings.update(plugin.settings.SETTINGS_MANAGER.settings)
-        if not lifeguard_context.only_settings:
-            plugin.init(lifeguard_context)
+        with profile_phase(f"plugin {getattr(plugin, '__name__', plugin)}"):
+            SETTINGS_MANAGER.settings.update(plugin.settings.SETTINGS_MANAGER.settings)
+            if not lifeguard_context.only_settings:
+                plugin.init(lifeguard_context)
 
-    load_custom_controllers()
-    load_groups_controllers()
+    with profile_phase("load controllers"):
+        load_custom_controllers()
+        load_groups_controllers()
 
-    if LIFEGUARD_CONTROLLERS_ASSETS_ENABLED:
-        load_assets_controllers()
+        if LIFEGUARD_CONTROLLERS_ASSETS_ENABLED:
+            load_assets_controllers()
 
-    load_validations()
+    with profile_phase("load validations"):
+        load_validations()
 
-    lifeguard_settings.setup(lifeguard_context)
+    with profile_phase("lifeguard_settings setup"):
+        lifeguard_settings.setup(lifeguard_context)
 
     if lifeguard_context.cors_settings:
         enable_cors(lifeguard_context.cors_settings)
 
     register_custom_controller()
+
+    if PROFILE["enabled"]:
+        log_startup_profile()
+        # allocations tracing slows down scheduler and server
+        disable_profiler()
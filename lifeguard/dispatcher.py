@@ -0,0 +1,154 @@
+"""
+Dispatcher that executes validations actions out of validation execution
+"""
+import threading
+import traceback
+from collections import deque
+
+from lifeguard.logger import lifeguard_logger as logger
+from lifeguard.metrics import DROPPED, increment
+from lifeguard.settings import (
+    LIFEGUARD_ACTIONS_QUEUE_POLICY,
+    LIFEGUARD_ACTIONS_QUEUE_SIZE,
+    LIFEGUARD_ACTIONS_WORKERS,
+)
+
+BLOCK = "block"
+DROP = "drop"
+QUEUE_POLICIES = [BLOCK, DROP]
+
+
+class ActionDispatcher:
+    """
+    Bounded queue of actions executed by worker threads.
+
+    Actions of a validation are executed one at a time in dispatch order,
+    actions of different validations run in parallel. When the queue is
+    full new actions wait for room or are dropped according to the queue
+    policy. Without workers actions are executed in the calling thread.
+    """
+
+    def __init__(self, workers, queue_size, policy=BLOCK):
+        if policy not in QUEUE_POLICIES:
+            raise ValueError(f"{policy} is not a valid queue policy")
+
+        self._workers = workers
+        self._queue_size = max(queue_size, 1)
+        self._policy = policy
+        self._condition = threading.Condition()
+        self._ready = deque()
+        self._running = set()
+        self._pending = {}
+        self._size = 0
+        self._threads = []
+
+    @property
+    def workers(self):
+        """
+        Return number of workers
+        """
+        return self._workers
+
+    def start(self):
+        """
+        Start worker threads
+        """
+        with self._condition:
+            for index in range(len(self._threads), self._workers):
+                thread = threading.Thread(
+                    target=self.__work,
+                    name=f"lifeguard-actions-{index}",
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def dispatch(self, name, function, *args):
+        """
+        Queue function to be executed in name of a validation
+
+        :return: if function was accepted, it is executed immediately
+            when dispatcher has no workers
+        """
+        if not self._workers:
+            function(*args)
+            return True
+
+        self.start()
+        with self._condition:
+            if self._size >= self._queue_size:
+                if self._policy == DROP:
+                    increment(name, DROPPED)
+                    logger.warning("actions of %s dropped: queue is full", name)
+                    return False
+                self._condition.wait_for(lambda: self._size < self._queue_size)
+
+            self._pending.setdefault(name, deque()).append((function, args))
+            self._size += 1
+            if name not in self._running and name not in self._ready:
+                self._ready.append(name)
+            self._condition.notify_all()
+        return True
+
+    def queue_depth(self):
+        """
+        Return number of dispatched functions not executed yet
+        """
+        with self._condition:
+            return self._size
+
+    def join(self, timeout=None):
+        """
+        Block until all dispatched functions are executed
+
+        :return: if queue was drained before timeout
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._size, timeout)
+
+    def __work(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._ready)
+                name = self._ready.popleft()
+                self._running.add(name)
+                function, args = self._pending[name].popleft()
+
+            try:
+                function(*args)
+            except Exception as exception:
+                self.__log_error(name, exception)
+            finally:
+                self.__finish(name)
+
+    def __finish(self, name):
+        with self._condition:
+            self._running.discard(name)
+            self._size -= 1
+            if self._pending[name]:
+                self._ready.append(name)
+            else:
+                del self._pending[name]
+            self._condition.notify_all()
+
+    @staticmethod
+    def __log_error(name, exception):
+        logger.error(
+            "error on execute actions of %s: %s",
+            name,
+            str(exception),
+            extra={
+                "traceback": "".join(
+                    traceback.format_exception(
+                        type(exception), exception, exception.__traceback__
+                    )
+                )
+            },
+        )
+
+
+ACTION_DISPATCHER = ActionDispatcher(
+    LIFEGUARD_ACTIONS_WORKERS,
+    LIFEGUARD_ACTIONS_QUEUE_SIZE,
+    LIFEGUARD_ACTIONS_QUEUE_POLICY,
+)
@@ -0,0 +1,71 @@
+"""
+Event loop shared by asynchronous validations
+"""
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+
+from lifeguard.settings import LIFEGUARD_ASYNC_VALIDATIONS_CONCURRENCY
+
+
+class SharedEventLoop:
+    """
+    Event loop running in a dedicated thread.
+
+    The loop is started on first use and limits how many coroutines
+    are running at same time.
+    """
+
+    def __init__(self, concurrency):
+        self._concurrency = concurrency
+        self._loop = None
+        self._semaphore = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self):
+        """
+        Return event loop, starting it when needed
+        """
+        with self._lock:
+            if not self._loop:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever,
+                    name="lifeguard-event-loop",
+                    daemon=True,
+                ).start()
+        return self._loop
+
+    def submit(self, coroutine, limited=True):
+        """
+        Schedule a coroutine in event loop
+
+        :param limited: coroutine waits for a concurrency slot, disable it
+            for coroutines that take the slot by themselves with slot()
+        :return: :class:`concurrent.futures.Future` with coroutine result
+        """
+        if not limited:
+            return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+        return asyncio.run_coroutine_threadsafe(self.__limited(coroutine), self.loop)
+
+    @asynccontextmanager
+    async def slot(self):
+        """
+        Hold one of the slots limiting coroutines running at same time
+        """
+        if not self._concurrency:
+            yield
+            return
+
+        if not self._semaphore:
+            self._semaphore = asyncio.Semaphore(self._concurrency)
+        async with self._semaphore:
+            yield
+
+    async def __limited(self, coroutine):
+        async with self.slot():
+            return await coroutine
+
+
+EVENT_LOOP = SharedEventLoop(LIFEGUARD_ASYNC_VALIDATIONS_CONCURRENCY)
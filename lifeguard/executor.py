@@ -0,0 +1,176 @@
+"""
+Pool of threads used by scheduler to execute validations
+"""
+import heapq
+import itertools
+import threading
+import traceback
+from collections import deque
+
+from lifeguard.event_loop import EVENT_LOOP
+from lifeguard.logger import lifeguard_logger as logger
+from lifeguard.metrics import COALESCED, SKIPPED, increment
+
+SKIP = "skip"
+COALESCE = "coalesce"
+QUEUE = "queue"
+OVERRUN_POLICIES = [SKIP, COALESCE, QUEUE]
+
+
+class ExecutionPool:
+    """
+    Bounded pool of threads that executes validations.
+
+    A validation never runs concurrently with itself: executions submitted
+    while it is running are skipped, coalesced or queued according to the
+    overrun policy. Queued executions run in submission order.
+    Executions waiting for a worker are taken by priority, higher first,
+    and reserved workers only take executions with critical priority.
+    Coroutine functions are executed in the shared event loop instead of
+    occupying a thread.
+    """
+
+    def __init__(self, workers, reserved_workers=0, critical_priority=0):
+        self._workers = workers
+        # at least one worker is kept to executions of any priority
+        self._reserved_workers = min(reserved_workers, max(workers - 1, 0))
+        self._critical_priority = critical_priority
+        self._ready = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._running = set()
+        self._pending = {}
+        self._threads = []
+
+    @property
+    def workers(self):
+        """
+        Return number of workers
+        """
+        return self._workers
+
+    def start(self):
+        """
+        Start worker threads
+        """
+        for index in range(len(self._threads), self._workers):
+            thread = threading.Thread(
+                target=self.__work,
+                args=(index < self._reserved_workers,),
+                name=f"lifeguard-worker-{index}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, name, function, asynchronous=False, overrun=QUEUE, priority=0):
+        """
+        Submit a function to be executed in name of a validation
+
+        :param asynchronous: function returns a coroutine to run in event loop
+        :param overrun: what to do when validation is still running: skip
+            the new execution, coalesce it with an already waiting one or
+            queue it
+        :param priority: executions with higher priority are taken first
+        :return: if execution was accepted
+        """
+        if overrun not in OVERRUN_POLICIES:
+            raise ValueError(f"{overrun} is not a valid overrun policy")
+
+        with self._condition:
+            if name in self._running:
+                pending = self._pending.setdefault(name, deque())
+                if overrun == SKIP or (overrun == COALESCE and pending):
+                    if not pending:
+                        del self._pending[name]
+                    counter = SKIPPED if overrun == SKIP else COALESCED
+                    increment(name, counter)
+                    logger.info("execution of %s %s: still running", name, counter)
+                    return False
+                pending.append((function, asynchronous, priority))
+                return True
+            self._running.add(name)
+        self.__start(name, function, asynchronous, priority)
+        return True
+
+    def queue_depth(self):
+        """
+        Return number of executions waiting for a worker
+        """
+        with self._condition:
+            pending = sum(len(functions) for functions in self._pending.values())
+            return len(self._ready) + pending
+
+    def join(self):
+        """
+        Block until all submitted executions are done
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: not self._running)
+
+    def __start(self, name, function, asynchronous, priority):
+        if not asynchronous:
+            with self._condition:
+                heapq.heappush(
+                    self._ready, (-priority, next(self._sequence), name, function)
+                )
+                self._condition.notify_all()
+            return
+
+        try:
+            # validations coroutines take a slot of event loop by themselves
+            future = EVENT_LOOP.submit(function(), limited=False)
+        except Exception as exception:
+            self.__log_error(name, exception)
+            self.__finish(name)
+            return
+        future.add_done_callback(lambda done: self.__finish_coroutine(name, done))
+
+    def __finish_coroutine(self, name, future):
+        if future.exception():
+            self.__log_error(name, future.exception())
+        self.__finish(name)
+
+    def __has_work(self, reserved):
+        if not self._ready:
+            return False
+        return not reserved or -self._ready[0][0] >= self._critical_priority
+
+    def __work(self, reserved):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self.__has_work(reserved))
+                _priority, _sequence, name, function = heapq.heappop(self._ready)
+            try:
+                function()
+            except Exception as exception:
+                self.__log_error(name, exception)
+            finally:
+                self.__finish(name)
+
+    def __finish(self, name):
+        with self._condition:
+            pending = self._pending.get(name)
+            if not pending:
+                self._running.discard(name)
+                self._condition.notify_all()
+                return
+            function, asynchronous, priority = pending.popleft()
+            if not pending:
+                del self._pending[name]
+        self.__start(name, function, asynchronous, priority)
+
+    @staticmethod
+    def __log_error(name, exception):
+        logger.error(
+            "error on execute %s in pool: %s",
+            name,
+            str(exception),
+            extra={
+                "traceback": "".join(
+                    traceback.format_exception(
+                        type(exception), exception, exception.__traceback__
+                    )
+                )
+            },
+        )
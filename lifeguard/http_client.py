@@ -3,27 +3,30 @@ Wrapper for http requests
 """
 import requests
 
-from lifeguard.settings import HTTP_PROXY, HTTPS_PROXY
+from lifeguard.settings import HTTP_PROXY, HTTPS_PROXY, HTTP_TIMEOUT
 
 
-def get(url, headers=None, auth=None):
+def get(url, headers=None, auth=None, timeout=None):
     """
     :param url:
     :param headers:
+    :param timeout: seconds to wait, defaults to LIFEGUARD_HTTP_TIMEOUT
 
     :return: :class:`Response <Response>` object
     :rtype: requests.Response
     """
     request_args = {"url": url, "headers": headers, "auth": auth}
     __append_proxies(request_args)
+    __append_timeout(request_args, timeout)
     return requests.get(**request_args)
 
 
-def post(url, data=None, headers=None, auth=None):
+def post(url, data=None, headers=None, auth=None, timeout=None):
     """
     :param url:
     :param data:
     :param headers:
+    :param timeout: seconds to wait, defaults to LIFEGUARD_HTTP_TIMEOUT
 
     :return: :class:`Response <Response>` object
     :rtype: requests.Response
@@ -31,6 +34,7 @@ def post(url, data=None, headers=None, auth=None):
 
     request_args = {"url": url, "headers": headers, "data": data, "auth": auth}
     __append_proxies(request_args)
+    __append_timeout(request_args, timeout)
     return requests.post(**request_args)
 
 
@@ -46,3 +50,9 @@ def __append_proxies(request_args):
 
     if proxies:
         request_args["proxies"] = proxies
+
+
+def __append_timeout(request_args, timeout):
+    timeout = timeout or HTTP_TIMEOUT
+    if timeout:
+        request_args["timeout"] = timeout
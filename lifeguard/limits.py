@@ -0,0 +1,85 @@
+"""
+Named semaphores limiting validations running at same time against the
+same group or target
+"""
+import asyncio
+import threading
+from contextlib import asynccontextmanager, contextmanager
+
+from lifeguard.logger import lifeguard_logger as logger
+from lifeguard.settings import LIFEGUARD_CONCURRENCY_LIMITS
+
+SEMAPHORES = {}
+
+
+def configure_limits(limits):
+    """
+    Build semaphores from a list of entries in format name=limit
+    """
+    SEMAPHORES.clear()
+    for entry in limits:
+        name, _separator, limit = entry.partition("=")
+        try:
+            if int(limit) < 1:
+                raise ValueError(f"limit {limit} is not positive")
+            SEMAPHORES[name.strip()] = threading.BoundedSemaphore(int(limit))
+        except ValueError:
+            logger.warning("invalid concurrency limit %s", entry)
+
+
+def __get_semaphores(names):
+    return [
+        SEMAPHORES[name] for name in sorted(set(names) - {None}) if name in SEMAPHORES
+    ]
+
+
+def acquire_limits(names):
+    """
+    Acquire semaphores configured for names, blocking until all are free
+
+    :return: acquired semaphores, to be passed to release_limits
+    """
+    semaphores = __get_semaphores(names)
+    for semaphore in semaphores:
+        semaphore.acquire()
+    return semaphores
+
+
+def release_limits(semaphores):
+    """
+    Release semaphores returned by acquire_limits
+    """
+    for semaphore in reversed(semaphores):
+        semaphore.release()
+
+
+@contextmanager
+def concurrency_limits(names):
+    """
+    Hold semaphores configured for names while running the block
+    """
+    semaphores = acquire_limits(names)
+    try:
+        yield
+    finally:
+        release_limits(semaphores)
+
+
+@asynccontextmanager
+async def async_concurrency_limits(names, interval=0.01):
+    """
+    Hold semaphores configured for names without blocking the event loop
+    """
+    acquired = []
+    try:
+        for semaphore in __get_semaphores(names):
+            while not semaphore.acquire(blocking=False):
+                await asyncio.sleep(interval)
+            acquired.append(semaphore)
+        yield
+    finally:
+        for semaphore in reversed(acquired):
+            semaphore.release()
+
+
+configure_limits(LIFEGUARD_CONCURRENCY_LIMITS)
@@ -0,0 +1,51 @@
+"""
+Counters of validations executions
+"""
+import threading
+
+from lifeguard.logger import lifeguard_logger as logger
+
+COUNTERS = {}
+COUNTERS_LOCK = threading.Lock()
+
+EXECUTIONS = "executions"
+FAILURES = "failures"
+TIMEOUTS = "timeouts"
+SKIPPED = "skipped"
+COALESCED = "coalesced"
+DROPPED = "dropped"
+
+
+def increment(validation_name, counter, value=1):
+    """
+    Increment a counter of a validation
+    """
+    with COUNTERS_LOCK:
+        counters = COUNTERS.setdefault(validation_name, {})
+        counters[counter] = counters.get(counter, 0) + value
+
+
+def read_counters(validation_name=None):
+    """
+    Return a copy of counters of a validation or of all validations
+    """
+    with COUNTERS_LOCK:
+        if validation_name:
+            return dict(COUNTERS.get(validation_name, {}))
+        return {name: dict(counters) for name, counters in COUNTERS.items()}
+
+
+def clear_counters():
+    """
+    Clear all counters
+    """
+    with COUNTERS_LOCK:
+        COUNTERS.clear()
+
+
+def log_counters():
+    """
+    Log counters of each validation
+    """
+    for validation_name, counters in sorted(read_counters().items()):
+        logger.info("validation %s counters: %s", validation_name, counters)
@@ -0,0 +1,91 @@
+"""
+Profile of time and memory spent in each startup phase
+"""
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from lifeguard.logger import lifeguard_logger as logger
+from lifeguard.settings import LIFEGUARD_STARTUP_PROFILE
+
+PROFILE = {"enabled": False, "depth": 0, "phases": [], "tracing": False}
+
+
+def enable_profiler():
+    """
+    Start to record startup phases, tracing memory allocations
+    """
+    PROFILE["enabled"] = True
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+        PROFILE["tracing"] = True
+
+
+def disable_profiler():
+    """
+    Stop to record phases, recorded ones are kept to build the report.
+    Memory allocations tracing is stopped if it was started by profiler.
+    """
+    PROFILE["enabled"] = False
+    if PROFILE["tracing"]:
+        tracemalloc.stop()
+        PROFILE["tracing"] = False
+
+
+@contextmanager
+def profile_phase(name):
+    """
+    Record time and memory allocated while running the block
+    """
+    if not PROFILE["enabled"]:
+        yield
+        return
+
+    phase = {"name": name, "depth": PROFILE["depth"], "seconds": 0.0, "memory": 0}
+    PROFILE["phases"].append(phase)
+    PROFILE["depth"] += 1
+    memory = tracemalloc.get_traced_memory()[0]
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        phase["seconds"] = time.perf_counter() - started
+        phase["memory"] = tracemalloc.get_traced_memory()[0] - memory
+        PROFILE["depth"] -= 1
+
+
+def build_startup_report():
+    """
+    Return a table with recorded phases, nested phases are indented
+    """
+    rows = [
+        (
+            "  " * phase["depth"] + phase["name"],
+            f"{phase['seconds']:.3f}",
+            f"{phase['memory'] / 1024:.1f}",
+        )
+        for phase in PROFILE["phases"]
+    ]
+    width = max([len(row[0]) for row in rows] + [len("Phase")])
+    lines = [f"{'Phase':<{width}}  {'Seconds':>8}  {'Memory (KiB)':>12}"]
+    lines.extend(
+        f"{name:<{width}}  {seconds:>8}  {memory:>12}" for name, seconds, memory in rows
+    )
+    return "\n".join(lines)
+
+
+def log_startup_profile():
+    """
+    Log recorded phases
+    """
+    for phase in PROFILE["phases"]:
+        logger.info(
+            "startup phase %s: %.3fs %.1fKiB",
+            phase["name"],
+            phase["seconds"],
+            phase["memory"] / 1024,
+        )
+
+
+if LIFEGUARD_STARTUP_PROFILE:
+    enable_profiler()
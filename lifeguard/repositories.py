@@ -32,6 +32,15 @@ class ValidationRepository(BaseRepository):
             return self.__implementation__.delete_validation_result(validation_name)
         logger.warn("delete_validation_result not implemented")
 
+    def update_validation_heartbeat(self, validation_name, heartbeat):
+        """
+        Update when an unchanged result was last seen, when implemented
+        """
+        if hasattr(self.__implementation__, "update_validation_heartbeat"):
+            return self.__implementation__.update_validation_heartbeat(
+                validation_name, heartbeat
+            )
+
 
 class NotificationRepository(BaseRepository):
     def __init__(self):
@@ -66,6 +75,20 @@ class HistoryRepository(BaseRepository):
         )
 
 
+class CoordinationRepository(BaseRepository):
+    def __init__(self):
+        BaseRepository.__init_repository__(self, "coordination")
+
+    def register_node(self, node_id, heartbeat):
+        self.__implementation__.register_node(node_id, heartbeat)
+
+    def fetch_active_nodes(self, since):
+        return self.__implementation__.fetch_active_nodes(since)
+
+    def unregister_node(self, node_id):
+        self.__implementation__.unregister_node(node_id)
+
+
 def declare_implementation(repository, implementation):
     if repository in IMPLEMENTATIONS:
         logger.warning("overwriting implementation for respository %s", repository)
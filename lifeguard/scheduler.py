@@ -1,14 +1,51 @@
+import atexit
+import threading
 import time
 import traceback
+import zlib
+from datetime import datetime, timedelta
+from functools import partial
 
 from os import walk
 from os.path import getmtime, join, exists
 
 import schedule
 
+from lifeguard.executor import OVERRUN_POLICIES, ExecutionPool
 from lifeguard.logger import lifeguard_logger as logger
-from lifeguard.validations import VALIDATIONS, load_validations, clear_validations
-from lifeguard.settings import LIFEGUARD_DIRECTORY
+from lifeguard.metrics import log_counters
+from lifeguard.scheduler_state import (
+    load_scheduler_state,
+    prune_scheduler_state,
+    restore_job,
+    save_scheduler_state,
+    update_scheduler_state,
+)
+from lifeguard.sharding import heartbeat, leave, owns_validation
+from lifeguard.single_flight import run_once, run_once_async
+from lifeguard.statuses import PROBLEM
+from lifeguard.validations import (
+    VALIDATIONS,
+    clear_validations,
+    load_validations,
+    load_validations_file,
+    unload_validations_file,
+)
+from lifeguard.settings import (
+    LIFEGUARD_DIRECTORY,
+    LIFEGUARD_METRICS_LOG_INTERVAL,
+    LIFEGUARD_SCHEDULER_CRITICAL_PRIORITY,
+    LIFEGUARD_SCHEDULER_DEFAULT_OVERRUN,
+    LIFEGUARD_SCHEDULER_NODE_TTL,
+    LIFEGUARD_SCHEDULER_RESERVED_WORKERS,
+    LIFEGUARD_SCHEDULER_SHARDING_ENABLED,
+    LIFEGUARD_SCHEDULER_SPREAD_JOBS,
+    LIFEGUARD_SCHEDULER_STATE_FILE,
+    LIFEGUARD_SCHEDULER_WORKERS,
+    LIFEGUARD_VALIDATIONS_WATCHER,
+    LIFEGUARD_VALIDATIONS_WATCHER_DEBOUNCE,
+)
+from lifeguard.watcher import InotifyWatcher, inotify_available
 
 VALID_TIME_PERIODS = [
     "seconds",
@@ -40,26 +77,284 @@ MOMENTS = [
     "sunday",
 ]
 
+PERIOD_SECONDS = {
+    "seconds": 1,
+    "minutes": 60,
+    "hours": 60 * 60,
+    "days": 24 * 60 * 60,
+    "weeks": 7 * 24 * 60 * 60,
+}
+
+ADAPTIVE_JOBS = {}
 WATCHED_FILES = {}
+CHANGED_FILES = set()
+RESYNC_REQUESTED = False
+CHANGED_FILES_LOCK = threading.Lock()
 FOREVER = True
+EXECUTION_POOL = ExecutionPool(
+    LIFEGUARD_SCHEDULER_WORKERS,
+    reserved_workers=LIFEGUARD_SCHEDULER_RESERVED_WORKERS,
+    critical_priority=LIFEGUARD_SCHEDULER_CRITICAL_PRIORITY,
+)
+MAX_IDLE_SECONDS = 60
+FAILED_TICK_SLEEP_SECONDS = 1
+WAKE_UP = threading.Condition()
+WAKE_UP_REQUESTED = False
+
 
+def configure_validations(validations=None):
+    """
+    Schedule validations, by default all loaded validations
+    """
+    if validations is None:
+        validations = list(VALIDATIONS)
 
-def configure_validations():
-    for validation in VALIDATIONS:
+    for validation in validations:
         content = VALIDATIONS[validation]
+        if content.get("filtered"):
+            continue
         if "every" in content["schedule"]:
             time_period = get_time_period(content)
             if time_period in VALID_TIME_PERIODS:
-                job_instance = schedule.every(content["schedule"]["every"][time_period])
+                interval = content["schedule"]["every"][time_period]
+                job_instance = schedule.every(interval)
+                if content["schedule"].get("jitter"):
+                    job_instance = job_instance.to(
+                        interval + content["schedule"]["jitter"]
+                    )
                 job_func = get_dynamic_job_func(job_instance, time_period)
-                job_func.do(content["ref"]).tag("validation")
+                job = job_func.do(dispatch_validation, validation).tag(
+                    "validation", validation
+                )
+                if LIFEGUARD_SCHEDULER_SPREAD_JOBS:
+                    spread_first_run(job, validation, interval, time_period)
+                if LIFEGUARD_SCHEDULER_STATE_FILE:
+                    restore_job(job)
+        if "every_when_normal" in content["schedule"]:
+            normal_interval = get_interval_seconds(
+                content["schedule"]["every_when_normal"]
+            )
+            job = (
+                schedule.every(normal_interval)
+                .seconds.do(dispatch_validation, validation)
+                .tag("validation", validation)
+            )
+            ADAPTIVE_JOBS[validation] = job
+            if LIFEGUARD_SCHEDULER_SPREAD_JOBS:
+                spread_first_run(job, validation, normal_interval, "seconds")
+            if LIFEGUARD_SCHEDULER_STATE_FILE:
+                restore_job(job)
         if "at" in content["schedule"]:
             time_moment = get_time_moment(content)
             if time_moment in MOMENTS:
                 moment = getattr(schedule.every(), time_moment)
-                moment.at(content["schedule"]["at"][time_moment]).do(
-                    content["ref"]
-                ).tag("validation")
+                job = (
+                    moment.at(content["schedule"]["at"][time_moment])
+                    .do(dispatch_validation, validation)
+                    .tag("validation", validation)
+                )
+                if LIFEGUARD_SCHEDULER_STATE_FILE:
+                    restore_job(job)
+    wake_up_scheduler()
+
+
+def get_interval_seconds(every):
+    """
+    Return seconds of an interval like {"minutes": 1}
+    """
+    return sum(value * PERIOD_SECONDS[period] for period, value in every.items())
+
+
+def adapt_schedule(validation, response):
+    """
+    Reschedule an adaptive validation from status of its last run.
+    A problem is checked with every_when_problem interval and after it is
+    solved interval doubles until it reaches every_when_normal interval.
+    """
+    job = ADAPTIVE_JOBS.get(validation)
+    validation_schedule = VALIDATIONS.get(validation, {}).get("schedule") or {}
+    if not job or "every_when_normal" not in validation_schedule or response is None:
+        return
+
+    normal_interval = get_interval_seconds(validation_schedule["every_when_normal"])
+    problem_interval = get_interval_seconds(
+        validation_schedule.get("every_when_problem")
+        or validation_schedule["every_when_normal"]
+    )
+
+    if response.status == PROBLEM:
+        interval = problem_interval
+    else:
+        interval = min(job.interval * 2, normal_interval)
+
+    if interval == job.interval:
+        return
+
+    logger.info("validation %s rescheduled to every %s seconds", validation, interval)
+    job.interval = interval
+    job.next_run = (job.last_run or datetime.now()) + timedelta(seconds=interval)
+    wake_up_scheduler()
+
+
+def spread_first_run(job, validation, interval, time_period):
+    """
+    Move first run of a job to a phase derived from validation name, so
+    validations with same interval do not run at same second
+    """
+    if time_period not in PERIOD_SECONDS:
+        return
+
+    period = int(interval * PERIOD_SECONDS[time_period])
+    if period <= 0:
+        return
+
+    offset = zlib.crc32(validation.encode()) % period
+    job.next_run = datetime.now() + timedelta(seconds=offset)
+
+
+def dispatch_validation(validation):
+    """
+    Execute a validation in scheduler thread or send it to execution pool.
+    Asynchronous validations are always sent to the shared event loop.
+    """
+    if not owns_validation(validation):
+        logger.debug("validation %s belongs to another node", validation)
+        return
+
+    content = VALIDATIONS.get(validation, {})
+    overrun = get_overrun_policy(content)
+    priority = content.get("priority", 0)
+
+    if content.get("coroutine"):
+        coroutine = partial(run_once_async, validation, content["coroutine"])
+        if validation in ADAPTIVE_JOBS:
+            coroutine = partial(__run_adaptive_coroutine, validation, coroutine)
+        EXECUTION_POOL.submit(
+            validation,
+            coroutine,
+            asynchronous=True,
+            overrun=overrun,
+            priority=priority,
+        )
+        return
+
+    if not EXECUTION_POOL.workers:
+        return __run_validation(validation)
+    EXECUTION_POOL.submit(
+        validation,
+        partial(__run_validation, validation),
+        overrun=overrun,
+        priority=priority,
+    )
+
+
+def get_overrun_policy(content):
+    """
+    Return overrun policy defined in validation schedule
+    """
+    overrun = (content.get("schedule") or {}).get(
+        "overrun", LIFEGUARD_SCHEDULER_DEFAULT_OVERRUN
+    )
+    if overrun not in OVERRUN_POLICIES:
+        logger.warning(
+            "invalid overrun policy %s, using %s",
+            overrun,
+            LIFEGUARD_SCHEDULER_DEFAULT_OVERRUN,
+        )
+        return LIFEGUARD_SCHEDULER_DEFAULT_OVERRUN
+    return overrun
+
+
+def get_job_priority(job):
+    """
+    Return priority of a job. Internal jobs of lifeguard come before
+    any validation.
+    """
+    if "validation" not in job.tags:
+        return float("inf")
+    for tag in job.tags:
+        if tag != "validation" and tag in VALIDATIONS:
+            return VALIDATIONS[tag].get("priority", 0)
+    return 0
+
+
+def run_pending():
+    """
+    Run due jobs ordered by priority, higher first, and then by due time
+
+    :return: jobs that were run
+    """
+    jobs = [job for job in schedule.get_jobs() if job.should_run]
+    jobs.sort(key=lambda job: (-get_job_priority(job), job.next_run))
+    for job in jobs:
+        try:
+            result = job.run()
+        except Exception as exception:
+            logger.error(
+                "error on run job %s: %s",
+                job,
+                str(exception),
+                extra={"traceback": traceback.format_exc()},
+            )
+            # schedule only moves the job forward after it returns
+            job.last_run = datetime.now()
+            job._schedule_next_run()
+            continue
+        if isinstance(result, schedule.CancelJob) or result is schedule.CancelJob:
+            schedule.cancel_job(job)
+    return jobs
+
+
+def __run_validation(validation):
+    content = VALIDATIONS.get(validation)
+    if not content:
+        logger.warning("validation %s not found", validation)
+        return None
+    response = run_once(validation, content["ref"])
+    adapt_schedule(validation, response)
+    return response
+
+
+async def __run_adaptive_coroutine(validation, coroutine):
+    response = await coroutine()
+    adapt_schedule(validation, response)
+    return response
+
+
+def wake_up_scheduler():
+    """
+    Interrupt scheduler sleep to recalculate the next due job
+    """
+    global WAKE_UP_REQUESTED
+    with WAKE_UP:
+        WAKE_UP_REQUESTED = True
+        WAKE_UP.notify_all()
+
+
+def wait_for_next_job():
+    """
+    Sleep until the next job is due or until scheduler is woken up
+    """
+    global WAKE_UP_REQUESTED
+    idle_seconds = schedule.idle_seconds()
+    if idle_seconds is None:
+        idle_seconds = MAX_IDLE_SECONDS
+
+    with WAKE_UP:
+        if not WAKE_UP_REQUESTED and idle_seconds > 0:
+            WAKE_UP.wait(min(idle_seconds, MAX_IDLE_SECONDS))
+        WAKE_UP_REQUESTED = False
+
+
+def trigger_validation(validation):
+    """
+    Move the next run of a validation to now
+    """
+    jobs = schedule.get_jobs(validation)
+    for job in jobs:
+        job.next_run = datetime.now()
+    wake_up_scheduler()
+    return bool(jobs)
 
 
 def get_dynamic_job_func(job_instance, time_period):
@@ -81,7 +376,7 @@ def get_time_moment(content):
 def __load_validations_files():
     for root, _dirs, files in walk(join(LIFEGUARD_DIRECTORY, "validations")):
         for file in files:
-            if file.endswith(".yaml"):
+            if __is_validation_file(file):
                 file_path = join(root, file)
                 if file_path not in WATCHED_FILES:
                     logger.info("watching file %s", file_path)
@@ -89,31 +384,131 @@ def __load_validations_files():
 
 
 def check_if_should_reload():
-    changed = False
+    changed_files = set()
     # check new files or changed files
     for root, _dirs, files in walk(join(LIFEGUARD_DIRECTORY, "validations")):
         for file in files:
-            if file.endswith(".yaml"):
+            if __is_validation_file(file):
                 file_path = join(root, file)
                 if file_path not in WATCHED_FILES:
                     logger.info("watching file %s", file_path)
                     WATCHED_FILES[file_path] = getmtime(file_path)
-                    changed = True
+                    changed_files.add(file_path)
                 else:
                     last_modified = getmtime(file_path)
                     if last_modified != WATCHED_FILES[file_path]:
                         logger.info("file changed %s", file_path)
                         WATCHED_FILES[file_path] = last_modified
-                        changed = True
+                        changed_files.add(file_path)
     # check removed files
     for file_path in list(WATCHED_FILES.keys()):
         if not exists(file_path):
             logger.info("file removed %s", file_path)
             del WATCHED_FILES[file_path]
-            changed = True
+            changed_files.add(file_path)
+
+    if changed_files:
+        reload_validations_files(changed_files)
+
+
+def notify_changed_files(file_paths):
+    """
+    Register files changed and wake up scheduler to reload them
+    """
+    with CHANGED_FILES_LOCK:
+        CHANGED_FILES.update(file_paths)
+    wake_up_scheduler()
+
+
+def request_resync():
+    """
+    Request a full check of validations files, used when file events
+    were lost
+    """
+    global RESYNC_REQUESTED
+    with CHANGED_FILES_LOCK:
+        RESYNC_REQUESTED = True
+    wake_up_scheduler()
+
+
+def reload_changed_files():
+    """
+    Reload scheduler when files were notified as changed
+    """
+    global RESYNC_REQUESTED
+    with CHANGED_FILES_LOCK:
+        changed_files = set(CHANGED_FILES)
+        CHANGED_FILES.clear()
+        resync, RESYNC_REQUESTED = RESYNC_REQUESTED, False
+
+    if resync:
+        # notified files are found again by the full check
+        check_if_should_reload()
+        return
+
+    if not changed_files:
+        return
+
+    for file_path in sorted(changed_files):
+        if exists(file_path):
+            logger.info("file changed %s", file_path)
+            WATCHED_FILES[file_path] = getmtime(file_path)
+        elif file_path in WATCHED_FILES:
+            logger.info("file removed %s", file_path)
+            del WATCHED_FILES[file_path]
 
-    if changed:
-        reload_scheduler()
+    reload_validations_files(changed_files)
+
+
+def reload_validations_files(file_paths):
+    """
+    Reload only validations defined in changed files. Jobs of other
+    validations keep their next run.
+    """
+    for file_path in sorted(file_paths):
+        for validation in unload_validations_file(file_path):
+            schedule.clear(validation)
+            ADAPTIVE_JOBS.pop(validation, None)
+
+        if not exists(file_path):
+            continue
+
+        try:
+            configure_validations(load_validations_file(file_path))
+        except Exception as exception:
+            logger.error(
+                "error on reload file %s: %s",
+                file_path,
+                str(exception),
+                extra={"traceback": traceback.format_exc()},
+            )
+    __prune_scheduler_state()
+
+
+def __is_validation_file(file_path):
+    # same files loaded by load_validations at startup
+    return file_path.endswith(("_validation.py", "_validation.yaml"))
+
+
+def __start_watcher():
+    if LIFEGUARD_VALIDATIONS_WATCHER != "polling":
+        if inotify_available():
+            try:
+                InotifyWatcher(
+                    join(LIFEGUARD_DIRECTORY, "validations"),
+                    notify_changed_files,
+                    __is_validation_file,
+                    LIFEGUARD_VALIDATIONS_WATCHER_DEBOUNCE,
+                    request_resync,
+                ).start()
+                logger.info("watching validations files with inotify")
+                return
+            except OSError as exception:
+                logger.warning("error on start inotify watcher %s", str(exception))
+        else:
+            logger.info("inotify not available")
+
+    __prepend_reload_job()
 
 
 def __prepend_reload_job():
@@ -122,6 +517,7 @@ def __prepend_reload_job():
 
 def __clear_validations_jobs():
     schedule.clear("validation")
+    ADAPTIVE_JOBS.clear()
 
 
 def reload_scheduler():
@@ -129,21 +525,80 @@ def reload_scheduler():
     clear_validations()
     load_validations()
     configure_validations()
+    __prune_scheduler_state()
+
+
+def __start_sharding():
+    heartbeat()
+    schedule.every(max(LIFEGUARD_SCHEDULER_NODE_TTL // 3, 1)).seconds.do(heartbeat).tag(
+        "lifeguard"
+    )
+    atexit.register(leave)
+
+
+def __start_metrics_log():
+    if LIFEGUARD_METRICS_LOG_INTERVAL:
+        schedule.every(LIFEGUARD_METRICS_LOG_INTERVAL).seconds.do(log_counters).tag(
+            "lifeguard"
+        )
+
+
+def log_scheduler_stats():
+    """
+    Log how many validations were loaded, filtered and scheduled
+    """
+    filtered = [
+        name for name, content in VALIDATIONS.items() if content.get("filtered")
+    ]
+    logger.info(
+        "validations loaded: %s, filtered: %s, scheduled jobs: %s",
+        len(VALIDATIONS),
+        len(filtered),
+        len(schedule.get_jobs("validation")),
+    )
+
+
+def __persist_scheduler_state(jobs):
+    # only jobs that were run have a new next run
+    jobs = [job for job in jobs if "validation" in job.tags]
+    if LIFEGUARD_SCHEDULER_STATE_FILE and jobs and update_scheduler_state(jobs):
+        save_scheduler_state(LIFEGUARD_SCHEDULER_STATE_FILE)
+
+
+def __prune_scheduler_state():
+    if LIFEGUARD_SCHEDULER_STATE_FILE and prune_scheduler_state(
+        schedule.get_jobs("validation")
+    ):
+        save_scheduler_state(LIFEGUARD_SCHEDULER_STATE_FILE)
 
 
 def start_scheduler():
     __load_validations_files()
-    __prepend_reload_job()
+    __start_watcher()
+
+    if LIFEGUARD_SCHEDULER_SHARDING_ENABLED:
+        __start_sharding()
 
+    load_scheduler_state(LIFEGUARD_SCHEDULER_STATE_FILE)
     configure_validations()
+    __prune_scheduler_state()
+    log_scheduler_stats()
+    __start_metrics_log()
+    EXECUTION_POOL.start()
 
     while FOREVER:
-        time.sleep(1)
+        wait_for_next_job()
         try:
-            schedule.run_pending()
+            reload_changed_files()
+            __persist_scheduler_state(run_pending())
+            if EXECUTION_POOL.workers:
+                logger.debug(
+                    "execution pool queue depth %s", EXECUTION_POOL.queue_depth()
+                )
         except Exception as exception:
             logger.error(
                 "error on execute scheduler %s",
                 str(exception),
                 extra={"traceback": traceback.format_exc()},
             )
+            time.sleep(FAILED_TICK_SLEEP_SECONDS)
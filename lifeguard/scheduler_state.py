@@ -0,0 +1,121 @@
+"""
+Scheduler state persisted between restarts
+"""
+import json
+import os
+import traceback
+from datetime import datetime
+
+from lifeguard.logger import lifeguard_logger as logger
+
+SCHEDULER_STATE = {}
+
+
+def build_job_key(job):
+    """
+    Return key of a validation job: validation name and kind of schedule
+    """
+    names = sorted(str(tag) for tag in job.tags if tag != "validation")
+    name = names[0] if names else "validation"
+    kind = "at" if job.at_time else "every"
+    return f"{name}:{kind}"
+
+
+def build_job_signature(job):
+    """
+    Return a description of job schedule, used to ignore state saved
+    when schedule was different
+    """
+    return f"{job.interval}:{job.latest}:{job.unit}:{job.start_day}:{job.at_time}"
+
+
+def load_scheduler_state(file_path):
+    """
+    Load state saved in file
+    """
+    SCHEDULER_STATE.clear()
+    if not file_path or not os.path.exists(file_path):
+        return
+
+    try:
+        with open(file_path) as state_file:
+            SCHEDULER_STATE.update(json.load(state_file))
+        logger.info("scheduler state loaded from %s", file_path)
+    except (OSError, ValueError) as exception:
+        logger.warning(
+            "error on load scheduler state %s: %s",
+            file_path,
+            str(exception),
+            extra={"traceback": traceback.format_exc()},
+        )
+
+
+def restore_job(job, now=None):
+    """
+    Resume job from saved state. Runs missed while the scheduler was
+    stopped are moved to now and executed once.
+
+    :return: if job was restored
+    """
+    state = SCHEDULER_STATE.get(build_job_key(job))
+    if not state or state.get("signature") != build_job_signature(job):
+        return False
+
+    now = now or datetime.now()
+    if state.get("last_run"):
+        job.last_run = datetime.fromisoformat(state["last_run"])
+    job.next_run = max(datetime.fromisoformat(state["next_run"]), now)
+    return True
+
+
+def update_scheduler_state(jobs):
+    """
+    Update state with next runs of jobs
+
+    :return: if state changed
+    """
+    changed = False
+    for job in jobs:
+        if not job.next_run:
+            continue
+        state = {
+            "last_run": job.last_run.isoformat() if job.last_run else None,
+            "next_run": job.next_run.isoformat(),
+            "signature": build_job_signature(job),
+        }
+        key = build_job_key(job)
+        if SCHEDULER_STATE.get(key) != state:
+            SCHEDULER_STATE[key] = state
+            changed = True
+    return changed
+
+
+def prune_scheduler_state(jobs):
+    """
+    Remove state of jobs that are not scheduled anymore
+
+    :return: if state changed
+    """
+    keys = {build_job_key(job) for job in jobs}
+    removed = [key for key in SCHEDULER_STATE if key not in keys]
+    for key in removed:
+        del SCHEDULER_STATE[key]
+    return bool(removed)
+
+
+def save_scheduler_state(file_path):
+    """
+    Save state into file
+    """
+    temporary_path = f"{file_path}.tmp"
+    try:
+        with open(temporary_path, "w") as state_file:
+            json.dump(SCHEDULER_STATE, state_file)
+        os.replace(temporary_path, file_path)
+    except OSError as exception:
+        logger.warning(
+            "error on save scheduler state %s: %s",
+            file_path,
+            str(exception),
+            extra={"traceback": traceback.format_exc()},
+        )
@@ -8,8 +8,11 @@ from flask_cors import CORS
 from lifeguard import NORMAL, change_status
 from lifeguard.controllers import custom_controllers, login_required, request
 from lifeguard.logger import lifeguard_logger as logger
+from lifeguard.metrics import read_counters
 from lifeguard.repositories import ValidationRepository
+from lifeguard.scheduler import trigger_validation
 from lifeguard.settings import LIFEGUARD_SECRET_KEY, PERMANENT_SESSION_LIFETIME
+from lifeguard.single_flight import run_once
 from lifeguard.validations import VALIDATIONS, ValidationResponseEncoder
 
 APP = Flask(__name__)
@@ -75,6 +78,15 @@ def get_status_complete():
     return build_global_status(True)
 
 
+@APP.route("/lifeguard/metrics", methods=["GET"])
+@login_required
+def get_metrics():
+    """
+    Return counters of validations executions in this process
+    """
+    return make_json_response(json.dumps(read_counters()))
+
+
 @APP.route("/lifeguard/validations/<validation>", methods=["GET", "DELETE"])
 @login_required
 def validation_endpoint(validation):
@@ -91,7 +103,7 @@ def validation_endpoint(validation):
 @login_required
 def execute_validation(validation):
     try:
-        result = VALIDATIONS[validation]["ref"]()
+        result = run_once(validation, VALIDATIONS[validation]["ref"])
         result.last_execution = datetime.now()
         return make_json_response(ValidationResponseEncoder().encode(result))
     except Exception:
@@ -101,3 +113,20 @@ def execute_validation(validation):
             extra={"traceback": traceback.format_exc()},
         )
         return json.dumps({"error": traceback.format_exc()})
+
+
+@APP.route("/lifeguard/validations/<validation>/trigger", methods=["POST"])
+@login_required
+def trigger_validation_endpoint(validation):
+    """
+    Wake up scheduler running in this process to execute a validation now,
+    without waiting for its result
+    """
+    if trigger_validation(validation):
+        return make_json_response(json.dumps({"status": "triggered"}))
+
+    response = make_json_response(
+        json.dumps({"error": f"validation {validation} is not scheduled"})
+    )
+    response.status_code = 404
+    return response
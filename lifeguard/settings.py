@@ -111,6 +111,11 @@ SETTINGS_MANAGER = SettingsManager(
             "default": None,
             "description": "Proxy used to https calls",
         },
+        "LIFEGUARD_HTTP_TIMEOUT": {
+            "default": "0",
+            "type": "float",
+            "description": "Timeout in seconds of http calls (0 waits forever)",
+        },
         "LIFEGUARD_PUBLIC_ADDRESS": {
             "default": "http://localhost:5567",
             "description": "Address to access dashboard",
@@ -160,6 +165,150 @@ SETTINGS_MANAGER = SettingsManager(
             "type": "int",
             "description": "Set number of works in server",
         },
+        "LIFEGUARD_SCHEDULER_WORKERS": {
+            "default": "0",
+            "type": "int",
+            "description": "Number of threads used to execute validations (0 executes them in scheduler thread)",
+        },
+        "LIFEGUARD_SCHEDULER_RESERVED_WORKERS": {
+            "default": "0",
+            "type": "int",
+            "description": "Number of workers reserved to validations with critical priority",
+        },
+        "LIFEGUARD_SCHEDULER_CRITICAL_PRIORITY": {
+            "default": "10",
+            "type": "int",
+            "description": "Minimum priority of validations executed by reserved workers",
+        },
+        "LIFEGUARD_SCHEDULER_DEFAULT_OVERRUN": {
+            "default": "coalesce",
+            "description": "What to do when a validation is due while still running: skip, coalesce or queue",
+        },
+        "LIFEGUARD_SCHEDULER_SPREAD_JOBS": {
+            "default": "true",
+            "type": "bool",
+            "description": "Spread first run of validations with same interval along the interval",
+        },
+        "LIFEGUARD_SCHEDULER_STATE_FILE": {
+            "default": "",
+            "description": "File used to keep next runs of validations between restarts",
+        },
+        "LIFEGUARD_SCHEDULER_SHARDING_ENABLED": {
+            "default": "false",
+            "type": "bool",
+            "description": "Distribute validations between scheduler nodes registered in coordination repository",
+        },
+        "LIFEGUARD_SCHEDULER_NODE_ID": {
+            "default": "",
+            "description": "Identifier of scheduler node (hostname and pid when empty)",
+        },
+        "LIFEGUARD_SCHEDULER_NODE_TTL": {
+            "default": "30",
+            "type": "int",
+            "description": "Seconds without heartbeat before a scheduler node is considered gone",
+        },
+        "LIFEGUARD_COORDINATION_DATABASE": {
+            "default": "lifeguard_coordination.db",
+            "description": "SQLite file used by SQLiteCoordinationRepository",
+        },
+        "LIFEGUARD_VALIDATIONS_LOADING_WORKERS": {
+            "default": "0",
+            "type": "int",
+            "description": (
+                "Number of processes used to parse yaml validations files at startup "
+                "(0 parses them in main process)"
+            ),
+        },
+        "LIFEGUARD_VALIDATIONS_CACHE_DIRECTORY": {
+            "default": "",
+            "description": (
+                "Directory where parsed yaml validations files are cached between "
+                "restarts (disabled when empty)"
+            ),
+        },
+        "LIFEGUARD_STARTUP_PROFILE": {
+            "default": "false",
+            "type": "bool",
+            "description": "Log time and memory spent in each startup phase",
+        },
+        "LIFEGUARD_VALIDATIONS_MANIFEST": {
+            "default": "",
+            "description": (
+                "Manifest of python validations, built with lifeguard "
+                "--build-manifest, used to import validations modules only on first "
+                "execution"
+            ),
+        },
+        "LIFEGUARD_VALIDATIONS_WATCHER": {
+            "default": "auto",
+            "description": "How validations files are watched: auto, inotify or polling",
+        },
+        "LIFEGUARD_VALIDATIONS_WATCHER_DEBOUNCE": {
+            "default": "0.5",
+            "type": "float",
+            "description": "Seconds without changes before reload validations files",
+        },
+        "LIFEGUARD_TRACEBACK_LIMIT": {
+            "default": "20",
+            "type": "int",
+            "description": (
+                "Max number of frames, the last ones, kept in traceback of validation "
+                "errors (0 keeps all)"
+            ),
+        },
+        "LIFEGUARD_TRACEBACK_MAX_SIZE": {
+            "default": "8192",
+            "type": "int",
+            "description": (
+                "Max number of characters, the last ones, kept in traceback of "
+                "validation errors (0 keeps all)"
+            ),
+        },
+        "LIFEGUARD_SINGLE_FLIGHT_DIRECTORY": {
+            "default": "",
+            "description": (
+                "Directory of lock files used to share running executions between "
+                "processes (a temporary directory when empty)"
+            ),
+        },
+        "LIFEGUARD_CONCURRENCY_LIMITS": {
+            "default": "",
+            "type": "list",
+            "description": (
+                "A comma separated list of name=limit with max validations running "
+                "at same time for a group or target"
+            ),
+        },
+        "LIFEGUARD_METRICS_LOG_INTERVAL": {
+            "default": "300",
+            "type": "int",
+            "description": (
+                "Interval in seconds to log executions, failures, timeouts, skipped, "
+                "coalesced and dropped counters of validations (0 disables)"
+            ),
+        },
+        "LIFEGUARD_ACTIONS_WORKERS": {
+            "default": "0",
+            "type": "int",
+            "description": (
+                "Number of threads that execute validations actions (0 executes "
+                "actions in validation execution)"
+            ),
+        },
+        "LIFEGUARD_ACTIONS_QUEUE_SIZE": {
+            "default": "1000",
+            "type": "int",
+            "description": "Max number of validations results waiting for their actions",
+        },
+        "LIFEGUARD_ACTIONS_QUEUE_POLICY": {
+            "default": "block",
+            "description": "What to do when actions queue is full: block the validation or drop the actions",
+        },
+        "LIFEGUARD_ASYNC_VALIDATIONS_CONCURRENCY": {
+            "default": "100",
+            "type": "int",
+            "description": "Max number of asynchronous validations running at same time (0 is unlimited)",
+        },
         "PERMANENT_SESSION_LIFETIME": {
             "default": "2678400",
             "type": "int",
@@ -192,6 +341,7 @@ LOG_BACKUP_COUNT = SETTINGS_MANAGER.read_value("LIFEGUARD_LOG_BACKUP_COUNT")
 LOG_MAX_BYTES = SETTINGS_MANAGER.read_value("LIFEGUARD_LOG_MAX_BYTES")
 HTTP_PROXY = SETTINGS_MANAGER.read_value("LIFEGUARD_HTTP_PROXY")
 HTTPS_PROXY = SETTINGS_MANAGER.read_value("LIFEGUARD_HTTPS_PROXY")
+HTTP_TIMEOUT = SETTINGS_MANAGER.read_value("LIFEGUARD_HTTP_TIMEOUT")
 
 LIFEGUARD_RUN_ONLY_VALIDATIONS = SETTINGS_MANAGER.read_value(
     "LIFEGUARD_RUN_ONLY_VALIDATIONS"
@@ -201,3 +351,68 @@ LIFEGUARD_APPEND_NOTIFICATION_TO_HISTORY = SETTINGS_MANAGER.read_value(
     "LIFEGUARD_APPEND_NOTIFICATION_TO_HISTORY"
 )
 PERMANENT_SESSION_LIFETIME = SETTINGS_MANAGER.read_value("PERMANENT_SESSION_LIFETIME")
+LIFEGUARD_SCHEDULER_WORKERS = SETTINGS_MANAGER.read_value("LIFEGUARD_SCHEDULER_WORKERS")
+LIFEGUARD_METRICS_LOG_INTERVAL = SETTINGS_MANAGER.read_value(
+    "LIFEGUARD_METRICS_LOG_INTERVAL"
+)
+LIFEGUARD_ACTIONS_WORKERS = SETTINGS_MANAGER.read_value("LIFEGUARD_ACTIONS_WORKERS")
+LIFEGUARD_ACTIONS_QUEUE_SIZE = SETTINGS_MANAGER.read_value(
+    "LIFEGUARD_ACTIONS_QUEUE_SIZE"
+)
+LIFEGUARD_ACTIONS_QUEUE_POLICY = SETTINGS_MANAGER.read_value(
+    "LIFEGUARD_ACTIONS_QUEUE_POLICY"
+)
+LIFEGUARD_ASYNC_VALIDATIONS_CONCURRENCY = SETTINGS_MANAGER.read_value(
+    "LIFEGUARD_ASYNC_VALIDATIONS_CONCURRENCY"
+)
+LIFEGUARD_SCHEDULER_SPREAD_JOBS = SETTINGS_MANAGER.read_value(
+    "LIFEGUARD_SCHEDULER_SPREAD_JOBS"
+)
+LIFEGUARD_VALIDATIONS_WATCHER = SETTINGS_MANAGER.read_value(
+    "LIFEGUARD_VALIDATIONS_WATCHER"
+)
+LIFEGUARD_VALIDATIONS_WATCHER_DEBOUNCE = SETTINGS_MANAGER.read_value(
+    "LIFEGUARD_VALIDATIONS_WATCHER_DEBOUNCE"
+)
+LIFEGUARD_SCHEDULER_RESERVED_WORKERS = SETTINGS_MANAGER.read_value(
+    "LIFEGUARD_SCHEDULER_RESERVED_WORKERS"
+)
+LIFEGUARD_SCHEDULER_CRITICAL_PRIORITY = SETTINGS_MANAGER.read_value(
+    "LIFEGUARD_SCHEDULER_CRITICAL_PRIORITY"
+)
+LIFEGUARD_SCHEDULER_DEFAULT_OVERRUN = SETTINGS_MANAGER.read_value(
+    "LIFEGUARD_SCHEDULER_DEFAULT_OVERRUN"
+)
+LIFEGUARD_SCHEDULER_STATE_FILE = SETTINGS_MANAGER.read_value(
+    "LIFEGUARD_SCHEDULER_STATE_FILE"
+)
+LIFEGUARD_SCHEDULER_SHARDING_ENABLED = SETTINGS_MANAGER.read_value(
+    "LIFEGUARD_SCHEDULER_SHARDING_ENABLED"
+)
+LIFEGUARD_SCHEDULER_NODE_ID = SETTINGS_MANAGER.read_value("LIFEGUARD_SCHEDULER_NODE_ID")
+LIFEGUARD_SCHEDULER_NODE_TTL = SETTINGS_MANAGER.read_value(
+    "LIFEGUARD_SCHEDULER_NODE_TTL"
+)
+LIFEGUARD_COORDINATION_DATABASE = SETTINGS_MANAGER.read_value(
+    "LIFEGUARD_COORDINATION_DATABASE"
+)
+LIFEGUARD_VALIDATIONS_LOADING_WORKERS = SETTINGS_MANAGER.read_value(
+    "LIFEGUARD_VALIDATIONS_LOADING_WORKERS"
+)
+LIFEGUARD_VALIDATIONS_CACHE_DIRECTORY = SETTINGS_MANAGER.read_value(
+    "LIFEGUARD_VALIDATIONS_CACHE_DIRECTORY"
+)
+LIFEGUARD_STARTUP_PROFILE = SETTINGS_MANAGER.read_value("LIFEGUARD_STARTUP_PROFILE")
+LIFEGUARD_VALIDATIONS_MANIFEST = SETTINGS_MANAGER.read_value(
+    "LIFEGUARD_VALIDATIONS_MANIFEST"
+)
+LIFEGUARD_TRACEBACK_LIMIT = SETTINGS_MANAGER.read_value("LIFEGUARD_TRACEBACK_LIMIT")
+LIFEGUARD_TRACEBACK_MAX_SIZE = SETTINGS_MANAGER.read_value(
+    "LIFEGUARD_TRACEBACK_MAX_SIZE"
+)
+LIFEGUARD_SINGLE_FLIGHT_DIRECTORY = SETTINGS_MANAGER.read_value(
+    "LIFEGUARD_SINGLE_FLIGHT_DIRECTORY"
+)
+LIFEGUARD_CONCURRENCY_LIMITS = SETTINGS_MANAGER.read_value(
+    "LIFEGUARD_CONCURRENCY_LIMITS"
+)
@@ -0,0 +1,131 @@
+"""
+Distribution of validations between scheduler nodes
+"""
+import bisect
+import hashlib
+import os
+import socket
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+from lifeguard.logger import lifeguard_logger as logger
+from lifeguard.repositories import CoordinationRepository
+from lifeguard.settings import (
+    LIFEGUARD_COORDINATION_DATABASE,
+    LIFEGUARD_SCHEDULER_NODE_ID,
+    LIFEGUARD_SCHEDULER_NODE_TTL,
+    LIFEGUARD_SCHEDULER_SHARDING_ENABLED,
+)
+
+NODE_ID = LIFEGUARD_SCHEDULER_NODE_ID or f"{socket.gethostname()}-{os.getpid()}"
+SHARDING = {"nodes": [], "ring": None}
+
+
+class HashRing:
+    """
+    Consistent hashing ring.
+
+    Each node is placed many times in the ring, so when a node joins or
+    leaves only the keys next to its points move to another node.
+    """
+
+    def __init__(self, nodes, replicas=100):
+        self._points = sorted(
+            (self.__hash(f"{node}:{replica}"), node)
+            for node in nodes
+            for replica in range(replicas)
+        )
+        self._hashes = [point for point, _node in self._points]
+
+    def get_node(self, key):
+        """
+        Return node responsible for a key
+        """
+        if not self._points:
+            return None
+        index = bisect.bisect(self._hashes, self.__hash(key)) % len(self._points)
+        return self._points[index][1]
+
+    @staticmethod
+    def __hash(key):
+        return int(hashlib.md5(key.encode()).hexdigest()[:16], 16)
+
+
+def heartbeat(now=None):
+    """
+    Register this node as alive and rebuild ring when active nodes changed
+    """
+    now = now or datetime.now()
+    repository = CoordinationRepository()
+    repository.register_node(NODE_ID, now)
+
+    nodes = set(
+        repository.fetch_active_nodes(
+            now - timedelta(seconds=LIFEGUARD_SCHEDULER_NODE_TTL)
+        )
+    )
+    nodes.add(NODE_ID)
+    nodes = sorted(nodes)
+
+    if nodes != SHARDING["nodes"]:
+        logger.info("scheduler nodes changed to %s", nodes)
+        SHARDING["nodes"] = nodes
+        SHARDING["ring"] = HashRing(nodes)
+
+
+def leave():
+    """
+    Remove this node from active nodes
+    """
+    CoordinationRepository().unregister_node(NODE_ID)
+
+
+def owns_validation(validation_name):
+    """
+    Return if validation should be executed by this node
+    """
+    if not LIFEGUARD_SCHEDULER_SHARDING_ENABLED:
+        return True
+    if not SHARDING["ring"]:
+        heartbeat()
+    return SHARDING["ring"].get_node(validation_name) == NODE_ID
+
+
+class SQLiteCoordinationRepository:
+    """
+    Coordination repository backed by a SQLite file, enough for nodes
+    running in same host and for tests
+    """
+
+    def __init__(self, database=None):
+        self._database = database or LIFEGUARD_COORDINATION_DATABASE
+        self._lock = threading.Lock()
+        self.__execute(
+            "CREATE TABLE IF NOT EXISTS nodes "
+            "(node_id TEXT PRIMARY KEY, heartbeat REAL NOT NULL)"
+        )
+
+    def __execute(self, query, parameters=()):
+        with self._lock:
+            connection = sqlite3.connect(self._database, timeout=10)
+            try:
+                with connection:
+                    return connection.execute(query, parameters).fetchall()
+            finally:
+                connection.close()
+
+    def register_node(self, node_id, heartbeat):
+        self.__execute(
+            "INSERT OR REPLACE INTO nodes (node_id, heartbeat) VALUES (?, ?)",
+            (node_id, heartbeat.timestamp()),
+        )
+
+    def fetch_active_nodes(self, since):
+        rows = self.__execute(
+            "SELECT node_id FROM nodes WHERE heartbeat >= ?", (since.timestamp(),)
+        )
+        return [row[0] for row in rows]
+
+    def unregister_node(self, node_id):
+        self.__execute("DELETE FROM nodes WHERE node_id = ?", (node_id,))
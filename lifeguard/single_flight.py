@@ -0,0 +1,227 @@
+"""
+Single-flight executions: callers arriving while a validation is running
+wait for that run instead of starting a new one
+"""
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+from lifeguard.logger import lifeguard_logger as logger
+from lifeguard.repositories import ValidationRepository
+from lifeguard.settings import LIFEGUARD_DIRECTORY, LIFEGUARD_SINGLE_FLIGHT_DIRECTORY
+from lifeguard.validations import ValidationResponse
+
+IN_FLIGHT = {}
+IN_FLIGHT_LOCK = threading.Lock()
+
+LOCKS_DIRECTORY = LIFEGUARD_SINGLE_FLIGHT_DIRECTORY or os.path.join(
+    tempfile.gettempdir(),
+    "lifeguard-"
+    + hashlib.md5(os.path.abspath(LIFEGUARD_DIRECTORY).encode()).hexdigest()[:12],
+)
+
+
+def run_once(validation_name, function):
+    """
+    Execute function in name of a validation or, when it is already
+    running in this process, wait for the running execution result.
+    Between processes a file lock is used and the waiting process returns
+    the result saved in validation repository by the running execution, or
+    executes the validation when no newer result was saved.
+    """
+    future, leader = __join_flight(validation_name)
+    if not leader:
+        logger.info("waiting running execution of %s", validation_name)
+        return future.result()
+
+    try:
+        started = datetime.now()
+        with __process_lock(validation_name) as waited:
+            result = __fetch_last_result(validation_name, started) if waited else None
+            if result is None:
+                result = function()
+                __publish_result(validation_name, result)
+        future.set_result(result)
+        return result
+    except BaseException as exception:
+        future.set_exception(exception)
+        raise
+    finally:
+        __land(validation_name)
+
+
+async def run_once_async(validation_name, coroutine_function):
+    """
+    Same as run_once for coroutine functions, sharing executions with
+    run_once calls of the same validation
+    """
+    future, leader = __join_flight(validation_name)
+    if not leader:
+        logger.info("waiting running execution of %s", validation_name)
+        return await asyncio.wrap_future(future)
+
+    loop = asyncio.get_running_loop()
+    try:
+        started = datetime.now()
+        lock_file, waited = await loop.run_in_executor(
+            None, __acquire_process_lock, validation_name
+        )
+        try:
+            result = None
+            if waited:
+                result = await loop.run_in_executor(
+                    None, __fetch_last_result, validation_name, started
+                )
+            if result is None:
+                result = await coroutine_function()
+                await loop.run_in_executor(
+                    None, __publish_result, validation_name, result
+                )
+        finally:
+            __release_process_lock(lock_file)
+        future.set_result(result)
+        return result
+    except BaseException as exception:
+        future.set_exception(exception)
+        raise
+    finally:
+        __land(validation_name)
+
+
+def __join_flight(validation_name):
+    """
+    Return future of running execution and if caller should execute it
+    """
+    with IN_FLIGHT_LOCK:
+        future = IN_FLIGHT.get(validation_name)
+        if future is not None:
+            return future, False
+        future = IN_FLIGHT[validation_name] = Future()
+        return future, True
+
+
+def __land(validation_name):
+    with IN_FLIGHT_LOCK:
+        IN_FLIGHT.pop(validation_name, None)
+
+
+def __get_lock_path(validation_name, extension="lock"):
+    # validation names may have characters not allowed in file names
+    digest = hashlib.md5(validation_name.encode()).hexdigest()
+    return os.path.join(LOCKS_DIRECTORY, f"{digest}.{extension}")
+
+
+@contextmanager
+def __process_lock(validation_name):
+    """
+    Hold a file lock of validation, yielding if another process was
+    holding it when lock was requested
+    """
+    lock_file, waited = __acquire_process_lock(validation_name)
+    try:
+        yield waited
+    finally:
+        __release_process_lock(lock_file)
+
+
+def __acquire_process_lock(validation_name):
+    if fcntl is None:
+        return None, False
+
+    os.makedirs(LOCKS_DIRECTORY, exist_ok=True)
+    lock_file = open(__get_lock_path(validation_name), "a")
+    try:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return lock_file, False
+        except BlockingIOError:
+            logger.info("waiting execution of %s in another process", validation_name)
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        return lock_file, True
+    except BaseException:
+        lock_file.close()
+        raise
+
+
+def __release_process_lock(lock_file):
+    if lock_file is None:
+        return
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_UN)
+    finally:
+        lock_file.close()
+
+
+def __publish_result(validation_name, result):
+    """
+    Save result next to the lock file before releasing it, so processes
+    waiting the lock do not depend on actions that save results, which
+    may still be queued in actions dispatcher
+    """
+    if fcntl is None or not isinstance(result, ValidationResponse):
+        return
+
+    result_path = __get_lock_path(validation_name, "json")
+    content = {
+        "published": time.time(),
+        "status": result.status,
+        "details": result.details,
+        "settings": result.settings,
+    }
+    try:
+        with open(f"{result_path}.tmp", "w") as result_file:
+            json.dump(content, result_file, default=str)
+        os.replace(f"{result_path}.tmp", result_path)
+    except (OSError, ValueError) as exception:
+        logger.warning(
+            "error on publish result of %s: %s", validation_name, str(exception)
+        )
+        if os.path.exists(f"{result_path}.tmp"):
+            os.remove(f"{result_path}.tmp")
+
+
+def __read_published_result(validation_name, since):
+    try:
+        with open(__get_lock_path(validation_name, "json")) as result_file:
+            content = json.load(result_file)
+    except (OSError, ValueError):
+        return None
+
+    if content["published"] < since.timestamp():
+        return None
+    return ValidationResponse(
+        content["status"],
+        content["details"],
+        content["settings"],
+        last_execution=datetime.fromtimestamp(content["published"]),
+        validation_name=validation_name,
+    )
+
+
+def __fetch_last_result(validation_name, since):
+    published = __read_published_result(validation_name, since)
+    if published is not None:
+        return published
+
+    try:
+        result = ValidationRepository().fetch_last_validation_result(validation_name)
+    except KeyError:
+        return None
+
+    # without a comparable last execution the result may be stale
+    last_execution = getattr(result, "last_execution", None)
+    if not isinstance(last_execution, datetime) or last_execution < since:
+        return None
+    return result
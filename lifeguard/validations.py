@@ -1,21 +1,68 @@
+import asyncio
+import copy
+import hashlib
+import importlib
+import inspect
+import itertools
+import json
 import os
+import re
 import yaml
 import sys
+import threading
 import traceback
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 from os.path import join
 from json import JSONEncoder
-from functools import wraps
+from functools import partial, wraps
 
+from lifeguard.dispatcher import ACTION_DISPATCHER
+from lifeguard.event_loop import EVENT_LOOP
+from lifeguard.limits import acquire_limits, async_concurrency_limits, release_limits
 from lifeguard.logger import lifeguard_logger as logger
+from lifeguard.metrics import EXECUTIONS, FAILURES, TIMEOUTS, increment
+from lifeguard.profiler import profile_phase
+from lifeguard.repositories import ValidationRepository
 from lifeguard.settings import (
     LIFEGUARD_DIRECTORY,
     LIFEGUARD_RUN_ONLY_VALIDATIONS,
     LIFEGUARD_SKIP_VALIDATIONS,
+    LIFEGUARD_TRACEBACK_LIMIT,
+    LIFEGUARD_TRACEBACK_MAX_SIZE,
+    LIFEGUARD_VALIDATIONS_CACHE_DIRECTORY,
+    LIFEGUARD_VALIDATIONS_LOADING_WORKERS,
+    LIFEGUARD_VALIDATIONS_MANIFEST,
 )
-from lifeguard.statuses import PROBLEM, ACTION_STATUSES
+from lifeguard.statuses import NORMAL, PROBLEM, ACTION_STATUSES, change_status
 from lifeguard.utils import build_import
 
 VALIDATIONS = {}
+FILE_VALIDATIONS = {}
+FINGERPRINTS = {}
+FILTERS = {"run_only": set(), "skip": set()}
+MANIFEST_FIELDS = [
+    "description",
+    "group",
+    "target",
+    "schedule",
+    "priority",
+    "timeout",
+    "only_on_change",
+]
+TRACEBACKS = {}
+ABANDONED_CALLS = {}
+MAX_TRACEBACKS = 256
+YAML_CACHE = {}
+YAML_LOADER = getattr(yaml, "CFullLoader", yaml.FullLoader)
+
+
+class ValidationTimeout(Exception):
+    """Raised when a validation exceeds its timeout"""
+
+
+class CommandNotFound(Exception):
+    """Raised when command of a yaml validation could not be resolved"""
 
 
 def __execute_actions(actions, result, settings):
@@ -28,6 +75,60 @@ def __execute_actions(actions, result, settings):
         action(result, settings)
 
 
+def __build_fingerprint(response):
+    content = json.dumps(
+        {"status": response.status, "details": response.details},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha1(content.encode()).hexdigest()
+
+
+def __fetch_last_fingerprint(validation_name):
+    if validation_name not in FINGERPRINTS:
+        try:
+            last_result = ValidationRepository().fetch_last_validation_result(
+                validation_name
+            )
+        except KeyError:
+            last_result = None
+        FINGERPRINTS[validation_name] = (
+            __build_fingerprint(last_result) if last_result else None
+        )
+    return FINGERPRINTS[validation_name]
+
+
+def __execute_actions_on_change(validation_name, actions, result, settings):
+    """
+    Execute actions only when status or details changed since last run,
+    otherwise just update the heartbeat of the last result
+    """
+    fingerprint = __build_fingerprint(result)
+    if fingerprint == __fetch_last_fingerprint(validation_name):
+        logger.debug("result of %s unchanged, skipping actions", validation_name)
+        try:
+            ValidationRepository().update_validation_heartbeat(
+                validation_name, datetime.now()
+            )
+        except KeyError:
+            pass
+        return
+
+    __execute_actions(actions, result, settings)
+    FINGERPRINTS[validation_name] = fingerprint
+
+
+def __execute_error_actions(validation_name, actions, result, settings):
+    """
+    Execute actions on error and forget the last fingerprint, so the next
+    result is compared with what is stored after the error
+    """
+    try:
+        __execute_actions(actions, result, settings)
+    finally:
+        FINGERPRINTS.pop(validation_name, None)
+
+
 def __load_function_from_module(module_name_with_function_name):
     module_path, function_name = module_name_with_function_name.rsplit(".", 1)
 
@@ -40,37 +141,462 @@ def __load_function_from_module(module_name_with_function_name):
     return getattr(function, function_name)
 
 
-def __build_validation_function(command_function, args):
+def __check_abandoned_call(validation_name, timeout):
+    """
+    Raise a timeout while an execution abandoned by a previous timeout is
+    still running, so a validation never overlaps with itself
+    """
+    thread = ABANDONED_CALLS.get(validation_name)
+    if thread is None:
+        return
+    if thread.is_alive():
+        raise ValidationTimeout(
+            f"previous execution still running after timeout of {timeout} seconds"
+        )
+    ABANDONED_CALLS.pop(validation_name, None)
+
+
+def __call_with_timeout(validation_name, function, timeout, args, kwargs, on_finish):
+    """
+    Call function in a thread waiting at most timeout seconds, on_finish
+    is called by the thread when function really finishes
+    """
+    outcome = {}
+
+    def target():
+        try:
+            outcome["result"] = function(*args, **kwargs)
+        except Exception as exception:
+            outcome["exception"] = exception
+        finally:
+            on_finish()
+
+    thread = threading.Thread(
+        target=target, name=f"lifeguard-{function.__name__}", daemon=True
+    )
+    try:
+        thread.start()
+    except Exception:
+        on_finish()
+        raise
+    thread.join(timeout)
+
+    if thread.is_alive():
+        ABANDONED_CALLS[validation_name] = thread
+        raise ValidationTimeout(f"validation timed out after {timeout} seconds")
+    if "exception" in outcome:
+        raise outcome["exception"]
+    return outcome["result"]
+
+
+def __build_validation_function(command, args):
     def validation_function():
-        command = __load_function_from_module(command_function)
         return command(args)
 
     return validation_function
 
 
-def __build_validation_from_settings(validation_yaml_file):
-    with open(validation_yaml_file) as file:
-        validation_list_from_file = yaml.load(file, Loader=yaml.FullLoader)
+def __build_unresolved_command(command_function, exception):
+    def unresolved_command(_args):
+        raise CommandNotFound(f"command {command_function} not found: {exception}")
+
+    return unresolved_command
+
+
+def __build_reloadable_command(command_function, function):
+    """
+    Return command that looks function up in its module on each call, so
+    a module reloaded by hot reload runs its new code
+    """
+    module_path, function_name = command_function.rsplit(".", 1)
+
+    def reloadable_command(*args):
+        module = sys.modules.get(module_path)
+        return getattr(module, function_name, function)(*args)
+
+    return reloadable_command
+
+
+def __resolve_command(command_function, validation_yaml_file, line):
+    try:
+        return __build_reloadable_command(
+            command_function, __load_function_from_module(command_function)
+        )
+    except (ImportError, AttributeError, ValueError) as exception:
+        logger.error(
+            "error on resolve command %s in %s:%s: %s",
+            command_function,
+            validation_yaml_file,
+            line,
+            str(exception),
+        )
+        return __build_unresolved_command(command_function, exception)
+
+
+def __load_yaml_document(content):
+    loader = YAML_LOADER(content)
+    try:
+        node = loader.get_single_node()
+        document = loader.construct_document(node) if node else None
+    finally:
+        loader.dispose()
+    return document, node
+
+
+def __get_command_lines(node):
+    """
+    Return line of command of each validation in yaml node
+    """
+    lines = []
+    for key, value in node.value if isinstance(node, yaml.MappingNode) else []:
+        if key.value != "validations" or not isinstance(value, yaml.SequenceNode):
+            continue
+        for validation_node in value.value:
+            line = validation_node.start_mark.line + 1
+            for validation_key, validation_value in validation_node.value:
+                if validation_key.value == "execute":
+                    for execute_key, execute_value in validation_value.value:
+                        if execute_key.value == "command":
+                            line = execute_value.start_mark.line + 1
+            lines.append(line)
+    return lines
+
+
+def __parse_validations_content(content):
+    document, node = __load_yaml_document(content)
+    return document, __get_command_lines(node)
+
+
+def __get_disk_cache_path(validation_yaml_file):
+    key = hashlib.sha256(os.path.abspath(validation_yaml_file).encode()).hexdigest()
+    return join(LIFEGUARD_VALIDATIONS_CACHE_DIRECTORY, f"{key}.json")
+
+
+def __load_disk_cache(validation_yaml_file):
+    if not LIFEGUARD_VALIDATIONS_CACHE_DIRECTORY:
+        return None
+    try:
+        with open(__get_disk_cache_path(validation_yaml_file)) as cache_file:
+            return json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+
 
-    for validation_settings in validation_list_from_file["validations"]:
+def __store_cache(validation_yaml_file, entry):
+    YAML_CACHE[validation_yaml_file] = entry
+    if not LIFEGUARD_VALIDATIONS_CACHE_DIRECTORY:
+        return
+
+    try:
+        content = json.dumps(entry)
+        lossless = json.loads(content) == entry
+    except (TypeError, ValueError):
+        lossless = False
+    if not lossless:
+        # like dates or not string keys, changed by a json round trip
+        logger.debug(
+            "yaml file %s has values not supported by cache", validation_yaml_file
+        )
+        return
+
+    cache_path = __get_disk_cache_path(validation_yaml_file)
+    try:
+        os.makedirs(LIFEGUARD_VALIDATIONS_CACHE_DIRECTORY, exist_ok=True)
+        with open(f"{cache_path}.tmp", "w") as cache_file:
+            cache_file.write(content)
+        os.replace(f"{cache_path}.tmp", cache_path)
+    except OSError as exception:
+        logger.warning(
+            "error on save parsed yaml file %s in cache: %s",
+            validation_yaml_file,
+            str(exception),
+        )
+        if os.path.exists(f"{cache_path}.tmp"):
+            os.remove(f"{cache_path}.tmp")
+
+
+def __lookup_cache(validation_yaml_file):
+    """
+    Return cached parse of yaml file when its mtime or content hash is
+    unchanged, otherwise None and what is needed to parse and cache it
+    """
+    mtime = os.path.getmtime(validation_yaml_file)
+    cached = YAML_CACHE.get(validation_yaml_file) or __load_disk_cache(
+        validation_yaml_file
+    )
+    if cached and cached["mtime"] == mtime:
+        YAML_CACHE[validation_yaml_file] = cached
+        return cached, None
+
+    with open(validation_yaml_file, "rb") as file:
+        content = file.read()
+    digest = hashlib.sha256(content).hexdigest()
+    if cached and cached["hash"] == digest:
+        __store_cache(validation_yaml_file, dict(cached, mtime=mtime))
+        return YAML_CACHE[validation_yaml_file], None
+
+    return None, {"mtime": mtime, "hash": digest, "content": content}
+
+
+def __cache_parsed_file(validation_yaml_file, pending, parsed_file):
+    document, command_lines = parsed_file
+    entry = {
+        "mtime": pending["mtime"],
+        "hash": pending["hash"],
+        "document": document,
+        "command_lines": command_lines,
+    }
+    __store_cache(validation_yaml_file, entry)
+    return entry
+
+
+def __copy_parsed_file(entry):
+    return copy.deepcopy(entry["document"]), entry["command_lines"]
+
+
+def __parse_validations_file(validation_yaml_file):
+    cached, pending = __lookup_cache(validation_yaml_file)
+    if cached is None:
+        cached = __cache_parsed_file(
+            validation_yaml_file,
+            pending,
+            __parse_validations_content(pending["content"]),
+        )
+    return __copy_parsed_file(cached)
+
+
+def __parse_validations_files(validation_yaml_files):
+    """
+    Parse yaml files not found in cache in parallel processes
+
+    :return: parsed files by path, empty when files should be parsed
+        one by one
+    """
+    workers = min(LIFEGUARD_VALIDATIONS_LOADING_WORKERS, len(validation_yaml_files))
+    if workers < 2:
+        return {}
+
+    parsed_files = {}
+    pending_files = {}
+    for validation_yaml_file in validation_yaml_files:
+        cached, pending = __lookup_cache(validation_yaml_file)
+        if cached is None:
+            pending_files[validation_yaml_file] = pending
+        else:
+            parsed_files[validation_yaml_file] = __copy_parsed_file(cached)
+
+    if len(pending_files) < 2:
+        return parsed_files
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(pending_files))
+        ) as executor:
+            results = executor.map(
+                __parse_validations_content,
+                [pending["content"] for pending in pending_files.values()],
+            )
+            for (validation_yaml_file, pending), parsed_file in zip(
+                pending_files.items(), results
+            ):
+                parsed_files[validation_yaml_file] = __copy_parsed_file(
+                    __cache_parsed_file(validation_yaml_file, pending, parsed_file)
+                )
+    except Exception as exception:
+        logger.warning("error on parse yaml files in parallel: %s", str(exception))
+    return parsed_files
+
+
+def __build_validation_from_settings(
+    validation_yaml_file, parsed_file=None, validation_names=None
+):
+    validation_list_from_file, command_lines = parsed_file or __parse_validations_file(
+        validation_yaml_file
+    )
+
+    # names are appended as validations are registered, so caller knows
+    # which ones were registered when an error happens
+    if validation_names is None:
+        validation_names = []
+    for index, validation_settings in enumerate(
+        validation_list_from_file["validations"]
+    ):
         logger.info(
             "loading validation %s from yaml file",
             validation_settings["validation_name"],
         )
-        validation_settings["actions"] = [
-            __load_function_from_module(action)
-            for action in validation_settings["actions"]
-        ]
+        for actions_key in ["actions", "actions_on_error"]:
+            if validation_settings.get(actions_key):
+                validation_settings[actions_key] = [
+                    __load_function_from_module(action)
+                    for action in validation_settings[actions_key]
+                ]
 
         command_settings = validation_settings.pop("execute")
 
+        command = __resolve_command(
+            command_settings["command"], validation_yaml_file, command_lines[index]
+        )
+
+        if "timeout" in command_settings:
+            validation_settings["timeout"] = command_settings["timeout"]
+
+        if "targets" in validation_settings:
+            validation_names.extend(
+                __build_batch_validations(
+                    validation_settings, command, *command_settings["args"]
+                )
+            )
+            continue
+
         validation_function = __build_validation_function(
-            command_settings["command"], *command_settings["args"]
+            command, *command_settings["args"]
         )
 
         validation_function.__name__ = validation_settings.pop("validation_name")
 
         validation(**validation_settings)(validation_function)
+        validation_names.append(validation_function.__name__)
+
+    return validation_names
+
+
+def __build_target_name(key, names):
+    """
+    Return target key with only letters, digits, "_" and "-", usable in
+    validation name, urls and file names, unique among names
+    """
+    name = re.sub(r"[^A-Za-z0-9_-]+", "-", key).strip("-") or "target"
+    unique_name = name
+    for index in itertools.count(2):
+        if unique_name not in names:
+            return unique_name
+        unique_name = f"{name}-{index}"
+
+
+def __expand_targets(targets):
+    """
+    Return key, name and value of each target, key is used to match
+    results returned by target and name to derive validation name
+    """
+    if isinstance(targets, dict):
+        keys = list(targets)
+        expanded = [
+            ("-".join(str(value) for value in values), dict(zip(keys, values)))
+            for values in itertools.product(*(targets[key] for key in keys))
+        ]
+    else:
+        expanded = [(str(target), target) for target in targets]
+
+    names = set()
+    result = []
+    for key, target in expanded:
+        name = __build_target_name(key, names)
+        names.add(name)
+        result.append((key, name, target))
+    return result
+
+
+def __get_target_responses(responses, targets):
+    if isinstance(responses, dict):
+        # keys are compared as text, like targets keys
+        responses = {str(key): response for key, response in responses.items()}
+    else:
+        responses = dict(zip([key for key, _name, _target in targets], responses))
+    return {
+        name: responses.get(key)
+        or ValidationResponse(PROBLEM, {"error": f"no result for {key}"})
+        for key, name, _target in targets
+    }
+
+
+def __build_target_function(command, target, args):
+    def target_function():
+        return __get_target_responses(command([target[2]], args), [target])[target[1]]
+
+    return target_function
+
+
+def __build_batch_function(
+    command, targets, args, actions, actions_on_error, settings, only_on_change
+):
+    def batch_function():
+        try:
+            responses = __get_target_responses(
+                command([target for _key, _name, target in targets], args), targets
+            )
+        except Exception as exception:
+            # error is logged and counted once by the batch validation
+            formatted_traceback = __format_traceback(exception)
+            for _key, target_name, _target in targets:
+                validation_name = f"{batch_function.__name__}.{target_name}"
+                increment(validation_name, EXECUTIONS)
+                ACTION_DISPATCHER.dispatch(
+                    validation_name,
+                    __execute_error_actions,
+                    validation_name,
+                    actions_on_error,
+                    __build_error_details_response(
+                        validation_name, exception, formatted_traceback
+                    ),
+                    settings,
+                )
+            raise
+
+        status = NORMAL
+        for target_name, response in responses.items():
+            response.validation_name = f"{batch_function.__name__}.{target_name}"
+            increment(response.validation_name, EXECUTIONS)
+            execute_actions = __execute_actions
+            if only_on_change:
+                execute_actions = partial(
+                    __execute_actions_on_change, response.validation_name
+                )
+            ACTION_DISPATCHER.dispatch(
+                response.validation_name, execute_actions, actions, response, settings
+            )
+            status = change_status(status, response.status)
+
+        return ValidationResponse(
+            status, {name: response.status for name, response in responses.items()}
+        )
+
+    return batch_function
+
+
+def __build_batch_validations(validation_settings, command, args):
+    """
+    Register a validation executing command once with all targets and a
+    derived validation by target, named validation_name.target, used to
+    store and notify result of each target
+    """
+    name = validation_settings.pop("validation_name")
+    targets = __expand_targets(validation_settings.pop("targets"))
+    actions = validation_settings.pop("actions")
+    settings = validation_settings.get("settings") or {}
+
+    names = []
+    for target in targets:
+        target_function = __build_target_function(command, target, args)
+        target_function.__name__ = f"{name}.{target[1]}"
+        validation(**{**validation_settings, "actions": actions, "schedule": {}})(
+            target_function
+        )
+        names.append(target_function.__name__)
+
+    batch_function = __build_batch_function(
+        command,
+        targets,
+        args,
+        actions,
+        validation_settings.get("actions_on_error"),
+        settings,
+        validation_settings.get("only_on_change", False),
+    )
+    batch_function.__name__ = name
+    validation(**validation_settings)(batch_function)
+
+    return [name] + names
 
 
 class ValidationResponse:
@@ -180,27 +706,289 @@ def clear_validations():
     Clear validations
     """
     VALIDATIONS.clear()
+    FILE_VALIDATIONS.clear()
+
+
+def load_validations_file(file_path, parsed_file=None):
+    """
+    Load validations defined in a yaml file or in a python module,
+    replacing the validations previously loaded from it. Python modules
+    already imported are reloaded.
+
+    :param parsed_file: content of yaml file already parsed
+    :return: names of validations defined in file
+    """
+    unload_validations_file(file_path)
+    validation_names = []
+    try:
+        if file_path.endswith(".py"):
+            validation_names = __load_validations_module(file_path, True)
+        else:
+            __build_validation_from_settings(file_path, parsed_file, validation_names)
+    except Exception:
+        # validations registered before the error are not kept
+        if file_path.endswith(".py"):
+            validation_names = __get_module_validations(__build_module_name(file_path))
+        for validation_name in validation_names:
+            VALIDATIONS.pop(validation_name, None)
+        raise
+    __apply_filters(validation_names)
+    FILE_VALIDATIONS[file_path] = validation_names
+    return validation_names
+
+
+def unload_validations_file(file_path):
+    """
+    Remove validations loaded from a file
+
+    :return: names of removed validations
+    """
+    validation_names = FILE_VALIDATIONS.pop(file_path, [])
+    for validation_name in validation_names:
+        VALIDATIONS.pop(validation_name, None)
+
+    if file_path.endswith(".py") and not os.path.exists(file_path):
+        sys.modules.pop(__build_module_name(file_path), None)
+
+    return validation_names
+
+
+def __build_module_name(file_path):
+    relative_path = os.path.relpath(
+        os.path.dirname(file_path), os.path.join(LIFEGUARD_DIRECTORY)
+    )
+    return build_import(relative_path, os.path.basename(file_path).replace(".py", ""))
+
+
+def __load_validations_module(file_path, reload_module):
+    module = __build_module_name(file_path)
+    if module not in sys.modules:
+        __import__(module)
+    elif reload_module:
+        logger.info("reloading module %s", module)
+        importlib.reload(sys.modules[module])
+
+    return __get_module_validations(module)
+
+
+def __get_module_validations(module):
+    return [
+        name
+        for name, content in VALIDATIONS.items()
+        if content["ref"].__module__ == module
+    ]
 
 
 def load_validations():
     """
-    Load validations from application path
+    Load validations from application path. When a manifest is configured
+    validations of python modules listed in it are registered without
+    importing the module, which is imported on first execution.
     """
-    for root, _dirs, files in os.walk(os.path.join(LIFEGUARD_DIRECTORY, "validations")):
-        relative_path = os.path.relpath(root, os.path.join(LIFEGUARD_DIRECTORY))
-        for validation_file in files:
-            if validation_file.endswith("_validation.py"):
-                validation_module_name = (
-                    f'{build_import(relative_path, validation_file.replace(".py", ""))}'
+    __build_filters()
+    manifest = __load_manifest(LIFEGUARD_VALIDATIONS_MANIFEST)
+    file_paths = [
+        join(root, validation_file)
+        for root, _dirs, files in os.walk(
+            os.path.join(LIFEGUARD_DIRECTORY, "validations")
+        )
+        for validation_file in files
+        if validation_file.endswith(("_validation.py", "_validation.yaml"))
+    ]
+    with profile_phase("parse yaml files"):
+        parsed_files = __parse_validations_files(
+            [file_path for file_path in file_paths if file_path.endswith(".yaml")]
+        )
+
+    for file_path in file_paths:
+        with profile_phase(f"load {file_path}"):
+            if file_path.endswith(".yaml"):
+                load_validations_file(file_path, parsed_files.get(file_path))
+                continue
+
+            logger.info(
+                "loading validation %s", os.path.basename(file_path).replace(".py", "")
+            )
+            if __is_in_manifest(manifest, file_path):
+                FILE_VALIDATIONS[file_path] = __register_lazy_validations(
+                    file_path, manifest[file_path]["validations"]
                 )
-                logger.info("loading validation %s", validation_file.replace(".py", ""))
+            else:
+                FILE_VALIDATIONS[file_path] = __load_validations_module(
+                    file_path, False
+                )
+            __apply_filters(FILE_VALIDATIONS[file_path])
+
+
+def __load_manifest(manifest_path):
+    if not manifest_path or not os.path.exists(manifest_path):
+        return {}
+    try:
+        with open(manifest_path) as manifest_file:
+            return json.load(manifest_file)["files"]
+    except (OSError, ValueError, KeyError) as exception:
+        logger.warning(
+            "error on load validations manifest %s: %s", manifest_path, str(exception)
+        )
+        return {}
+
 
-                module = "%s" % (validation_module_name)
-                if module not in sys.modules:
-                    __import__(module)
+def __is_in_manifest(manifest, file_path):
+    return file_path in manifest and manifest[file_path].get(
+        "mtime"
+    ) == os.path.getmtime(file_path)
 
-            if validation_file.endswith("_validation.yaml"):
-                __build_validation_from_settings(join(root, validation_file))
+
+def __register_lazy_validations(file_path, validations_metadata):
+    names = []
+    for metadata in validations_metadata:
+        metadata = dict(metadata)
+        name = metadata.pop("name")
+        VALIDATIONS[name] = {
+            **metadata,
+            "ref": __build_lazy_validation(file_path, name),
+            "coroutine": None,
+            "actions": None,
+            "settings": {},
+            "lazy": True,
+        }
+        names.append(name)
+    return names
+
+
+def __build_lazy_validation(file_path, validation_name):
+    def lazy_validation(*args, **kwargs):
+        module = __build_module_name(file_path)
+        __load_validations_module(file_path, module in sys.modules)
+        content = VALIDATIONS.get(validation_name)
+        if not content or content.get("lazy"):
+            raise ValueError(f"validation {validation_name} not found in {module}")
+        return content["ref"](*args, **kwargs)
+
+    lazy_validation.__name__ = validation_name
+    return lazy_validation
+
+
+def build_validations_manifest(manifest_path):
+    """
+    Import all python validations modules and save in manifest the
+    metadata of validations needed to list and schedule them
+
+    :return: number of validations in manifest
+    """
+    files = {}
+    for root, _dirs, dir_files in os.walk(
+        os.path.join(LIFEGUARD_DIRECTORY, "validations")
+    ):
+        for validation_file in dir_files:
+            if not validation_file.endswith("_validation.py"):
+                continue
+            file_path = join(root, validation_file)
+            files[file_path] = {
+                "mtime": os.path.getmtime(file_path),
+                "validations": [
+                    {
+                        "name": name,
+                        **{
+                            field: VALIDATIONS[name].get(field)
+                            for field in MANIFEST_FIELDS
+                        },
+                    }
+                    for name in __load_validations_module(file_path, False)
+                ],
+            }
+
+    temporary_path = f"{manifest_path}.tmp"
+    with open(temporary_path, "w") as manifest_file:
+        json.dump({"files": files}, manifest_file, indent=2)
+    os.replace(temporary_path, manifest_path)
+
+    return sum(len(content["validations"]) for content in files.values())
+
+
+def __build_filters():
+    FILTERS["run_only"] = set(LIFEGUARD_RUN_ONLY_VALIDATIONS or [])
+    FILTERS["skip"] = set(LIFEGUARD_SKIP_VALIDATIONS or [])
+
+
+def __get_filter_message(validation_name):
+    if FILTERS["run_only"] and validation_name not in FILTERS["run_only"]:
+        return "validation %s not in LIFEGUARD_RUN_ONLY_VALIDATIONS"
+    if validation_name in FILTERS["skip"]:
+        return "validation %s in LIFEGUARD_SKIP_VALIDATIONS"
+    return None
+
+
+def __apply_filters(validation_names):
+    """
+    Mark validations filtered by LIFEGUARD_RUN_ONLY_VALIDATIONS or
+    LIFEGUARD_SKIP_VALIDATIONS, they are never executed nor scheduled
+    """
+    for validation_name in validation_names:
+        message = __get_filter_message(validation_name)
+        VALIDATIONS[validation_name]["filtered"] = message is not None
+        if message:
+            logger.info(message, validation_name)
+
+
+def __format_traceback(exception):
+    """
+    Format traceback of exception keeping only last frames and characters
+    allowed by settings. Identical tracebacks are formatted once.
+    """
+    frames = tuple(
+        (frame.f_code.co_filename, line)
+        for frame, line in traceback.walk_tb(exception.__traceback__)
+    )
+    key = hash((type(exception).__qualname__, str(exception), frames))
+
+    formatted_traceback = TRACEBACKS.get(key)
+    if formatted_traceback is None:
+        formatted_traceback = "".join(
+            traceback.format_exception(
+                type(exception),
+                exception,
+                exception.__traceback__,
+                limit=-LIFEGUARD_TRACEBACK_LIMIT or None,
+            )
+        )
+        if len(formatted_traceback) > LIFEGUARD_TRACEBACK_MAX_SIZE > 0:
+            formatted_traceback = (
+                "...\n" + formatted_traceback[-LIFEGUARD_TRACEBACK_MAX_SIZE:]
+            )
+        if len(TRACEBACKS) >= MAX_TRACEBACKS:
+            TRACEBACKS.clear()
+        TRACEBACKS[key] = formatted_traceback
+    return formatted_traceback
+
+
+def __build_error_response(validation_name, exception):
+    formatted_traceback = __format_traceback(exception)
+    increment(
+        validation_name,
+        TIMEOUTS if isinstance(exception, ValidationTimeout) else FAILURES,
+    )
+    logger.error(
+        "validation error %s: %s",
+        str(validation_name),
+        str(exception),
+        extra={"traceback": formatted_traceback},
+    )
+    return __build_error_details_response(
+        validation_name, exception, formatted_traceback
+    )
+
+
+def __build_error_details_response(validation_name, exception, formatted_traceback):
+    return ValidationResponse(
+        PROBLEM,
+        {
+            "exception": str(exception),
+            "traceback": formatted_traceback,
+            "use_error_template": True,
+        },
+        validation_name=validation_name,
+    )
 
 
 def validation(
@@ -210,9 +998,25 @@ def validation(
     settings=None,
     actions_on_error=None,
     group=None,
+    timeout=None,
+    target=None,
+    priority=0,
+    only_on_change=False,
 ):
     """
     Decorator to configure a validation
+
+    Decorated function can be a coroutine function, in this case it is
+    executed in the event loop shared by asynchronous validations.
+    When timeout (in seconds) is reached the execution is abandoned and
+    treated as an error.
+    Concurrency limits configured for group or target name are held while
+    the validation runs.
+    When scheduler is behind, due validations with higher priority run first.
+    With only_on_change actions are skipped when status and details are
+    the same of last result.
+    Actions are executed by the actions dispatcher, out of the validation
+    execution when it has workers.
     """
     if not settings:
         settings = {}
@@ -220,50 +1024,104 @@ def validation(
     if not group:
         group = "default"
 
+    limit_names = [group, target]
+
     def function_reference(decorated):
+        execute_actions = __execute_actions
+        if only_on_change:
+            execute_actions = partial(__execute_actions_on_change, decorated.__name__)
+
         @wraps(decorated)
         def wrapped(*args, **kwargs):
+            if coroutine:
+                return EVENT_LOOP.submit(
+                    coroutine(*args, **kwargs), limited=False
+                ).result()
+
             try:
-                if LIFEGUARD_RUN_ONLY_VALIDATIONS and (
-                    decorated.__name__ not in LIFEGUARD_RUN_ONLY_VALIDATIONS
-                ):
-                    logger.info(
-                        "validation %s not in LIFEGUARD_RUN_ONLY_VALIDATIONS",
-                        decorated.__name__,
-                    )
+                if entry["filtered"]:
                     return None
 
-                if LIFEGUARD_SKIP_VALIDATIONS and (
-                    decorated.__name__ in LIFEGUARD_SKIP_VALIDATIONS
-                ):
-                    logger.info(
-                        "validation %s in LIFEGUARD_SKIP_VALIDATIONS",
+                increment(decorated.__name__, EXECUTIONS)
+                # waiting for a slot does not count against the timeout and
+                # an abandoned execution holds its slots until it finishes
+                if timeout:
+                    __check_abandoned_call(decorated.__name__, timeout)
+                semaphores = acquire_limits(limit_names)
+                if timeout:
+                    result = __call_with_timeout(
                         decorated.__name__,
+                        decorated,
+                        timeout,
+                        args,
+                        kwargs,
+                        partial(release_limits, semaphores),
                     )
+                else:
+                    try:
+                        result = decorated(*args, **kwargs)
+                    finally:
+                        release_limits(semaphores)
+                result.validation_name = decorated.__name__
+                ACTION_DISPATCHER.dispatch(
+                    decorated.__name__, execute_actions, actions, result, settings
+                )
+
+                return result
+            except Exception as exception:
+                validation_response_error = __build_error_response(
+                    decorated.__name__, exception
+                )
+                ACTION_DISPATCHER.dispatch(
+                    decorated.__name__,
+                    __execute_error_actions,
+                    decorated.__name__,
+                    actions_on_error,
+                    validation_response_error,
+                    settings,
+                )
+
+                return validation_response_error
+
+        async def wrapped_coroutine(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+            try:
+                if entry["filtered"]:
                     return None
 
-                result = decorated(*args, **kwargs)
+                increment(decorated.__name__, EXECUTIONS)
+                # group limits are waited before taking a slot of event loop
+                async with async_concurrency_limits(limit_names), EVENT_LOOP.slot():
+                    task = asyncio.ensure_future(decorated(*args, **kwargs))
+                    done, _pending = await asyncio.wait({task}, timeout=timeout or None)
+                    if not done:
+                        task.cancel()
+                        raise ValidationTimeout(
+                            f"validation timed out after {timeout} seconds"
+                        )
+                result = task.result()
                 result.validation_name = decorated.__name__
-                __execute_actions(actions, result, settings)
+                await loop.run_in_executor(
+                    None,
+                    ACTION_DISPATCHER.dispatch,
+                    decorated.__name__,
+                    execute_actions,
+                    actions,
+                    result,
+                    settings,
+                )
 
                 return result
             except Exception as exception:
-                logger.error(
-                    "validation error %s: %s",
-                    str(decorated.__name__),
-                    str(exception),
-                    extra={"traceback": traceback.format_exc()},
+                validation_response_error = __build_error_response(
+                    decorated.__name__, exception
                 )
-                validation_response_error = ValidationResponse(
-                    PROBLEM,
-                    {
-                        "exception": str(exception),
-                        "traceback": traceback.format_exc(),
-                        "use_error_template": True,
-                    },
-                    validation_name=decorated.__name__,
-                )
-                __execute_actions(
+                await loop.run_in_executor(
+                    None,
+                    ACTION_DISPATCHER.dispatch,
+                    decorated.__name__,
+                    __execute_error_actions,
+                    decorated.__name__,
                     actions_on_error,
                     validation_response_error,
                     settings,
@@ -271,15 +1129,28 @@ def validation(
 
                 return validation_response_error
 
-        VALIDATIONS[decorated.__name__] = {
+        coroutine = (
+            wrapped_coroutine if inspect.iscoroutinefunction(decorated) else None
+        )
+
+        entry = VALIDATIONS[decorated.__name__] = {
             "ref": wrapped,
+            "coroutine": coroutine,
             "group": group,
+            "target": target,
             "description": description,
             "actions": actions,
             "schedule": schedule,
             "settings": settings,
+            "timeout": timeout,
+            "priority": priority,
+            "only_on_change": only_on_change,
+            "filtered": __get_filter_message(decorated.__name__) is not None,
         }
 
         return wrapped
 
     return function_reference
+
+
+__build_filters()
@@ -0,0 +1,186 @@
+"""
+Watcher of validations files based on inotify
+"""
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+import traceback
+
+from lifeguard.logger import lifeguard_logger as logger
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (
+    IN_MODIFY
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+)
+
+EVENT_HEADER = struct.Struct("iIII")
+
+
+def __load_libc():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1
+        libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    return libc
+
+
+LIBC = __load_libc()
+
+
+def inotify_available():
+    """
+    Return if inotify can be used in this platform
+    """
+    return LIBC is not None
+
+
+class InotifyWatcher:
+    """
+    Watch a directory tree and report changed files.
+
+    Events are debounced: callback is called with all changed paths only
+    after no event arrives for debounce seconds.
+    When kernel queue overflows events are lost, so on_overflow is called
+    to resync changes or, without it, all files in tree are reported.
+    """
+
+    def __init__(
+        self, directory, callback, file_filter=None, debounce=0.5, on_overflow=None
+    ):
+        self._directory = directory
+        self._callback = callback
+        self._on_overflow = on_overflow
+        self._file_filter = file_filter or (lambda path: True)
+        self._debounce = debounce
+        self._descriptor = None
+        self._watches = {}
+        self._changed = set()
+        self._running = False
+
+    def start(self):
+        """
+        Start to watch directory in a daemon thread
+        """
+        descriptor = LIBC.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if descriptor < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._descriptor = descriptor
+        self.__watch_tree(self._directory)
+        self._running = True
+
+        threading.Thread(
+            target=self.__run, name="lifeguard-watcher", daemon=True
+        ).start()
+
+    def stop(self):
+        """
+        Stop watcher
+        """
+        self._running = False
+
+    def __watch_tree(self, directory):
+        changed = []
+        for root, _dirs, files in os.walk(directory):
+            watch = LIBC.inotify_add_watch(
+                self._descriptor, os.fsencode(root), WATCH_MASK
+            )
+            if watch < 0:
+                logger.warning("error on watch directory %s", root)
+                continue
+            self._watches[watch] = root
+            changed.extend(os.path.join(root, file) for file in files)
+        return changed
+
+    def __run(self):
+        last_event = None
+        while self._running:
+            timeout = self._debounce if self._changed else 1
+            readable, _, _ = select.select([self._descriptor], [], [], timeout)
+            try:
+                if readable:
+                    self.__read_events()
+                    last_event = time.monotonic()
+                elif self._changed and (
+                    time.monotonic() - last_event >= self._debounce
+                ):
+                    changed, self._changed = self._changed, set()
+                    self._callback(changed)
+            except Exception as exception:
+                logger.error(
+                    "error on watch files %s",
+                    str(exception),
+                    extra={"traceback": traceback.format_exc()},
+                )
+        os.close(self._descriptor)
+
+    def __read_events(self):
+        try:
+            buffer = os.read(self._descriptor, 64 * 1024)
+        except BlockingIOError:
+            return
+
+        offset = 0
+        while offset < len(buffer):
+            watch, mask, _cookie, length = EVENT_HEADER.unpack_from(buffer, offset)
+            offset += EVENT_HEADER.size
+            name = buffer[offset : offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                self.__resync()
+                continue
+
+            if mask & IN_IGNORED:
+                self._watches.pop(watch, None)
+                continue
+
+            directory = self._watches.get(watch)
+            if directory is None or not name:
+                continue
+
+            path = os.path.join(directory, os.fsdecode(name))
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    self.__add_changed(self.__watch_tree(path))
+                continue
+            self.__add_changed([path])
+
+    def __resync(self):
+        logger.warning("inotify queue overflow, rescanning %s", self._directory)
+        # directories created while events were lost are not watched yet
+        files = self.__watch_tree(self._directory)
+        if self._on_overflow:
+            self._on_overflow()
+        else:
+            self.__add_changed(files)
+
+    def __add_changed(self, paths):
+        self._changed.update(path for path in paths if self._file_filter(path))
@@ -1,4 +1,4 @@
-from lifeguard import NORMAL
+from lifeguard import NORMAL, PROBLEM
 from lifeguard.logger import lifeguard_logger as logger
 from lifeguard.validations import ValidationResponse
 
@@ -7,5 +7,24 @@ def common_action(_response, _settings):
     logger.info("common action executed")
 
 
+def common_error_action(_response, _settings):
+    logger.info("common error action executed")
+
+
 def common_validation(arg):
     return ValidationResponse(NORMAL, {"arg": arg})
+
+
+def common_batch_validation(targets, arg):
+    return [
+        ValidationResponse(PROBLEM if target == "down" else NORMAL, {"arg": arg})
+        for target in targets
+    ]
+
+
+def common_batch_validation_by_target(targets, arg):
+    return {target: ValidationResponse(NORMAL, {"arg": arg}) for target in targets}
+
+
+def common_failing_batch_validation(_targets, _arg):
+    raise ConnectionError("connection refused")
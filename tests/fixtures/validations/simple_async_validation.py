@@ -0,0 +1,20 @@
+import asyncio
+
+from lifeguard import NORMAL
+from lifeguard.validations import ValidationResponse, validation
+
+
+def async_action(_result, _settings):
+    pass
+
+
+@validation(description="asynchronous validation", actions=[async_action])
+async def simple_async_validation():
+    await asyncio.sleep(0)
+    return ValidationResponse(NORMAL, {})
+
+
+@validation(description="slow asynchronous validation", actions=[], timeout=0.1)
+async def simple_async_with_timeout_validation():
+    await asyncio.sleep(1)
+    return ValidationResponse(NORMAL, {})
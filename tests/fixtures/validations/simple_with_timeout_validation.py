@@ -0,0 +1,10 @@
+import time
+
+from lifeguard import NORMAL
+from lifeguard.validations import ValidationResponse, validation
+
+
+@validation(description="validation with timeout", actions=[], timeout=0.1)
+def simple_with_timeout_validation():
+    time.sleep(1)
+    return ValidationResponse(NORMAL, {})
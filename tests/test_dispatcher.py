@@ -0,0 +1,111 @@
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from lifeguard.dispatcher import ActionDispatcher
+from lifeguard.metrics import clear_counters, read_counters
+
+
+class TestActionDispatcher(unittest.TestCase):
+    def tearDown(self):
+        clear_counters()
+
+    def test_execute_in_calling_thread_without_workers(self):
+        dispatcher = ActionDispatcher(0, 10)
+        function = MagicMock(name="function")
+
+        self.assertTrue(dispatcher.dispatch("validation", function, "result", {}))
+
+        function.assert_called_once_with("result", {})
+
+    def test_execute_in_worker_threads(self):
+        dispatcher = ActionDispatcher(2, 10)
+        threads = []
+
+        dispatcher.dispatch(
+            "validation", lambda: threads.append(threading.current_thread().name)
+        )
+        dispatcher.join(1)
+
+        self.assertEqual(len(threads), 1)
+        self.assertTrue(threads[0].startswith("lifeguard-actions-"))
+        self.assertEqual(dispatcher.queue_depth(), 0)
+
+    def test_keep_order_of_actions_of_same_validation(self):
+        dispatcher = ActionDispatcher(4, 100)
+        release = threading.Event()
+        executions = []
+
+        dispatcher.dispatch("validation", lambda: release.wait(1))
+        for index in range(20):
+            dispatcher.dispatch("validation", executions.append, index)
+        release.set()
+        dispatcher.join(1)
+
+        self.assertEqual(executions, list(range(20)))
+
+    def test_slow_validation_does_not_delay_others(self):
+        dispatcher = ActionDispatcher(2, 10)
+        release = threading.Event()
+        executed = threading.Event()
+
+        dispatcher.dispatch("slow", lambda: release.wait(1))
+        dispatcher.dispatch("slow", MagicMock())
+        dispatcher.dispatch("fast", executed.set)
+
+        self.assertTrue(executed.wait(1))
+        release.set()
+        dispatcher.join(1)
+
+    @patch("lifeguard.dispatcher.logger")
+    def test_drop_when_queue_is_full(self, mock_logger):
+        dispatcher = ActionDispatcher(1, 1, "drop")
+        release = threading.Event()
+        function = MagicMock(name="function")
+
+        dispatcher.dispatch("validation", lambda: release.wait(1))
+        self.assertFalse(dispatcher.dispatch("validation", function))
+        release.set()
+        dispatcher.join(1)
+
+        function.assert_not_called()
+        mock_logger.warning.assert_called_with(
+            "actions of %s dropped: queue is full", "validation"
+        )
+        self.assertEqual(read_counters("validation"), {"dropped": 1})
+
+    def test_block_until_queue_has_room(self):
+        dispatcher = ActionDispatcher(1, 1, "block")
+        release = threading.Event()
+        function = MagicMock(name="function")
+
+        dispatcher.dispatch("validation", lambda: release.wait(1))
+        blocked = threading.Thread(
+            target=dispatcher.dispatch, args=("validation", function)
+        )
+        blocked.start()
+        blocked.join(0.05)
+        self.assertTrue(blocked.is_alive())
+
+        release.set()
+        blocked.join(1)
+        dispatcher.join(1)
+
+        function.assert_called_once_with()
+
+    @patch("lifeguard.dispatcher.logger")
+    def test_log_error_and_continue(self, mock_logger):
+        dispatcher = ActionDispatcher(1, 10)
+        function = MagicMock(name="function")
+
+        dispatcher.dispatch("validation", lambda: 1 / 0)
+        dispatcher.dispatch("validation", function)
+        dispatcher.join(1)
+
+        function.assert_called_once_with()
+        mock_logger.error.assert_called_once()
+        self.assertEqual(mock_logger.error.call_args[0][1], "validation")
+
+    def test_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            ActionDispatcher(1, 10, "invalid")
@@ -0,0 +1,52 @@
+import asyncio
+import unittest
+
+from lifeguard.event_loop import SharedEventLoop
+
+
+class TestSharedEventLoop(unittest.TestCase):
+    def test_submit_coroutine(self):
+        event_loop = SharedEventLoop(10)
+
+        async def coroutine():
+            return "result"
+
+        self.assertEqual(event_loop.submit(coroutine()).result(1), "result")
+
+    def test_limit_coroutines_running_at_same_time(self):
+        event_loop = SharedEventLoop(2)
+        state = {"running": 0, "max_running": 0}
+
+        async def coroutine():
+            state["running"] += 1
+            state["max_running"] = max(state["max_running"], state["running"])
+            await asyncio.sleep(0.01)
+            state["running"] -= 1
+
+        futures = [event_loop.submit(coroutine()) for _ in range(10)]
+        for future in futures:
+            future.result(1)
+
+        self.assertEqual(state["max_running"], 2)
+
+    def test_reuse_same_loop(self):
+        event_loop = SharedEventLoop(0)
+
+        self.assertIs(event_loop.loop, event_loop.loop)
+
+    def test_submit_coroutine_taking_slot_by_itself(self):
+        event_loop = SharedEventLoop(1)
+        state = {"running": 0, "max_running": 0}
+
+        async def coroutine():
+            async with event_loop.slot():
+                state["running"] += 1
+                state["max_running"] = max(state["max_running"], state["running"])
+                await asyncio.sleep(0.01)
+                state["running"] -= 1
+
+        futures = [event_loop.submit(coroutine(), limited=False) for _ in range(5)]
+        for future in futures:
+            future.result(1)
+
+        self.assertEqual(state["max_running"], 1)
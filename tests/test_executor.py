@@ -0,0 +1,152 @@
+import asyncio
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from lifeguard.executor import ExecutionPool
+from lifeguard.metrics import clear_counters, read_counters
+
+
+class TestExecutionPool(unittest.TestCase):
+    def test_execute_submitted_functions(self):
+        pool = ExecutionPool(2)
+        pool.start()
+        function = MagicMock(name="function")
+
+        pool.submit("validation_a", function)
+        pool.submit("validation_b", function)
+        pool.join()
+
+        self.assertEqual(function.call_count, 2)
+        self.assertEqual(pool.queue_depth(), 0)
+
+    def test_validation_never_overlaps_itself(self):
+        pool = ExecutionPool(2)
+        release = threading.Event()
+        executions = []
+
+        def slow():
+            release.wait(1)
+            executions.append("first")
+
+        def fast():
+            executions.append("second")
+
+        pool.submit("validation", slow)
+        pool.submit("validation", fast)
+        self.assertEqual(pool.queue_depth(), 2)
+
+        pool.start()
+        release.set()
+        pool.join()
+
+        self.assertEqual(executions, ["first", "second"])
+
+    @patch("lifeguard.executor.logger")
+    def test_log_error_and_keep_working(self, mock_logger):
+        pool = ExecutionPool(1)
+        pool.start()
+        function = MagicMock(name="function")
+
+        pool.submit("validation", MagicMock(side_effect=Exception("error")))
+        pool.submit("validation", function)
+        pool.join()
+
+        function.assert_called_with()
+        mock_logger.error.assert_called()
+
+    def test_execute_coroutine_in_event_loop(self):
+        pool = ExecutionPool(0)
+        executions = []
+
+        async def coroutine():
+            await asyncio.sleep(0.05)
+            executions.append(len(executions))
+
+        pool.submit("validation", coroutine, asynchronous=True)
+        pool.submit("validation", coroutine, asynchronous=True)
+        pool.join()
+
+        self.assertEqual(executions, [0, 1])
+        self.assertEqual(pool.queue_depth(), 0)
+
+    def test_skip_execution_when_validation_is_running(self):
+        clear_counters()
+        pool = ExecutionPool(1)
+        function = MagicMock(name="function")
+
+        self.assertTrue(pool.submit("validation", function, overrun="skip"))
+        self.assertFalse(pool.submit("validation", function, overrun="skip"))
+        pool.start()
+        pool.join()
+
+        self.assertEqual(function.call_count, 1)
+        self.assertEqual(read_counters("validation"), {"skipped": 1})
+
+    def test_coalesce_executions_when_validation_is_running(self):
+        clear_counters()
+        pool = ExecutionPool(1)
+        function = MagicMock(name="function")
+
+        for _ in range(4):
+            pool.submit("validation", function, overrun="coalesce")
+        self.assertEqual(pool.queue_depth(), 2)
+        pool.start()
+        pool.join()
+
+        self.assertEqual(function.call_count, 2)
+        self.assertEqual(read_counters("validation"), {"coalesced": 2})
+
+    def test_queue_executions_when_validation_is_running(self):
+        pool = ExecutionPool(1)
+        function = MagicMock(name="function")
+
+        for _ in range(4):
+            pool.submit("validation", function, overrun="queue")
+        pool.start()
+        pool.join()
+
+        self.assertEqual(function.call_count, 4)
+
+    def test_invalid_overrun_policy(self):
+        pool = ExecutionPool(1)
+
+        with self.assertRaises(ValueError):
+            pool.submit("validation", MagicMock(), overrun="invalid")
+
+    def test_take_executions_by_priority(self):
+        pool = ExecutionPool(1)
+        executions = []
+
+        pool.submit("low", lambda: executions.append("low"))
+        pool.submit("normal", lambda: executions.append("normal"), priority=5)
+        pool.submit("critical", lambda: executions.append("critical"), priority=10)
+
+        pool.start()
+        pool.join()
+
+        self.assertEqual(executions, ["critical", "normal", "low"])
+
+    def test_reserved_worker_only_executes_critical_priority(self):
+        pool = ExecutionPool(2, reserved_workers=1, critical_priority=10)
+        started = threading.Event()
+        release = threading.Event()
+        critical_done = threading.Event()
+        executions = []
+
+        def slow():
+            started.set()
+            release.wait(1)
+
+        pool.start()
+        pool.submit("slow", slow)
+        started.wait(1)
+        pool.submit("low", lambda: executions.append("low"))
+        pool.submit("critical", critical_done.set, priority=10)
+
+        self.assertTrue(critical_done.wait(1))
+        self.assertEqual(executions, [])
+
+        release.set()
+        pool.join()
+        self.assertEqual(executions, ["low"])
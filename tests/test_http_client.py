@@ -70,3 +70,18 @@ class TestHttpClient(unittest.TestCase):
         mock_requests.get.assert_called_with(
             url="url", headers="headers", auth=("user", "password")
         )
+
+    @patch("lifeguard.http_client.requests")
+    def test_call_get_with_timeout(self, mock_requests):
+        get("url", headers="headers", timeout=5)
+        mock_requests.get.assert_called_with(
+            url="url", headers="headers", auth=None, timeout=5
+        )
+
+    @patch("lifeguard.http_client.HTTP_TIMEOUT", 10.0)
+    @patch("lifeguard.http_client.requests")
+    def test_call_post_with_default_timeout(self, mock_requests):
+        post("url", data="data", headers="headers")
+        mock_requests.post.assert_called_with(
+            url="url", headers="headers", data="data", auth=None, timeout=10.0
+        )
@@ -36,3 +36,30 @@ class TestLifeguardCore(unittest.TestCase):
 
         setup(LIFEGUARD_CONTEXT)
         mock_load_validations.assert_called()
+
+    @patch("lifeguard.load_assets_controllers")
+    @patch("lifeguard.load_groups_controllers")
+    @patch("lifeguard.load_custom_controllers")
+    @patch("lifeguard.register_custom_controller")
+    @patch("lifeguard.disable_profiler")
+    @patch("lifeguard.log_startup_profile")
+    @patch("lifeguard.PROFILE", {"enabled": True})
+    @patch("lifeguard.load_validations")
+    @patch("lifeguard.recover_settings")
+    def test_setup_stops_profiler_after_logging_it(
+        self,
+        mock_recover_settings,
+        _mock_load_validations,
+        mock_log_startup_profile,
+        mock_disable_profiler,
+        _mock_register_custom_controller,
+        _mock_load_custom_controllers,
+        _mock_load_groups_controllers,
+        _mock_load_assets_controllers,
+    ):
+        mock_recover_settings.return_value = mock_lifeguard_settings
+
+        setup(LIFEGUARD_CONTEXT)
+
+        mock_log_startup_profile.assert_called_with()
+        mock_disable_profiler.assert_called_with()
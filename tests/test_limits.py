@@ -0,0 +1,73 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import call, patch
+
+from lifeguard.limits import (
+    SEMAPHORES,
+    async_concurrency_limits,
+    concurrency_limits,
+    configure_limits,
+)
+
+
+class TestLimits(unittest.TestCase):
+    def tearDown(self):
+        SEMAPHORES.clear()
+
+    @patch("lifeguard.limits.logger")
+    def test_configure_limits(self, mock_logger):
+        configure_limits(["database=2", "payments = 1", "invalid", "cache=0"])
+
+        self.assertEqual(sorted(SEMAPHORES), ["database", "payments"])
+        mock_logger.warning.assert_has_calls(
+            [
+                call("invalid concurrency limit %s", "invalid"),
+                call("invalid concurrency limit %s", "cache=0"),
+            ]
+        )
+
+    def test_ignore_names_without_limit(self):
+        with concurrency_limits(["default", None]):
+            pass
+
+    def test_limit_threads_running_at_same_time(self):
+        configure_limits(["database=2"])
+        state = {"running": 0, "max_running": 0}
+        lock = threading.Lock()
+
+        def run():
+            with concurrency_limits(["database", "target"]):
+                with lock:
+                    state["running"] += 1
+                    state["max_running"] = max(state["max_running"], state["running"])
+                time.sleep(0.01)
+                with lock:
+                    state["running"] -= 1
+
+        threads = [threading.Thread(target=run) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(state["max_running"], 2)
+
+    def test_limit_coroutines_running_at_same_time(self):
+        configure_limits(["database=1"])
+        state = {"running": 0, "max_running": 0}
+
+        async def run():
+            async with async_concurrency_limits(["database"], interval=0.001):
+                state["running"] += 1
+                state["max_running"] = max(state["max_running"], state["running"])
+                await asyncio.sleep(0.01)
+                state["running"] -= 1
+
+        async def run_all():
+            await asyncio.gather(*[run() for _ in range(5)])
+
+        asyncio.run(run_all())
+
+        self.assertEqual(state["max_running"], 1)
@@ -0,0 +1,45 @@
+import unittest
+from unittest.mock import call, patch
+
+from lifeguard.metrics import clear_counters, increment, log_counters, read_counters
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        clear_counters()
+
+    def test_increment_counter(self):
+        increment("validation", "executions")
+        increment("validation", "executions")
+        increment("validation", "failures", 3)
+
+        self.assertEqual(read_counters("validation"), {"executions": 2, "failures": 3})
+
+    def test_read_all_counters(self):
+        increment("validation_a", "executions")
+        increment("validation_b", "timeouts")
+
+        self.assertEqual(
+            read_counters(),
+            {
+                "validation_a": {"executions": 1},
+                "validation_b": {"timeouts": 1},
+            },
+        )
+
+    def test_read_counters_of_unknown_validation(self):
+        self.assertEqual(read_counters("unknown"), {})
+
+    @patch("lifeguard.metrics.logger")
+    def test_log_counters(self, mock_logger):
+        increment("validation_b", "skipped")
+        increment("validation_a", "dropped", 2)
+
+        log_counters()
+
+        mock_logger.info.assert_has_calls(
+            [
+                call("validation %s counters: %s", "validation_a", {"dropped": 2}),
+                call("validation %s counters: %s", "validation_b", {"skipped": 1}),
+            ]
+        )
@@ -0,0 +1,88 @@
+import tracemalloc
+import unittest
+from unittest.mock import patch
+
+from lifeguard.profiler import (
+    PROFILE,
+    build_startup_report,
+    disable_profiler,
+    enable_profiler,
+    log_startup_profile,
+    profile_phase,
+)
+
+
+class TestProfiler(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.dict(
+            PROFILE, {"enabled": True, "depth": 0, "phases": [], "tracing": False}
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.addCleanup(tracemalloc.stop)
+
+    def test_record_nested_phases(self):
+        with profile_phase("load validations"):
+            with profile_phase("load example_validation.py"):
+                data = [0] * 100000
+
+        self.assertEqual(
+            [(phase["name"], phase["depth"]) for phase in PROFILE["phases"]],
+            [("load validations", 0), ("load example_validation.py", 1)],
+        )
+        self.assertGreater(PROFILE["phases"][1]["memory"], len(data))
+        self.assertGreaterEqual(
+            PROFILE["phases"][0]["seconds"], PROFILE["phases"][1]["seconds"]
+        )
+
+    def test_ignore_phases_when_disabled(self):
+        PROFILE["enabled"] = False
+
+        with profile_phase("load validations"):
+            pass
+
+        self.assertEqual(PROFILE["phases"], [])
+
+    def test_build_startup_report(self):
+        PROFILE["phases"] = [
+            {"name": "load validations", "depth": 0, "seconds": 1.5, "memory": 2048},
+            {"name": "load a.yaml", "depth": 1, "seconds": 0.25, "memory": 512},
+        ]
+
+        self.assertEqual(
+            build_startup_report(),
+            "Phase              Seconds  Memory (KiB)\n"
+            "load validations     1.500           2.0\n"
+            "  load a.yaml        0.250           0.5",
+        )
+
+    @patch("lifeguard.profiler.logger")
+    def test_log_startup_profile(self, mock_logger):
+        PROFILE["phases"] = [
+            {"name": "load validations", "depth": 0, "seconds": 1.5, "memory": 2048}
+        ]
+
+        log_startup_profile()
+
+        mock_logger.info.assert_called_with(
+            "startup phase %s: %.3fs %.1fKiB", "load validations", 1.5, 2.0
+        )
+
+    def test_stop_tracing_started_by_profiler(self):
+        tracemalloc.stop()
+        enable_profiler()
+        self.assertTrue(tracemalloc.is_tracing())
+
+        disable_profiler()
+
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertFalse(PROFILE["enabled"])
+
+    def test_keep_tracing_started_by_others(self):
+        enable_profiler()
+
+        disable_profiler()
+
+        self.assertTrue(tracemalloc.is_tracing())
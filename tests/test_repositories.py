@@ -4,6 +4,7 @@ import sys
 
 from lifeguard.repositories import (
     IMPLEMENTATIONS,
+    CoordinationRepository,
     HistoryRepository,
     NotificationRepository,
     ValidationRepository,
@@ -12,7 +13,7 @@ from lifeguard.repositories import (
 
 sys.path.append("tests/fixtures")
 
-NAMES = ["history", "notification", "validation"]
+NAMES = ["coordination", "history", "notification", "validation"]
 
 
 class TestNotificationRepository(unittest.TestCase):
@@ -133,6 +134,51 @@ class TestValidationRepositories(unittest.TestCase):
         self.validation_repository.delete_validation_result(validation_name)
         self.implementation.delete_validation_result(validation_name)
 
+    def test_validation_repository_update_validation_heartbeat(self):
+        heartbeat = MagicMock(name="heartbeat")
+        self.validation_repository.update_validation_heartbeat("name", heartbeat)
+        self.implementation.update_validation_heartbeat.assert_called_with(
+            "name", heartbeat
+        )
+
+    def test_validation_repository_update_validation_heartbeat_not_implemented(self):
+        del self.implementation.update_validation_heartbeat
+        self.assertIsNone(
+            self.validation_repository.update_validation_heartbeat("name", None)
+        )
+
+
+class TestCoordinationRepository(unittest.TestCase):
+    def setUp(self):
+        for name in NAMES:
+            if name in IMPLEMENTATIONS:
+                IMPLEMENTATIONS.pop(name)
+
+        self.implementation = MagicMock(name="implementation")
+
+        with patch("lifeguard.repositories.logger"):
+            implementation_class = MagicMock(name="implementation_class")
+            implementation_class.__name__ = "mocked_implementation"
+            implementation_class.return_value = self.implementation
+
+            declare_implementation("coordination", implementation_class)
+
+        self.coordination_repository = CoordinationRepository()
+
+    def test_register_node(self):
+        heartbeat = MagicMock(name="heartbeat")
+        self.coordination_repository.register_node("node", heartbeat)
+        self.implementation.register_node.assert_called_with("node", heartbeat)
+
+    def test_fetch_active_nodes(self):
+        since = MagicMock(name="since")
+        self.coordination_repository.fetch_active_nodes(since)
+        self.implementation.fetch_active_nodes.assert_called_with(since)
+
+    def test_unregister_node(self):
+        self.coordination_repository.unregister_node("node")
+        self.implementation.unregister_node.assert_called_with("node")
+
 
 class TestRepositoriesFunctions(unittest.TestCase):
     def setUp(self):
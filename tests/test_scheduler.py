@@ -1,20 +1,67 @@
+import os
+import shutil
+import tempfile
 import unittest
-from unittest.mock import patch, MagicMock, call
+from datetime import datetime, timedelta
+from unittest.mock import ANY, patch, MagicMock, call
+
+import schedule
 
 from lifeguard.scheduler import (
+    adapt_schedule,
     configure_validations,
+    dispatch_validation,
+    get_overrun_policy,
+    log_scheduler_stats,
     VALID_TIME_PERIODS,
     MOMENTS,
     check_if_should_reload,
+    notify_changed_files,
+    reload_changed_files,
+    request_resync,
     reload_scheduler,
+    reload_validations_files,
+    run_pending,
+    spread_first_run,
     start_scheduler,
+    trigger_validation,
+    wait_for_next_job,
+    wake_up_scheduler,
     WATCHED_FILES,
 )
 
+from lifeguard.metrics import log_counters
+from lifeguard.scheduler_state import SCHEDULER_STATE, update_scheduler_state
+from lifeguard.single_flight import run_once_async
+from lifeguard.statuses import NORMAL, PROBLEM
+from lifeguard.validations import VALIDATIONS, ValidationResponse
+
+YAML_VALIDATION = """
+validations:
+  - validation_name: "{name}"
+    description: "{description}"
+    actions: []
+    schedule:
+      every:
+        minutes: 10
+    execute:
+      command: tests.fixtures.validations.shared.common_validation.common_validation
+      args:
+        - "arg"
+"""
+
 mock_ref = MagicMock(name="ref")
+mock_coroutine = MagicMock(name="coroutine")
 
 
 class TestScheduler(unittest.TestCase):
+    def setUp(self):
+        self.locks_directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.locks_directory)
+        patcher = patch("lifeguard.single_flight.LOCKS_DIRECTORY", self.locks_directory)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     @patch(
         "lifeguard.scheduler.VALIDATIONS",
         {"example": {"ref": mock_ref, "schedule": {"every": {"minutes": 1}}}},
@@ -25,6 +72,40 @@ class TestScheduler(unittest.TestCase):
 
         mock_schedule.every.assert_called_with(1)
 
+    @patch(
+        "lifeguard.scheduler.VALIDATIONS",
+        {
+            "example": {
+                "ref": mock_ref,
+                "schedule": {"every": {"minutes": 1}},
+                "filtered": True,
+            }
+        },
+    )
+    @patch("lifeguard.scheduler.schedule")
+    def test_configure_validations_ignore_filtered(self, mock_schedule):
+        configure_validations()
+
+        mock_schedule.every.assert_not_called()
+
+    @patch(
+        "lifeguard.scheduler.VALIDATIONS",
+        {
+            "example": {"filtered": False},
+            "filtered_example": {"filtered": True},
+        },
+    )
+    @patch("lifeguard.scheduler.logger")
+    @patch("lifeguard.scheduler.schedule")
+    def test_log_scheduler_stats(self, mock_schedule, mock_logger):
+        mock_schedule.get_jobs.return_value = [MagicMock(name="job")]
+
+        log_scheduler_stats()
+
+        mock_logger.info.assert_called_with(
+            "validations loaded: %s, filtered: %s, scheduled jobs: %s", 2, 1, 1
+        )
+
     @patch(
         "lifeguard.scheduler.VALIDATIONS",
         {"example": {"ref": mock_ref, "schedule": {"every": {"hours": 1}}}},
@@ -64,7 +145,154 @@ class TestScheduler(unittest.TestCase):
 
         mock_schedule.every.assert_called()
         mock_at.at.assert_called_with("10:00")
-        mock_do.do.assert_called_with(mock_ref)
+        mock_do.do.assert_called_with(dispatch_validation, "example")
+
+    @patch(
+        "lifeguard.scheduler.VALIDATIONS",
+        {"example": {"ref": mock_ref, "schedule": {"every": {"minutes": 1}}}},
+    )
+    @patch("lifeguard.scheduler.EXECUTION_POOL")
+    def test_dispatch_validation_in_scheduler_thread(self, mock_execution_pool):
+        mock_execution_pool.workers = 0
+
+        dispatch_validation("example")
+
+        mock_ref.assert_called_with()
+        mock_execution_pool.submit.assert_not_called()
+
+    @patch(
+        "lifeguard.scheduler.VALIDATIONS",
+        {"example": {"ref": mock_ref, "schedule": {"every": {"minutes": 1}}}},
+    )
+    @patch("lifeguard.scheduler.owns_validation")
+    @patch("lifeguard.scheduler.EXECUTION_POOL")
+    def test_not_dispatch_validation_of_other_node(
+        self, mock_execution_pool, mock_owns_validation
+    ):
+        mock_owns_validation.return_value = False
+
+        dispatch_validation("example")
+
+        mock_owns_validation.assert_called_with("example")
+        mock_execution_pool.submit.assert_not_called()
+
+    @patch(
+        "lifeguard.scheduler.VALIDATIONS",
+        {
+            "example": {
+                "ref": mock_ref,
+                "coroutine": mock_coroutine,
+                "schedule": {"every": {"minutes": 1}},
+            }
+        },
+    )
+    @patch("lifeguard.scheduler.EXECUTION_POOL")
+    def test_dispatch_async_validation_to_event_loop(self, mock_execution_pool):
+        mock_execution_pool.workers = 0
+
+        dispatch_validation("example")
+
+        mock_execution_pool.submit.assert_called_with(
+            "example", ANY, asynchronous=True, overrun="coalesce", priority=0
+        )
+        coroutine = mock_execution_pool.submit.call_args[0][1]
+        self.assertEqual(coroutine.func, run_once_async)
+        self.assertEqual(coroutine.args, ("example", mock_coroutine))
+
+    @patch(
+        "lifeguard.scheduler.VALIDATIONS",
+        {
+            "example": {
+                "ref": mock_ref,
+                "schedule": {"every": {"minutes": 1}, "overrun": "skip"},
+            }
+        },
+    )
+    @patch("lifeguard.scheduler.EXECUTION_POOL")
+    def test_dispatch_validation_with_overrun_policy(self, mock_execution_pool):
+        mock_execution_pool.workers = 2
+
+        dispatch_validation("example")
+
+        self.assertEqual(
+            mock_execution_pool.submit.call_args[1], {"overrun": "skip", "priority": 0}
+        )
+
+    @patch(
+        "lifeguard.scheduler.VALIDATIONS",
+        {"example": {"ref": mock_ref, "schedule": {}, "priority": 20}},
+    )
+    @patch("lifeguard.scheduler.EXECUTION_POOL")
+    def test_dispatch_validation_with_priority(self, mock_execution_pool):
+        mock_execution_pool.workers = 2
+
+        dispatch_validation("example")
+
+        self.assertEqual(mock_execution_pool.submit.call_args[1]["priority"], 20)
+
+    @patch(
+        "lifeguard.scheduler.VALIDATIONS",
+        {"low": {"priority": 0}, "critical": {"priority": 10}},
+    )
+    def test_run_pending_jobs_by_priority(self):
+        calls = []
+        schedule.clear()
+        try:
+            for name in ["low", "critical"]:
+                job = schedule.every(1).minutes.do(calls.append, name)
+                job.tag("validation", name)
+                job.next_run = datetime.now() - timedelta(seconds=1)
+            internal = schedule.every(15).seconds.do(calls.append, "internal")
+            internal.tag("lifeguard")
+            internal.next_run = datetime.now() - timedelta(seconds=1)
+
+            jobs = run_pending()
+        finally:
+            schedule.clear()
+
+        self.assertEqual(calls, ["internal", "critical", "low"])
+        self.assertEqual(len(jobs), 3)
+
+    @patch("lifeguard.scheduler.logger")
+    def test_failing_job_does_not_block_other_jobs(self, mock_logger):
+        calls = []
+        schedule.clear()
+        try:
+            failing = schedule.every(15).seconds.do(lambda: 1 / 0).tag("lifeguard")
+            failing.next_run = datetime.now() - timedelta(seconds=1)
+            job = schedule.every(1).minutes.do(calls.append, "validation")
+            job.tag("validation", "example")
+            job.next_run = datetime.now() - timedelta(seconds=1)
+
+            run_pending()
+            run_pending()
+        finally:
+            schedule.clear()
+
+        self.assertEqual(calls, ["validation"])
+        self.assertGreater(failing.next_run, datetime.now())
+        mock_logger.error.assert_called_once()
+
+    @patch("lifeguard.scheduler.logger")
+    def test_invalid_overrun_policy_uses_default(self, mock_logger):
+        self.assertEqual(
+            get_overrun_policy({"schedule": {"overrun": "blah"}}), "coalesce"
+        )
+        mock_logger.warning.assert_called_with(
+            "invalid overrun policy %s, using %s", "blah", "coalesce"
+        )
+
+    @patch(
+        "lifeguard.scheduler.VALIDATIONS",
+        {"example": {"ref": mock_ref, "schedule": {"every": {"minutes": 1}}}},
+    )
+    @patch("lifeguard.scheduler.EXECUTION_POOL")
+    def test_dispatch_validation_to_execution_pool(self, mock_execution_pool):
+        mock_execution_pool.workers = 2
+
+        dispatch_validation("example")
+
+        self.assertEqual(mock_execution_pool.submit.call_args[0][0], "example")
 
     def test_valid_time_periods(self):
         self.assertEqual(
@@ -123,6 +351,7 @@ class TestScheduler(unittest.TestCase):
         mock_clear_validations.assert_called_with()
 
     @patch("lifeguard.scheduler.FOREVER", False)
+    @patch("lifeguard.scheduler.LIFEGUARD_VALIDATIONS_WATCHER", "polling")
     @patch("lifeguard.scheduler.LIFEGUARD_DIRECTORY", "tests/fixtures")
     @patch("lifeguard.scheduler.configure_validations")
     @patch("lifeguard.scheduler.getmtime")
@@ -133,18 +362,58 @@ class TestScheduler(unittest.TestCase):
 
         mock_configure_validations.assert_called_with()
         self.assertEqual(
-            WATCHED_FILES, {"tests/fixtures/validations/simple_validation.yaml": 1}
+            WATCHED_FILES["tests/fixtures/validations/simple_validation.yaml"], 1
+        )
+        self.assertEqual(
+            WATCHED_FILES["tests/fixtures/validations/simple_validation.py"], 1
         )
 
     @patch("lifeguard.scheduler.WATCHED_FILES", {})
+    @patch("lifeguard.scheduler.reload_validations_files")
+    def test_check_if_should_reload_ignores_yaml_not_loaded_at_startup(
+        self, mock_reload_validations_files
+    ):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        os.makedirs(os.path.join(directory, "validations"))
+        for file_name in ["config.yaml", "a_validation.yaml"]:
+            open(os.path.join(directory, "validations", file_name), "w").close()
+
+        with patch("lifeguard.scheduler.LIFEGUARD_DIRECTORY", directory), patch(
+            "lifeguard.scheduler.logger"
+        ):
+            check_if_should_reload()
+
+        mock_reload_validations_files.assert_called_once_with(
+            {os.path.join(directory, "validations", "a_validation.yaml")}
+        )
+
+    @patch("lifeguard.scheduler.FOREVER", False)
+    @patch("lifeguard.scheduler.LIFEGUARD_METRICS_LOG_INTERVAL", 60)
+    @patch("lifeguard.scheduler.LIFEGUARD_VALIDATIONS_WATCHER", "polling")
     @patch("lifeguard.scheduler.LIFEGUARD_DIRECTORY", "tests/fixtures")
-    @patch("lifeguard.scheduler.reload_scheduler")
+    @patch("lifeguard.scheduler.configure_validations")
+    @patch("lifeguard.scheduler.schedule")
+    def test_start_scheduler_logs_counters_periodically(
+        self, mock_schedule, _mock_configure_validations
+    ):
+        start_scheduler()
+
+        mock_schedule.every.assert_any_call(60)
+        mock_schedule.every.return_value.seconds.do.assert_any_call(log_counters)
+
+    @patch("lifeguard.scheduler.WATCHED_FILES", {})
+    @patch("lifeguard.scheduler.LIFEGUARD_DIRECTORY", "tests/fixtures")
+    @patch("lifeguard.scheduler.reload_validations_files")
     @patch("lifeguard.scheduler.logger")
     def test_check_if_should_reload_with_new_file(
-        self, mock_logger, mock_reload_scheduler
+        self, mock_logger, mock_reload_validations_files
     ):
         check_if_should_reload()
-        mock_reload_scheduler.assert_called_with()
+        self.assertIn(
+            "tests/fixtures/validations/simple_validation.yaml",
+            mock_reload_validations_files.call_args[0][0],
+        )
         mock_logger.info.assert_has_calls(
             [
                 call(
@@ -159,13 +428,16 @@ class TestScheduler(unittest.TestCase):
         {"tests/fixtures/validations/simple_validation.yaml": 1},
     )
     @patch("lifeguard.scheduler.LIFEGUARD_DIRECTORY", "tests/fixtures")
-    @patch("lifeguard.scheduler.reload_scheduler")
+    @patch("lifeguard.scheduler.reload_validations_files")
     @patch("lifeguard.scheduler.logger")
     def test_check_if_should_reload_with_file_changed(
-        self, mock_logger, mock_reload_scheduler
+        self, mock_logger, mock_reload_validations_files
     ):
         check_if_should_reload()
-        mock_reload_scheduler.assert_called_with()
+        self.assertIn(
+            "tests/fixtures/validations/simple_validation.yaml",
+            mock_reload_validations_files.call_args[0][0],
+        )
         mock_logger.info.assert_has_calls(
             [
                 call(
@@ -180,13 +452,390 @@ class TestScheduler(unittest.TestCase):
         {"tests/fixtures/validations/not_exists.yaml": 1},
     )
     @patch("lifeguard.scheduler.LIFEGUARD_DIRECTORY", "tests/fixtures")
-    @patch("lifeguard.scheduler.reload_scheduler")
+    @patch("lifeguard.scheduler.reload_validations_files")
     @patch("lifeguard.scheduler.logger")
     def test_check_if_should_reload_with_file_removed(
-        self, mock_logger, mock_reload_scheduler
+        self, mock_logger, mock_reload_validations_files
     ):
         check_if_should_reload()
-        mock_reload_scheduler.assert_called_with()
+        self.assertIn(
+            "tests/fixtures/validations/not_exists.yaml",
+            mock_reload_validations_files.call_args[0][0],
+        )
         mock_logger.info.assert_has_calls(
             [call("file removed %s", "tests/fixtures/validations/not_exists.yaml")]
         )
+
+    @patch("lifeguard.scheduler.WAKE_UP_REQUESTED", False)
+    @patch("lifeguard.scheduler.WAKE_UP")
+    @patch("lifeguard.scheduler.schedule")
+    def test_wait_for_next_job_sleeps_until_next_run(self, mock_schedule, mock_wake_up):
+        mock_schedule.idle_seconds.return_value = 30
+
+        wait_for_next_job()
+
+        mock_wake_up.wait.assert_called_with(30)
+
+    @patch("lifeguard.scheduler.WAKE_UP_REQUESTED", False)
+    @patch("lifeguard.scheduler.WAKE_UP")
+    @patch("lifeguard.scheduler.schedule")
+    def test_wait_for_next_job_limit_sleep_time(self, mock_schedule, mock_wake_up):
+        mock_schedule.idle_seconds.return_value = None
+
+        wait_for_next_job()
+
+        mock_wake_up.wait.assert_called_with(60)
+
+    @patch("lifeguard.scheduler.WAKE_UP_REQUESTED", False)
+    @patch("lifeguard.scheduler.WAKE_UP")
+    @patch("lifeguard.scheduler.schedule")
+    def test_wait_for_next_job_not_sleep_when_job_is_late(
+        self, mock_schedule, mock_wake_up
+    ):
+        mock_schedule.idle_seconds.return_value = -1
+
+        wait_for_next_job()
+
+        mock_wake_up.wait.assert_not_called()
+
+    @patch("lifeguard.scheduler.schedule")
+    def test_wait_for_next_job_not_sleep_after_wake_up(self, mock_schedule):
+        mock_schedule.idle_seconds.return_value = 3600
+
+        wake_up_scheduler()
+        started_at = datetime.now()
+        wait_for_next_job()
+
+        self.assertLess((datetime.now() - started_at).total_seconds(), 1)
+
+    @patch("lifeguard.scheduler.wake_up_scheduler")
+    @patch("lifeguard.scheduler.schedule")
+    def test_trigger_validation(self, mock_schedule, mock_wake_up_scheduler):
+        job = MagicMock(name="job")
+        job.next_run = datetime(2020, 1, 1)
+        mock_schedule.get_jobs.return_value = [job]
+
+        self.assertTrue(trigger_validation("example"))
+
+        mock_schedule.get_jobs.assert_called_with("example")
+        self.assertGreater(job.next_run, datetime(2020, 1, 1))
+        mock_wake_up_scheduler.assert_called_with()
+
+    @patch(
+        "lifeguard.scheduler.VALIDATIONS",
+        {
+            "example": {
+                "ref": mock_ref,
+                "schedule": {"every": {"minutes": 1}, "jitter": 2},
+            }
+        },
+    )
+    @patch("lifeguard.scheduler.schedule")
+    def test_configure_validations_with_jitter(self, mock_schedule):
+        mock_job_instance = MagicMock(name="job_instance")
+        mock_schedule.every.return_value = mock_job_instance
+
+        configure_validations()
+
+        mock_job_instance.to.assert_called_with(3)
+
+    @patch(
+        "lifeguard.scheduler.VALIDATIONS",
+        {
+            "validation_a": {"ref": mock_ref, "schedule": {"every": {"minutes": 5}}},
+            "validation_b": {"ref": mock_ref, "schedule": {"every": {"minutes": 5}}},
+        },
+    )
+    @patch("lifeguard.scheduler.LIFEGUARD_SCHEDULER_SPREAD_JOBS", True)
+    def test_configure_validations_spread_first_runs(self):
+        configure_validations()
+        first_runs = [job.next_run for job in schedule.get_jobs("validation")]
+        schedule.clear("validation")
+
+        self.assertEqual(len(set(first_runs)), 2)
+        for first_run in first_runs:
+            self.assertLessEqual(first_run, datetime.now() + timedelta(minutes=5))
+
+    @patch(
+        "lifeguard.scheduler.VALIDATIONS",
+        {"example": {"ref": mock_ref, "schedule": {"every": {"minutes": 5}}}},
+    )
+    @patch("lifeguard.scheduler.LIFEGUARD_SCHEDULER_STATE_FILE", "state.json")
+    @patch(
+        "lifeguard.scheduler_state.SCHEDULER_STATE",
+        {
+            "example:every": {
+                "last_run": None,
+                "next_run": "2999-01-01T10:00:00",
+                "signature": "5:None:minutes:None:None",
+            }
+        },
+    )
+    def test_configure_validations_resume_saved_state(self):
+        configure_validations()
+        jobs = schedule.get_jobs("example")
+        schedule.clear("validation")
+
+        self.assertEqual(jobs[0].next_run, datetime(2999, 1, 1, 10))
+
+    def test_spread_first_run_is_deterministic(self):
+        job_a = MagicMock(name="job_a")
+        job_b = MagicMock(name="job_b")
+
+        spread_first_run(job_a, "validation", 1, "hours")
+        spread_first_run(job_b, "validation", 1, "hours")
+
+        self.assertAlmostEqual(
+            job_a.next_run, job_b.next_run, delta=timedelta(seconds=1)
+        )
+
+    def test_spread_first_run_ignore_week_days(self):
+        job = MagicMock(name="job")
+        job.next_run = None
+
+        spread_first_run(job, "validation", 1, "monday")
+
+        self.assertIsNone(job.next_run)
+
+    @patch(
+        "lifeguard.scheduler.VALIDATIONS",
+        {
+            "example": {
+                "ref": mock_ref,
+                "schedule": {
+                    "every_when_normal": {"minutes": 4},
+                    "every_when_problem": {"seconds": 30},
+                },
+            }
+        },
+    )
+    @patch("lifeguard.scheduler.ADAPTIVE_JOBS", {})
+    @patch("lifeguard.scheduler.wake_up_scheduler")
+    def test_adapt_schedule_from_last_status(self, _mock_wake_up):
+        configure_validations()
+        job = schedule.get_jobs("example")[0]
+        job.last_run = datetime(2024, 1, 1, 10)
+        intervals = [job.interval]
+
+        try:
+            for status in [PROBLEM, PROBLEM, NORMAL, NORMAL, NORMAL, NORMAL]:
+                adapt_schedule("example", ValidationResponse(status, {}))
+                intervals.append(job.interval)
+        finally:
+            schedule.clear("validation")
+
+        self.assertEqual(intervals, [240, 30, 30, 60, 120, 240, 240])
+        self.assertEqual(job.next_run, datetime(2024, 1, 1, 10, 4))
+
+    @patch(
+        "lifeguard.scheduler.VALIDATIONS",
+        {
+            "example": {
+                "ref": MagicMock(return_value=ValidationResponse(PROBLEM, {})),
+                "schedule": {
+                    "every_when_normal": {"minutes": 4},
+                    "every_when_problem": {"seconds": 30},
+                },
+            }
+        },
+    )
+    @patch("lifeguard.scheduler.ADAPTIVE_JOBS", {})
+    @patch("lifeguard.scheduler.wake_up_scheduler")
+    @patch("lifeguard.scheduler.EXECUTION_POOL")
+    def test_adaptive_validation_rescheduled_after_run(
+        self, mock_execution_pool, _mock_wake_up
+    ):
+        mock_execution_pool.workers = 0
+        configure_validations()
+        job = schedule.get_jobs("example")[0]
+
+        try:
+            job.run()
+        finally:
+            schedule.clear("validation")
+
+        self.assertEqual(job.interval, 30)
+        self.assertAlmostEqual(
+            job.next_run,
+            datetime.now() + timedelta(seconds=30),
+            delta=timedelta(seconds=2),
+        )
+
+    @patch("lifeguard.scheduler.FOREVER", False)
+    @patch("lifeguard.scheduler.LIFEGUARD_METRICS_LOG_INTERVAL", 0)
+    @patch("lifeguard.scheduler.LIFEGUARD_VALIDATIONS_WATCHER", "auto")
+    @patch("lifeguard.scheduler.LIFEGUARD_DIRECTORY", "tests/fixtures")
+    @patch("lifeguard.scheduler.inotify_available")
+    @patch("lifeguard.scheduler.InotifyWatcher")
+    @patch("lifeguard.scheduler.configure_validations")
+    @patch("lifeguard.scheduler.schedule")
+    def test_start_scheduler_with_inotify(
+        self,
+        mock_schedule,
+        _mock_configure_validations,
+        mock_inotify_watcher,
+        mock_inotify_available,
+    ):
+        mock_inotify_available.return_value = True
+
+        start_scheduler()
+
+        mock_inotify_watcher.return_value.start.assert_called_with()
+        mock_schedule.every.assert_not_called()
+
+    @patch("lifeguard.scheduler.FOREVER", False)
+    @patch("lifeguard.scheduler.LIFEGUARD_METRICS_LOG_INTERVAL", 0)
+    @patch("lifeguard.scheduler.LIFEGUARD_VALIDATIONS_WATCHER", "auto")
+    @patch("lifeguard.scheduler.LIFEGUARD_DIRECTORY", "tests/fixtures")
+    @patch("lifeguard.scheduler.inotify_available")
+    @patch("lifeguard.scheduler.InotifyWatcher")
+    @patch("lifeguard.scheduler.configure_validations")
+    @patch("lifeguard.scheduler.schedule")
+    def test_start_scheduler_fallback_to_polling(
+        self,
+        mock_schedule,
+        _mock_configure_validations,
+        mock_inotify_watcher,
+        mock_inotify_available,
+    ):
+        mock_inotify_available.return_value = False
+
+        start_scheduler()
+
+        mock_inotify_watcher.assert_not_called()
+        mock_schedule.every.assert_called_with(15)
+
+    @patch("lifeguard.scheduler.WATCHED_FILES", {})
+    @patch("lifeguard.scheduler.wake_up_scheduler")
+    @patch("lifeguard.scheduler.reload_validations_files")
+    @patch("lifeguard.scheduler.logger")
+    def test_reload_changed_files(
+        self, mock_logger, mock_reload_validations_files, mock_wake_up_scheduler
+    ):
+        notify_changed_files(["tests/fixtures/validations/simple_validation.yaml"])
+        mock_wake_up_scheduler.assert_called_with()
+
+        reload_changed_files()
+        reload_changed_files()
+
+        mock_reload_validations_files.assert_called_once_with(
+            {"tests/fixtures/validations/simple_validation.yaml"}
+        )
+        mock_logger.info.assert_called_with(
+            "file changed %s", "tests/fixtures/validations/simple_validation.yaml"
+        )
+
+    @patch(
+        "lifeguard.scheduler.WATCHED_FILES",
+        {"tests/fixtures/validations/not_exists.yaml": 1},
+    )
+    @patch("lifeguard.scheduler.wake_up_scheduler")
+    @patch("lifeguard.scheduler.reload_validations_files")
+    @patch("lifeguard.scheduler.logger")
+    def test_reload_removed_files(
+        self, mock_logger, mock_reload_validations_files, _mock_wake_up_scheduler
+    ):
+        notify_changed_files(["tests/fixtures/validations/not_exists.yaml"])
+
+        reload_changed_files()
+
+        mock_reload_validations_files.assert_called_once_with(
+            {"tests/fixtures/validations/not_exists.yaml"}
+        )
+        mock_logger.info.assert_called_with(
+            "file removed %s", "tests/fixtures/validations/not_exists.yaml"
+        )
+
+    @patch("lifeguard.scheduler.wake_up_scheduler")
+    @patch("lifeguard.scheduler.reload_validations_files")
+    @patch("lifeguard.scheduler.check_if_should_reload")
+    def test_resync_all_files_when_requested(
+        self,
+        mock_check_if_should_reload,
+        mock_reload_validations_files,
+        mock_wake_up_scheduler,
+    ):
+        notify_changed_files(["tests/fixtures/validations/simple_validation.yaml"])
+        request_resync()
+        mock_wake_up_scheduler.assert_called_with()
+
+        reload_changed_files()
+        reload_changed_files()
+
+        mock_check_if_should_reload.assert_called_once_with()
+        mock_reload_validations_files.assert_not_called()
+
+
+class TestIncrementalReload(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.file_a = self.write("a_validation.yaml", "yaml_validation_a", "a")
+        self.file_b = self.write("b_validation.yaml", "yaml_validation_b", "b")
+
+    def tearDown(self):
+        schedule.clear("validation")
+        for name in ["yaml_validation_a", "yaml_validation_b"]:
+            VALIDATIONS.pop(name, None)
+        shutil.rmtree(self.directory)
+
+    def write(self, file_name, name, description):
+        file_path = os.path.join(self.directory, file_name)
+        with open(file_path, "w") as file:
+            file.write(YAML_VALIDATION.format(name=name, description=description))
+        return file_path
+
+    @patch("lifeguard.validations.logger")
+    def test_reload_only_changed_files(self, _mock_logger):
+        reload_validations_files({self.file_a, self.file_b})
+        job_b = schedule.get_jobs("yaml_validation_b")[0]
+        job_b.next_run = datetime(2030, 1, 1)
+
+        self.write("a_validation.yaml", "yaml_validation_a", "changed")
+        reload_validations_files({self.file_a})
+
+        self.assertEqual(VALIDATIONS["yaml_validation_a"]["description"], "changed")
+        self.assertEqual(len(schedule.get_jobs("yaml_validation_a")), 1)
+        self.assertEqual(schedule.get_jobs("yaml_validation_b"), [job_b])
+        self.assertEqual(job_b.next_run, datetime(2030, 1, 1))
+
+    @patch("lifeguard.validations.logger")
+    def test_reload_removed_file(self, _mock_logger):
+        reload_validations_files({self.file_a, self.file_b})
+
+        os.remove(self.file_a)
+        reload_validations_files({self.file_a})
+
+        self.assertNotIn("yaml_validation_a", VALIDATIONS)
+        self.assertEqual(schedule.get_jobs("yaml_validation_a"), [])
+        self.assertEqual(len(schedule.get_jobs("yaml_validation_b")), 1)
+
+    @patch("lifeguard.scheduler.save_scheduler_state")
+    @patch("lifeguard.scheduler.LIFEGUARD_SCHEDULER_STATE_FILE", "state.json")
+    @patch("lifeguard.validations.logger")
+    def test_reload_removed_file_prunes_its_state(
+        self, _mock_logger, mock_save_scheduler_state
+    ):
+        with patch.dict("lifeguard.scheduler_state.SCHEDULER_STATE", clear=True):
+            reload_validations_files({self.file_a, self.file_b})
+            update_scheduler_state(schedule.get_jobs("validation"))
+
+            os.remove(self.file_a)
+            reload_validations_files({self.file_a})
+
+            self.assertEqual(list(SCHEDULER_STATE), ["yaml_validation_b:every"])
+        mock_save_scheduler_state.assert_called_with("state.json")
+
+    @patch("lifeguard.scheduler.logger")
+    @patch("lifeguard.validations.logger")
+    def test_keep_other_files_when_file_is_invalid(
+        self, _mock_validations_logger, mock_logger
+    ):
+        reload_validations_files({self.file_b})
+        invalid_file = os.path.join(self.directory, "invalid_validation.yaml")
+        with open(invalid_file, "w") as file:
+            file.write("validations: [")
+
+        reload_validations_files({invalid_file})
+
+        mock_logger.error.assert_called()
+        self.assertEqual(len(schedule.get_jobs("yaml_validation_b")), 1)
@@ -0,0 +1,106 @@
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import schedule
+
+from lifeguard.scheduler_state import (
+    SCHEDULER_STATE,
+    build_job_key,
+    load_scheduler_state,
+    prune_scheduler_state,
+    restore_job,
+    save_scheduler_state,
+    update_scheduler_state,
+)
+
+
+def job_func():
+    pass
+
+
+class TestSchedulerState(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = schedule.Scheduler()
+        self.directory = tempfile.mkdtemp()
+        self.state_file = os.path.join(self.directory, "state.json")
+        SCHEDULER_STATE.clear()
+
+    def tearDown(self):
+        SCHEDULER_STATE.clear()
+        shutil.rmtree(self.directory)
+
+    def build_every_job(self, minutes=10):
+        return (
+            self.scheduler.every(minutes)
+            .minutes.do(job_func)
+            .tag("validation", "example")
+        )
+
+    def test_build_job_key(self):
+        self.assertEqual(build_job_key(self.build_every_job()), "example:every")
+        at_job = (
+            self.scheduler.every().day.at("10:00").do(job_func).tag("validation", "x")
+        )
+        self.assertEqual(build_job_key(at_job), "x:at")
+
+    def test_save_and_restore_next_run(self):
+        job = self.build_every_job()
+        job.next_run = datetime.now() + timedelta(minutes=7)
+        self.assertTrue(update_scheduler_state([job]))
+        self.assertFalse(update_scheduler_state([job]))
+        save_scheduler_state(self.state_file)
+
+        load_scheduler_state(self.state_file)
+        restarted_job = self.build_every_job()
+
+        self.assertTrue(restore_job(restarted_job))
+        self.assertEqual(restarted_job.next_run, job.next_run)
+
+    def test_run_missed_job_once(self):
+        job = self.build_every_job()
+        job.next_run = datetime.now() - timedelta(hours=2)
+        update_scheduler_state([job])
+        now = datetime.now()
+
+        restarted_job = self.build_every_job()
+        restore_job(restarted_job, now)
+
+        self.assertEqual(restarted_job.next_run, now)
+
+    def test_ignore_state_when_schedule_changed(self):
+        job = self.build_every_job(10)
+        update_scheduler_state([job])
+
+        restarted_job = self.build_every_job(5)
+        next_run = restarted_job.next_run
+
+        self.assertFalse(restore_job(restarted_job))
+        self.assertEqual(restarted_job.next_run, next_run)
+
+    def test_prune_state_of_jobs_not_scheduled(self):
+        job = self.build_every_job()
+        update_scheduler_state([job])
+        SCHEDULER_STATE["removed:every"] = {}
+
+        self.assertTrue(prune_scheduler_state([job]))
+        self.assertFalse(prune_scheduler_state([job]))
+        self.assertEqual(list(SCHEDULER_STATE), ["example:every"])
+
+    def test_load_missing_file(self):
+        SCHEDULER_STATE["key"] = {}
+        load_scheduler_state(self.state_file)
+        self.assertEqual(SCHEDULER_STATE, {})
+
+    @patch("lifeguard.scheduler_state.logger")
+    def test_load_invalid_file(self, mock_logger):
+        with open(self.state_file, "w") as state_file:
+            state_file.write("{")
+
+        load_scheduler_state(self.state_file)
+
+        mock_logger.warning.assert_called()
+        self.assertEqual(SCHEDULER_STATE, {})
@@ -1,13 +1,17 @@
 import json
+import shutil
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 
 from lifeguard import NORMAL, PROBLEM
 from lifeguard.server import (
     execute_validation,
+    get_metrics,
     validation_endpoint,
     get_status,
     get_status_complete,
+    trigger_validation_endpoint,
 )
 from lifeguard.validations import ValidationResponse
 
@@ -18,6 +22,13 @@ VALIDATIONS = {"test_validation": {"ref": test_validation}}
 
 
 class TestServer(unittest.TestCase):
+    def setUp(self):
+        self.locks_directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.locks_directory)
+        patcher = patch("lifeguard.single_flight.LOCKS_DIRECTORY", self.locks_directory)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     @patch("lifeguard.server.make_response")
     @patch("lifeguard.server.VALIDATIONS", VALIDATIONS)
     def test_execute_validation(self, mock_make_response):
@@ -45,6 +56,41 @@ class TestServer(unittest.TestCase):
             extra={"traceback": "traceback"},
         )
 
+    @patch("lifeguard.server.make_response")
+    @patch("lifeguard.server.trigger_validation")
+    def test_trigger_validation(self, mock_trigger_validation, mock_make_response):
+        mock_trigger_validation.return_value = True
+
+        trigger_validation_endpoint("test_validation")
+
+        mock_trigger_validation.assert_called_with("test_validation")
+        mock_make_response.assert_called_with(json.dumps({"status": "triggered"}))
+
+    @patch("lifeguard.server.make_response")
+    @patch("lifeguard.server.trigger_validation")
+    def test_trigger_validation_not_scheduled(
+        self, mock_trigger_validation, mock_make_response
+    ):
+        mock_trigger_validation.return_value = False
+
+        response = trigger_validation_endpoint("test_validation")
+
+        self.assertEqual(response.status_code, 404)
+        mock_make_response.assert_called_with(
+            json.dumps({"error": "validation test_validation is not scheduled"})
+        )
+
+    @patch("lifeguard.server.make_response")
+    @patch("lifeguard.server.read_counters")
+    def test_get_metrics(self, mock_read_counters, mock_make_response):
+        mock_read_counters.return_value = {"validation": {"skipped": 1}}
+
+        get_metrics()
+
+        mock_make_response.assert_called_with(
+            json.dumps({"validation": {"skipped": 1}})
+        )
+
     @patch("lifeguard.server.make_response")
     @patch("lifeguard.server.ValidationRepository")
     @patch("lifeguard.server.request")
@@ -0,0 +1,122 @@
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from lifeguard.repositories import IMPLEMENTATIONS
+from lifeguard.sharding import (
+    SHARDING,
+    HashRing,
+    SQLiteCoordinationRepository,
+    heartbeat,
+    owns_validation,
+)
+
+VALIDATION_NAMES = [f"validation_{index}" for index in range(1000)]
+
+
+class TestHashRing(unittest.TestCase):
+    def test_empty_ring(self):
+        self.assertIsNone(HashRing([]).get_node("validation"))
+
+    def test_distribute_keys_between_nodes(self):
+        ring = HashRing(["node_a", "node_b", "node_c"])
+        nodes = [ring.get_node(name) for name in VALIDATION_NAMES]
+
+        for node in ["node_a", "node_b", "node_c"]:
+            self.assertGreater(nodes.count(node), 200)
+
+    def test_move_only_keys_of_new_node(self):
+        before = HashRing(["node_a", "node_b", "node_c"])
+        after = HashRing(["node_a", "node_b", "node_c", "node_d"])
+
+        moved = [
+            name
+            for name in VALIDATION_NAMES
+            if before.get_node(name) != after.get_node(name)
+        ]
+
+        self.assertLess(len(moved), 400)
+        self.assertTrue(all(after.get_node(name) == "node_d" for name in moved))
+
+
+class TestSQLiteCoordinationRepository(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.repository = SQLiteCoordinationRepository(
+            os.path.join(self.directory, "coordination.db")
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_fetch_only_active_nodes(self):
+        now = datetime.now()
+        self.repository.register_node("node_a", now)
+        self.repository.register_node("node_b", now - timedelta(minutes=5))
+
+        self.assertEqual(
+            self.repository.fetch_active_nodes(now - timedelta(minutes=1)),
+            ["node_a"],
+        )
+
+    def test_unregister_node(self):
+        now = datetime.now()
+        self.repository.register_node("node_a", now)
+        self.repository.unregister_node("node_a")
+
+        self.assertEqual(self.repository.fetch_active_nodes(now), [])
+
+
+class TestSharding(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.repository = SQLiteCoordinationRepository(
+            os.path.join(self.directory, "coordination.db")
+        )
+        self.previous_implementation = IMPLEMENTATIONS.get("coordination")
+        IMPLEMENTATIONS["coordination"] = self.repository
+        SHARDING.update({"nodes": [], "ring": None})
+
+    def tearDown(self):
+        IMPLEMENTATIONS.pop("coordination")
+        if self.previous_implementation:
+            IMPLEMENTATIONS["coordination"] = self.previous_implementation
+        SHARDING.update({"nodes": [], "ring": None})
+        shutil.rmtree(self.directory)
+
+    @patch("lifeguard.sharding.LIFEGUARD_SCHEDULER_SHARDING_ENABLED", False)
+    def test_own_all_validations_without_sharding(self):
+        self.assertTrue(owns_validation("validation"))
+
+    @patch("lifeguard.sharding.LIFEGUARD_SCHEDULER_SHARDING_ENABLED", True)
+    @patch("lifeguard.sharding.logger")
+    def test_split_validations_between_nodes(self, _mock_logger):
+        owned = {}
+        for node in ["node_a", "node_b"]:
+            with patch("lifeguard.sharding.NODE_ID", node):
+                heartbeat()
+
+        for node in ["node_a", "node_b"]:
+            with patch("lifeguard.sharding.NODE_ID", node):
+                heartbeat()
+                owned[node] = {
+                    name for name in VALIDATION_NAMES if owns_validation(name)
+                }
+
+        self.assertEqual(owned["node_a"] | owned["node_b"], set(VALIDATION_NAMES))
+        self.assertEqual(owned["node_a"] & owned["node_b"], set())
+
+    @patch("lifeguard.sharding.LIFEGUARD_SCHEDULER_SHARDING_ENABLED", True)
+    @patch("lifeguard.sharding.LIFEGUARD_SCHEDULER_NODE_TTL", 30)
+    @patch("lifeguard.sharding.NODE_ID", "node_a")
+    @patch("lifeguard.sharding.logger")
+    def test_ignore_nodes_without_heartbeat(self, _mock_logger):
+        self.repository.register_node("node_b", datetime.now() - timedelta(minutes=5))
+
+        heartbeat()
+
+        self.assertEqual(SHARDING["nodes"], ["node_a"])
+        self.assertTrue(all(owns_validation(name) for name in VALIDATION_NAMES))
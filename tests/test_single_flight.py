@@ -0,0 +1,210 @@
+import asyncio
+import fcntl
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from lifeguard import NORMAL, PROBLEM, single_flight
+from lifeguard.single_flight import IN_FLIGHT, run_once, run_once_async
+from lifeguard.validations import ValidationResponse
+
+
+class TestSingleFlight(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        patcher = patch("lifeguard.single_flight.LOCKS_DIRECTORY", self.directory)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        IN_FLIGHT.clear()
+
+    def __lock_path(self, validation_name, extension="lock"):
+        digest = hashlib.md5(validation_name.encode()).hexdigest()
+        return os.path.join(self.directory, f"{digest}.{extension}")
+
+    def __run_in_thread(self, function, results):
+        thread = threading.Thread(
+            target=lambda: results.append(run_once("validation", function))
+        )
+        thread.start()
+        return thread
+
+    @patch("lifeguard.single_flight.logger")
+    def test_concurrent_callers_share_running_execution(self, mock_logger):
+        release = threading.Event()
+        response = ValidationResponse(NORMAL, {})
+        function = MagicMock(side_effect=lambda: release.wait(1) and response)
+        results = []
+
+        leader = self.__run_in_thread(function, results)
+        while "validation" not in IN_FLIGHT:
+            time.sleep(0.001)
+        follower = self.__run_in_thread(function, results)
+        while not mock_logger.info.called:
+            time.sleep(0.001)
+        release.set()
+        leader.join()
+        follower.join()
+
+        function.assert_called_once_with()
+        self.assertEqual(results, [response, response])
+        self.assertNotIn("validation", IN_FLIGHT)
+
+    @patch("lifeguard.single_flight.logger")
+    def test_waiter_receives_exception_of_running_execution(self, mock_logger):
+        release = threading.Event()
+        function = MagicMock(side_effect=lambda: release.wait(1) and 1 / 0)
+        errors = []
+
+        def execute():
+            try:
+                run_once("validation", function)
+            except ZeroDivisionError as exception:
+                errors.append(exception)
+
+        threads = [threading.Thread(target=execute) for _ in range(2)]
+        threads[0].start()
+        while "validation" not in IN_FLIGHT:
+            time.sleep(0.001)
+        threads[1].start()
+        while not mock_logger.info.called:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        function.assert_called_once_with()
+        self.assertEqual(len(errors), 2)
+
+    @patch("lifeguard.single_flight.ValidationRepository")
+    def test_use_result_saved_by_another_process(self, mock_repository):
+        response = ValidationResponse(
+            NORMAL, {}, last_execution=datetime.now() + timedelta(seconds=1)
+        )
+        mock_repository.return_value.fetch_last_validation_result.return_value = (
+            response
+        )
+        function = MagicMock(name="function")
+        results = []
+
+        with open(self.__lock_path("validation"), "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            thread = self.__run_in_thread(function, results)
+            time.sleep(0.05)
+            fcntl.flock(lock, fcntl.LOCK_UN)
+        thread.join()
+
+        function.assert_not_called()
+        self.assertEqual(results, [response])
+
+    @patch("lifeguard.single_flight.ValidationRepository")
+    def test_execute_when_another_process_saved_no_newer_result(self, mock_repository):
+        mock_repository.return_value.fetch_last_validation_result.return_value = (
+            ValidationResponse(
+                NORMAL, {}, last_execution=datetime.now() - timedelta(hours=1)
+            )
+        )
+        response = ValidationResponse(NORMAL, {})
+        results = []
+
+        with open(self.__lock_path("validation"), "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            thread = self.__run_in_thread(lambda: response, results)
+            time.sleep(0.05)
+            fcntl.flock(lock, fcntl.LOCK_UN)
+        thread.join()
+
+        self.assertEqual(results, [response])
+
+    @patch("lifeguard.single_flight.ValidationRepository")
+    def test_execute_when_saved_result_has_no_last_execution_date(
+        self, mock_repository
+    ):
+        for last_execution in [None, "2999-01-01T10:00"]:
+            mock_repository.return_value.fetch_last_validation_result.return_value = (
+                ValidationResponse(NORMAL, {}, last_execution=last_execution)
+            )
+            response = ValidationResponse(NORMAL, {})
+            results = []
+
+            with open(self.__lock_path("validation"), "a") as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                thread = self.__run_in_thread(lambda: response, results)
+                time.sleep(0.05)
+                fcntl.flock(lock, fcntl.LOCK_UN)
+            thread.join()
+
+            self.assertEqual(results, [response])
+
+    @patch("lifeguard.single_flight.ValidationRepository")
+    def test_use_result_published_by_another_process(self, mock_repository):
+        publish_result = vars(single_flight)["__publish_result"]
+        function = MagicMock(name="function")
+        results = []
+
+        with open(self.__lock_path("validation"), "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            thread = self.__run_in_thread(function, results)
+            time.sleep(0.05)
+            publish_result("validation", ValidationResponse(PROBLEM, {"value": 1}))
+            fcntl.flock(lock, fcntl.LOCK_UN)
+        thread.join()
+
+        function.assert_not_called()
+        mock_repository.assert_not_called()
+        self.assertEqual(results[0].status, PROBLEM)
+        self.assertEqual(results[0].details, {"value": 1})
+        self.assertEqual(results[0].validation_name, "validation")
+
+    def test_publish_result_of_execution(self):
+        response = ValidationResponse(NORMAL, {"value": 1})
+
+        run_once("validation", lambda: response)
+
+        self.assertTrue(os.path.exists(self.__lock_path("validation", "json")))
+
+    def test_lock_file_of_validation_name_with_slashes(self):
+        response = ValidationResponse(NORMAL, {})
+
+        self.assertEqual(
+            run_once("endpoints.http://service-a", lambda: response), response
+        )
+        self.assertTrue(os.path.exists(self.__lock_path("endpoints.http://service-a")))
+
+    @patch("lifeguard.single_flight.logger")
+    def test_coroutine_shares_execution_with_running_function(self, mock_logger):
+        release = threading.Event()
+        response = ValidationResponse(NORMAL, {})
+        function = MagicMock(side_effect=lambda: release.wait(1) and response)
+        coroutine_function = MagicMock(name="coroutine_function")
+        results = []
+
+        leader = self.__run_in_thread(function, results)
+        while "validation" not in IN_FLIGHT:
+            time.sleep(0.001)
+        threading.Timer(0.05, release.set).start()
+        result = asyncio.run(run_once_async("validation", coroutine_function))
+        leader.join()
+
+        coroutine_function.assert_not_called()
+        self.assertEqual(result, response)
+        self.assertEqual(results, [response])
+
+    def test_execute_coroutine_when_not_running(self):
+        response = ValidationResponse(NORMAL, {})
+
+        async def coroutine_function():
+            return response
+
+        self.assertEqual(
+            asyncio.run(run_once_async("validation", coroutine_function)), response
+        )
+        self.assertNotIn("validation", IN_FLIGHT)
@@ -1,12 +1,32 @@
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
 import unittest
+import yaml
+from concurrent.futures import ProcessPoolExecutor
 
-from unittest.mock import patch, call
+from unittest.mock import MagicMock, patch, call
 
 from lifeguard import NORMAL, PROBLEM
+from lifeguard.dispatcher import ActionDispatcher
+from lifeguard.event_loop import SharedEventLoop
+from lifeguard.limits import SEMAPHORES
+from lifeguard.metrics import clear_counters, read_counters
 from lifeguard.validations import (
     ValidationResponse,
+    build_validations_manifest,
+    validation,
     load_validations,
+    load_validations_file,
+    unload_validations_file,
+    FILE_VALIDATIONS,
+    FINGERPRINTS,
     VALIDATIONS,
+    YAML_CACHE,
 )
 
 from tests.fixtures.validations.simple_validation_with_action_on_errors import (
@@ -103,11 +123,53 @@ class TestValidations(unittest.TestCase):
         response = VALIDATIONS["simple_validation_with_error_in_yaml"]["ref"]()
         self.assertEqual(response.status, PROBLEM)
 
+    @patch("lifeguard.validations.LIFEGUARD_DIRECTORY", "tests/fixtures")
+    @patch.dict("lifeguard.validations.YAML_CACHE", clear=True)
+    @patch("lifeguard.validations.LIFEGUARD_VALIDATIONS_LOADING_WORKERS", 2)
+    @patch("lifeguard.validations.logger")
+    def test_parse_yaml_files_in_parallel(self, mock_logger):
+        with patch(
+            "lifeguard.validations.ProcessPoolExecutor", wraps=ProcessPoolExecutor
+        ) as mock_executor:
+            load_validations()
+
+        mock_executor.assert_called_with(max_workers=2)
+        mock_logger.warning.assert_not_called()
+        self.assertEqual(
+            VALIDATIONS["simple_validation_with_action_in_yaml"]["schedule"],
+            {"every": {"minutes": 1}},
+        )
+        self.assertIn("batch_validation_in_yaml.up", VALIDATIONS)
+
+    @patch("lifeguard.validations.logger")
+    def test_report_unresolved_command_with_file_and_line(self, mock_logger):
+        load_validations_file("tests/fixtures/validations/simple_validation.yaml")
+
+        mock_logger.error.assert_called_with(
+            "error on resolve command %s in %s:%s: %s",
+            "tests.fixtures.validations.shared.common_validation.not_exists",
+            "tests/fixtures/validations/simple_validation.yaml",
+            27,
+            "module 'tests.fixtures.validations.shared.common_validation' has no attribute 'not_exists'",
+        )
+
+    def test_resolve_yaml_command_only_on_load(self):
+        load_validations_file("tests/fixtures/validations/simple_validation.yaml")
+
+        with patch(
+            "lifeguard.validations.__load_function_from_module"
+        ) as mock_load_function:
+            response = VALIDATIONS["simple_validation_with_action_in_yaml"]["ref"]()
+
+        mock_load_function.assert_not_called()
+        self.assertEqual(response.status, NORMAL)
+
     @patch("lifeguard.validations.LIFEGUARD_DIRECTORY", "tests/fixtures")
     @patch(
         "lifeguard.validations.LIFEGUARD_RUN_ONLY_VALIDATIONS",
         ["simple_with_action_validation"],
     )
+    @patch.dict("lifeguard.validations.FILTERS")
     @patch("lifeguard.validations.logger")
     def test_execute_validation_because_in_list(self, mock_logger):
         load_validations()
@@ -123,11 +185,13 @@ class TestValidations(unittest.TestCase):
         "lifeguard.validations.LIFEGUARD_RUN_ONLY_VALIDATIONS",
         ["simple_validation"],
     )
+    @patch.dict("lifeguard.validations.FILTERS")
     @patch("lifeguard.validations.logger")
     def test_not_execute_validation_because_not_in_list(self, mock_logger):
         load_validations()
         self.assertIsNone(VALIDATIONS["simple_with_action_validation"]["ref"]())
-        mock_logger.info.assert_called_with(
+        self.assertTrue(VALIDATIONS["simple_with_action_validation"]["filtered"])
+        mock_logger.info.assert_any_call(
             "validation %s not in LIFEGUARD_RUN_ONLY_VALIDATIONS",
             "simple_with_action_validation",
         )
@@ -137,6 +201,7 @@ class TestValidations(unittest.TestCase):
         "lifeguard.validations.LIFEGUARD_SKIP_VALIDATIONS",
         ["simple_validation"],
     )
+    @patch.dict("lifeguard.validations.FILTERS")
     @patch("lifeguard.validations.logger")
     def test_execute_validation_because_not_in_skip_list(self, mock_logger):
         load_validations()
@@ -152,20 +217,23 @@ class TestValidations(unittest.TestCase):
         "lifeguard.validations.LIFEGUARD_SKIP_VALIDATIONS",
         ["simple_with_action_validation"],
     )
+    @patch.dict("lifeguard.validations.FILTERS")
     @patch("lifeguard.validations.logger")
     def test_not_execute_validation_because_in_skip_list(self, mock_logger):
         load_validations()
         self.assertIsNone(VALIDATIONS["simple_with_action_validation"]["ref"]())
-        mock_logger.info.assert_called_with(
+        self.assertTrue(VALIDATIONS["simple_with_action_validation"]["filtered"])
+        mock_logger.info.assert_any_call(
             "validation %s in LIFEGUARD_SKIP_VALIDATIONS",
             "simple_with_action_validation",
         )
 
     @patch("lifeguard.validations.LIFEGUARD_DIRECTORY", "tests/fixtures")
     @patch("lifeguard.validations.logger")
+    @patch("lifeguard.validations.TRACEBACKS", {})
     @patch("lifeguard.validations.traceback")
     def test_execute_validation_with_invalid_action(self, mock_traceback, mock_logger):
-        mock_traceback.format_exc.return_value = "traceback"
+        mock_traceback.format_exception.return_value = ["trace", "back"]
         load_validations()
         result = VALIDATIONS["simple_with_invalid_action_validation"]["ref"]()
         mock_logger.error.assert_called_with(
@@ -178,11 +246,12 @@ class TestValidations(unittest.TestCase):
 
     @patch("lifeguard.validations.LIFEGUARD_DIRECTORY", "tests/fixtures")
     @patch("lifeguard.validations.logger")
+    @patch("lifeguard.validations.TRACEBACKS", {})
     @patch("lifeguard.validations.traceback")
     def test_execute_validation_with_error_and_error_actions(
         self, mock_traceback, mock_logger
     ):
-        mock_traceback.format_exc.return_value = "traceback"
+        mock_traceback.format_exception.return_value = ["trace", "back"]
         load_validations()
         VALIDATIONS["simple_validation_with_action_on_errors"]["ref"]()
 
@@ -202,3 +271,765 @@ class TestValidations(unittest.TestCase):
         )
         self.assertEqual(response.status, "PROBLEM")
         self.assertEqual(settings, {})
+
+    @patch("lifeguard.validations.LIFEGUARD_DIRECTORY", "tests/fixtures")
+    @patch("lifeguard.validations.logger")
+    def test_execute_validation_with_timeout(self, mock_logger):
+        clear_counters()
+        load_validations()
+        response = VALIDATIONS["simple_with_timeout_validation"]["ref"]()
+
+        self.assertEqual(response.status, PROBLEM)
+        self.assertEqual(
+            response.details["exception"], "validation timed out after 0.1 seconds"
+        )
+        self.assertEqual(
+            read_counters("simple_with_timeout_validation"),
+            {"executions": 1, "timeouts": 1},
+        )
+
+    @patch("lifeguard.validations.LIFEGUARD_DIRECTORY", "tests/fixtures")
+    @patch("lifeguard.validations.logger")
+    def test_count_failures_apart_from_timeouts(self, _mock_logger):
+        clear_counters()
+        load_validations()
+        VALIDATIONS["simple_with_invalid_action_validation"]["ref"]()
+
+        self.assertEqual(
+            read_counters("simple_with_invalid_action_validation"),
+            {"executions": 1, "failures": 1},
+        )
+
+    @patch("lifeguard.validations.logger")
+    def test_do_not_overlap_execution_abandoned_by_timeout(self, _mock_logger):
+        release = threading.Event()
+        calls = []
+
+        @validation(timeout=0.05)
+        def hanging_validation():
+            calls.append(1)
+            release.wait(1)
+            return ValidationResponse(NORMAL, {})
+
+        try:
+            first = hanging_validation()
+            second = hanging_validation()
+        finally:
+            release.set()
+            VALIDATIONS.pop("hanging_validation", None)
+
+        self.assertEqual(first.status, PROBLEM)
+        self.assertEqual(second.status, PROBLEM)
+        self.assertIn("previous execution still running", second.details["exception"])
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(read_counters("hanging_validation")["timeouts"], 2)
+
+    @patch("lifeguard.validations.LIFEGUARD_DIRECTORY", "tests/fixtures")
+    @patch("tests.fixtures.validations.shared.common_validation.logger")
+    def test_execute_validation_with_timeout_defined_from_yaml(self, _mock_logger):
+        load_validations()
+        response = VALIDATIONS["simple_validation_with_timeout_in_yaml"]["ref"]()
+
+        self.assertEqual(response.status, NORMAL)
+        self.assertEqual(response.details, {"arg": "arg"})
+        self.assertEqual(
+            VALIDATIONS["simple_validation_with_timeout_in_yaml"]["timeout"], 5
+        )
+
+    @patch("lifeguard.validations.LIFEGUARD_DIRECTORY", "tests/fixtures")
+    @patch("lifeguard.validations.logger")
+    def test_execute_async_validation(self, mock_logger):
+        load_validations()
+        response = VALIDATIONS["simple_async_validation"]["ref"]()
+
+        self.assertEqual(response.status, NORMAL)
+        self.assertIsNotNone(VALIDATIONS["simple_async_validation"]["coroutine"])
+        mock_logger.info.assert_called_with(
+            "executing action %s with result %s...",
+            "async_action",
+            "{'validation_name': 'simple_async_validation', 'status': 'NORMAL', 'details': {}, 'settings': None}",
+        )
+
+    @patch("lifeguard.validations.LIFEGUARD_DIRECTORY", "tests/fixtures")
+    @patch("lifeguard.validations.logger")
+    def test_execute_async_validation_with_timeout(self, _mock_logger):
+        load_validations()
+        response = VALIDATIONS["simple_async_with_timeout_validation"]["ref"]()
+
+        self.assertEqual(response.status, PROBLEM)
+        self.assertEqual(
+            response.details["exception"], "validation timed out after 0.1 seconds"
+        )
+
+    @patch("lifeguard.validations.LIFEGUARD_DIRECTORY", "tests/fixtures")
+    @patch("lifeguard.validations.logger")
+    def test_sync_validation_has_no_coroutine(self, _mock_logger):
+        load_validations()
+        self.assertIsNone(VALIDATIONS["simple_validation"]["coroutine"])
+
+    @patch("lifeguard.validations.LIFEGUARD_DIRECTORY", "tests/fixtures")
+    @patch("lifeguard.validations.logger")
+    def test_track_validations_loaded_from_file(self, _mock_logger):
+        load_validations()
+        file_path = "tests/fixtures/validations/simple_validation.yaml"
+
+        self.assertEqual(
+            FILE_VALIDATIONS[file_path],
+            [
+                "simple_validation_with_action_in_yaml",
+                "simple_validation_with_error_in_yaml",
+                "simple_validation_with_timeout_in_yaml",
+            ],
+        )
+
+        removed = unload_validations_file(file_path)
+
+        self.assertEqual(len(removed), 3)
+        self.assertNotIn("simple_validation_with_action_in_yaml", VALIDATIONS)
+        self.assertIn("simple_validation", VALIDATIONS)
+
+    @patch("lifeguard.validations.logger")
+    def test_load_batch_validation_with_derived_validation_by_target(
+        self, _mock_logger
+    ):
+        file_path = "tests/fixtures/validations/batch_validation.yaml"
+
+        self.assertEqual(
+            load_validations_file(file_path),
+            [
+                "batch_validation_in_yaml",
+                "batch_validation_in_yaml.up",
+                "batch_validation_in_yaml.down",
+            ],
+        )
+        self.assertEqual(
+            VALIDATIONS["batch_validation_in_yaml"]["schedule"],
+            {"every": {"minutes": 1}},
+        )
+        self.assertEqual(VALIDATIONS["batch_validation_in_yaml"]["actions"], None)
+        self.assertEqual(VALIDATIONS["batch_validation_in_yaml.up"]["schedule"], {})
+        self.assertEqual(
+            VALIDATIONS["batch_validation_in_yaml.up"]["actions"][0].__name__,
+            "common_action",
+        )
+
+    @patch("lifeguard.validations.__execute_actions")
+    def test_execute_batch_validation_once_for_all_targets(self, mock_execute_actions):
+        load_validations_file("tests/fixtures/validations/batch_validation.yaml")
+
+        response = VALIDATIONS["batch_validation_in_yaml"]["ref"]()
+
+        self.assertEqual(response.status, PROBLEM)
+        self.assertEqual(response.details, {"up": NORMAL, "down": PROBLEM})
+        self.assertEqual(
+            [
+                (action_call[0][1].validation_name, action_call[0][1].status)
+                for action_call in mock_execute_actions.call_args_list
+                if action_call[0][0]
+            ],
+            [
+                ("batch_validation_in_yaml.up", NORMAL),
+                ("batch_validation_in_yaml.down", PROBLEM),
+            ],
+        )
+
+    @patch("lifeguard.validations.logger")
+    def test_execute_derived_validation_of_a_target(self, _mock_logger):
+        load_validations_file("tests/fixtures/validations/batch_validation.yaml")
+
+        response = VALIDATIONS["batch_validation_in_yaml.down"]["ref"]()
+
+        self.assertEqual(response.status, PROBLEM)
+        self.assertEqual(response.validation_name, "batch_validation_in_yaml.down")
+
+    @patch("lifeguard.validations.logger")
+    def test_derive_validation_names_usable_in_urls_from_targets(self, _mock_logger):
+        names = load_validations_file(
+            "tests/fixtures/validations/batch_url_validation.yaml"
+        )
+
+        self.assertEqual(
+            names[:3],
+            [
+                "url_batch_validation_in_yaml",
+                "url_batch_validation_in_yaml.http-service-a",
+                "url_batch_validation_in_yaml.http-service-b",
+            ],
+        )
+        response = VALIDATIONS["url_batch_validation_in_yaml.http-service-a"]["ref"]()
+        self.assertEqual(response.status, NORMAL)
+        response = VALIDATIONS["url_batch_validation_in_yaml"]["ref"]()
+        self.assertEqual(
+            response.details, {"http-service-a": NORMAL, "http-service-b": NORMAL}
+        )
+
+    @patch("lifeguard.validations.logger")
+    @patch("lifeguard.validations.__execute_actions")
+    def test_execute_actions_on_error_of_each_target_when_batch_fails(
+        self, mock_execute_actions, mock_logger
+    ):
+        load_validations_file("tests/fixtures/validations/batch_url_validation.yaml")
+
+        response = VALIDATIONS["failing_batch_validation_in_yaml"]["ref"]()
+
+        self.assertEqual(response.status, PROBLEM)
+        self.assertEqual(
+            [
+                (
+                    [action.__name__ for action in action_call[0][0]],
+                    action_call[0][1].validation_name,
+                    action_call[0][1].status,
+                )
+                for action_call in mock_execute_actions.call_args_list
+            ],
+            [
+                (
+                    ["common_error_action"],
+                    "failing_batch_validation_in_yaml.up",
+                    PROBLEM,
+                ),
+                (
+                    ["common_error_action"],
+                    "failing_batch_validation_in_yaml.down",
+                    PROBLEM,
+                ),
+                (["common_error_action"], "failing_batch_validation_in_yaml", PROBLEM),
+            ],
+        )
+        mock_logger.error.assert_called_once()
+
+    @patch("lifeguard.validations.logger")
+    def test_match_results_by_target_not_named_by_text(self, _mock_logger):
+        load_validations_file("tests/fixtures/validations/batch_url_validation.yaml")
+
+        response = VALIDATIONS["numbered_batch_validation_in_yaml"]["ref"]()
+
+        self.assertEqual(response.status, NORMAL)
+        self.assertEqual(response.details, {"1": NORMAL, "2": NORMAL})
+
+
+PYTHON_VALIDATION = """
+from lifeguard import NORMAL
+from lifeguard.validations import ValidationResponse, validation
+
+
+@validation(description="{description}")
+def hot_reload_validation():
+    return ValidationResponse(NORMAL, {{}})
+"""
+
+
+COMMAND_MODULE = """
+from lifeguard.validations import ValidationResponse
+
+
+def command(_args):
+    return ValidationResponse("{status}", {{}})
+"""
+
+COMMAND_YAML_VALIDATION = """
+validations:
+  - validation_name: "reloaded_command_validation"
+    actions: []
+    schedule:
+      every:
+        minutes: 1
+    execute:
+      command: hot_reload.commands_validation.command
+      args:
+        - "arg"
+"""
+
+BROKEN_YAML_VALIDATION = """
+validations:
+  - validation_name: "loaded_before_error"
+    actions: []
+    schedule:
+      every:
+        minutes: 1
+    execute:
+      command: tests.fixtures.validations.shared.common_validation.common_validation
+      args:
+        - "arg"
+  - validation_name: "loaded_with_error"
+    actions:
+      - tests.fixtures.validations.shared.common_validation.missing_action
+    schedule:
+      every:
+        minutes: 1
+    execute:
+      command: tests.fixtures.validations.shared.common_validation.common_validation
+      args:
+        - "arg"
+"""
+
+
+class TestValidationConcurrencyLimits(unittest.TestCase):
+    def tearDown(self):
+        for name in ["limited_validation", "db_validation", "other_validation"]:
+            VALIDATIONS.pop(name, None)
+
+    @patch("lifeguard.validations.release_limits")
+    @patch("lifeguard.validations.acquire_limits")
+    def test_hold_limits_of_group_and_target(
+        self, mock_acquire_limits, mock_release_limits
+    ):
+        @validation(group="database", target="payments")
+        def limited_validation():
+            return ValidationResponse(NORMAL, {})
+
+        response = limited_validation()
+
+        self.assertEqual(response.status, NORMAL)
+        self.assertEqual(VALIDATIONS["limited_validation"]["target"], "payments")
+        mock_acquire_limits.assert_called_with(["database", "payments"])
+        mock_release_limits.assert_called_with(mock_acquire_limits.return_value)
+
+    @patch("lifeguard.validations.acquire_limits")
+    def test_wait_for_limits_out_of_timeout(self, mock_acquire_limits):
+        mock_acquire_limits.side_effect = lambda _names: time.sleep(0.2) or []
+
+        @validation(group="database", timeout=0.1)
+        def limited_validation():
+            return ValidationResponse(NORMAL, {})
+
+        response = limited_validation()
+
+        self.assertEqual(response.status, NORMAL)
+
+    @patch("lifeguard.validations.logger")
+    @patch.dict("lifeguard.limits.SEMAPHORES", clear=True)
+    def test_abandoned_execution_holds_limits_until_it_finishes(self, _mock_logger):
+        semaphore = SEMAPHORES["database"] = threading.BoundedSemaphore(1)
+        release = threading.Event()
+        finished = threading.Event()
+
+        @validation(group="database", timeout=0.05)
+        def limited_validation():
+            release.wait(1)
+            finished.set()
+            return ValidationResponse(NORMAL, {})
+
+        response = limited_validation()
+
+        self.assertEqual(response.status, PROBLEM)
+        self.assertFalse(semaphore.acquire(blocking=False))
+        release.set()
+        finished.wait(1)
+        self.assertTrue(semaphore.acquire(timeout=1))
+
+    @patch.dict("lifeguard.limits.SEMAPHORES", clear=True)
+    def test_coroutine_waiting_group_limit_does_not_hold_event_loop_slot(self):
+        SEMAPHORES["database"] = threading.BoundedSemaphore(1)
+        event_loop = SharedEventLoop(2)
+
+        @validation(group="database")
+        async def db_validation():
+            await asyncio.sleep(0.3)
+            return ValidationResponse(NORMAL, {})
+
+        @validation(group="other")
+        async def other_validation():
+            return ValidationResponse(NORMAL, {})
+
+        with patch("lifeguard.validations.EVENT_LOOP", event_loop):
+            coroutine = VALIDATIONS["db_validation"]["coroutine"]
+            running = [event_loop.submit(coroutine(), limited=False) for _ in range(2)]
+            time.sleep(0.05)
+            started = time.monotonic()
+            response = event_loop.submit(
+                VALIDATIONS["other_validation"]["coroutine"](), limited=False
+            ).result(1)
+
+            self.assertLess(time.monotonic() - started, 0.2)
+            self.assertEqual(response.status, NORMAL)
+            for future in running:
+                future.result(1)
+
+
+class TestValidationOnlyOnChange(unittest.TestCase):
+    def tearDown(self):
+        VALIDATIONS.pop("stable_validation", None)
+        FINGERPRINTS.clear()
+
+    @patch("lifeguard.validations.ValidationRepository")
+    def test_skip_actions_when_result_is_unchanged(self, mock_repository):
+        mock_repository.return_value.fetch_last_validation_result.return_value = None
+        action = MagicMock(name="action", __name__="action")
+        statuses = [NORMAL, NORMAL, PROBLEM]
+
+        @validation(actions=[action], only_on_change=True)
+        def stable_validation():
+            return ValidationResponse(statuses.pop(0), {"value": 1})
+
+        for _ in range(3):
+            stable_validation()
+
+        self.assertEqual(
+            [action_call[0][0].status for action_call in action.call_args_list],
+            [NORMAL, PROBLEM],
+        )
+        mock_repository.return_value.update_validation_heartbeat.assert_called_once()
+
+    @patch("lifeguard.validations.ValidationRepository")
+    def test_compare_with_last_stored_result(self, mock_repository):
+        mock_repository.return_value.fetch_last_validation_result.return_value = (
+            ValidationResponse(NORMAL, {"value": 1})
+        )
+        action = MagicMock(name="action", __name__="action")
+
+        @validation(actions=[action], only_on_change=True)
+        def stable_validation():
+            return ValidationResponse(NORMAL, {"value": 1})
+
+        stable_validation()
+
+        action.assert_not_called()
+
+    @patch("lifeguard.validations.logger")
+    @patch("lifeguard.validations.ValidationRepository")
+    def test_execute_actions_when_recovered_from_error(
+        self, mock_repository, _mock_logger
+    ):
+        stored = [ValidationResponse(NORMAL, {"value": 1})]
+        mock_repository.return_value.fetch_last_validation_result.side_effect = (
+            lambda _name: stored[-1]
+        )
+        action = MagicMock(name="action", __name__="action")
+        save = MagicMock(name="save", __name__="save")
+        save.side_effect = lambda result, _settings: stored.append(result)
+        outcomes = [
+            ValidationResponse(NORMAL, {"value": 1}),
+            None,
+            ValidationResponse(NORMAL, {"value": 1}),
+        ]
+
+        @validation(actions=[action], actions_on_error=[save], only_on_change=True)
+        def stable_validation():
+            outcome = outcomes.pop(0)
+            if outcome is None:
+                raise Exception("connection refused")
+            return outcome
+
+        for _ in range(3):
+            stable_validation()
+
+        save.assert_called_once()
+        self.assertEqual(action.call_count, 1)
+        self.assertEqual(action.call_args[0][0].status, NORMAL)
+
+
+class TestValidationActionsDispatcher(unittest.TestCase):
+    def tearDown(self):
+        VALIDATIONS.pop("dispatched_validation", None)
+
+    @patch("lifeguard.validations.logger")
+    def test_return_before_actions_are_executed(self, _mock_logger):
+        dispatcher = ActionDispatcher(1, 10)
+        release = threading.Event()
+        action = MagicMock(name="action", __name__="action")
+        action.side_effect = lambda _result, _settings: release.wait(1)
+
+        @validation(actions=[action])
+        def dispatched_validation():
+            return ValidationResponse(NORMAL, {})
+
+        with patch("lifeguard.validations.ACTION_DISPATCHER", dispatcher):
+            response = dispatched_validation()
+            self.assertEqual(response.status, NORMAL)
+            release.set()
+            dispatcher.join(1)
+
+        action.assert_called_once_with(response, {})
+
+
+class TestValidationErrorTraceback(unittest.TestCase):
+    def tearDown(self):
+        VALIDATIONS.pop("failing_validation", None)
+
+    def __build_failing_validation(self, depth=1):
+        def fail(level):
+            if level:
+                return fail(level - 1)
+            raise ValueError("error")
+
+        @validation()
+        def failing_validation():
+            return fail(depth)
+
+        return failing_validation
+
+    @patch("lifeguard.validations.TRACEBACKS", {})
+    @patch("lifeguard.validations.logger")
+    @patch("lifeguard.validations.LIFEGUARD_TRACEBACK_LIMIT", 3)
+    def test_keep_only_last_frames(self, _mock_logger):
+        response = self.__build_failing_validation(depth=10)()
+
+        self.assertEqual(response.details["traceback"].count("in fail"), 3)
+        self.assertIn("ValueError: error", response.details["traceback"])
+
+    @patch("lifeguard.validations.TRACEBACKS", {})
+    @patch("lifeguard.validations.logger")
+    @patch("lifeguard.validations.LIFEGUARD_TRACEBACK_MAX_SIZE", 40)
+    def test_keep_only_last_characters(self, _mock_logger):
+        response = self.__build_failing_validation()()
+
+        self.assertEqual(len(response.details["traceback"]), 44)
+        self.assertTrue(response.details["traceback"].startswith("...\n"))
+        self.assertTrue(response.details["traceback"].endswith("ValueError: error\n"))
+
+    @patch("lifeguard.validations.TRACEBACKS", {})
+    @patch("lifeguard.validations.logger")
+    @patch("lifeguard.validations.traceback.format_exception")
+    def test_format_identical_tracebacks_once(
+        self, mock_format_exception, _mock_logger
+    ):
+        mock_format_exception.return_value = ["traceback"]
+        failing_validation = self.__build_failing_validation()
+
+        first = failing_validation()
+        second = failing_validation()
+
+        mock_format_exception.assert_called_once()
+        self.assertIs(first.details["traceback"], second.details["traceback"])
+
+
+class TestValidationsYamlCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.directory, "simple_validation.yaml")
+        shutil.copy("tests/fixtures/validations/simple_validation.yaml", self.file_path)
+        cache = patch.dict("lifeguard.validations.YAML_CACHE", clear=True)
+        cache.start()
+        self.addCleanup(cache.stop)
+
+    def tearDown(self):
+        unload_validations_file(self.file_path)
+        shutil.rmtree(self.directory)
+
+    def __load_counting_parses(self):
+        with patch(
+            "lifeguard.validations.YAML_LOADER", wraps=yaml.FullLoader
+        ) as mock_loader:
+            load_validations_file(self.file_path)
+        return mock_loader.call_count
+
+    @patch("lifeguard.validations.logger")
+    def test_unchanged_file_is_not_parsed_again(self, _mock_logger):
+        self.assertEqual(self.__load_counting_parses(), 1)
+        self.assertEqual(self.__load_counting_parses(), 0)
+        self.assertEqual(
+            VALIDATIONS["simple_validation_with_action_in_yaml"]["schedule"],
+            {"every": {"minutes": 1}},
+        )
+
+    @patch("lifeguard.validations.logger")
+    def test_touched_file_with_same_content_is_not_parsed_again(self, _mock_logger):
+        self.__load_counting_parses()
+        os.utime(self.file_path, (0, 0))
+
+        self.assertEqual(self.__load_counting_parses(), 0)
+
+    @patch("lifeguard.validations.logger")
+    def test_changed_file_is_parsed_again(self, _mock_logger):
+        self.__load_counting_parses()
+        with open(self.file_path, "a") as file:
+            file.write("\n")
+        os.utime(self.file_path, (0, 0))
+
+        self.assertEqual(self.__load_counting_parses(), 1)
+
+    @patch("lifeguard.validations.logger")
+    def test_use_parsed_file_cached_on_disk(self, _mock_logger):
+        with patch(
+            "lifeguard.validations.LIFEGUARD_VALIDATIONS_CACHE_DIRECTORY",
+            self.directory,
+        ):
+            self.__load_counting_parses()
+            YAML_CACHE.clear()
+
+            self.assertEqual(self.__load_counting_parses(), 0)
+        self.assertIn("simple_validation_with_action_in_yaml", VALIDATIONS)
+
+    @patch("lifeguard.validations.logger")
+    def test_skip_disk_cache_of_values_changed_by_json(self, _mock_logger):
+        with open(self.file_path, "a") as file:
+            file.write("extra:\n  1: 2021-06-15\n")
+
+        with patch(
+            "lifeguard.validations.LIFEGUARD_VALIDATIONS_CACHE_DIRECTORY",
+            self.directory,
+        ):
+            self.__load_counting_parses()
+            YAML_CACHE.clear()
+
+            self.assertEqual(self.__load_counting_parses(), 1)
+        self.assertEqual(sorted(os.listdir(self.directory)), ["simple_validation.yaml"])
+
+
+class TestValidationsHotReload(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.directory, "hot_reload"))
+        self.file_path = os.path.join(
+            self.directory, "hot_reload", "example_validation.py"
+        )
+        sys.path.append(self.directory)
+
+    def tearDown(self):
+        sys.path.remove(self.directory)
+        sys.modules.pop("hot_reload.example_validation", None)
+        VALIDATIONS.pop("hot_reload_validation", None)
+        shutil.rmtree(self.directory)
+
+    def write(self, description):
+        with open(self.file_path, "w") as file:
+            file.write(PYTHON_VALIDATION.format(description=description))
+
+    @patch("lifeguard.validations.logger")
+    def test_reload_python_module(self, _mock_logger):
+        with patch("lifeguard.validations.LIFEGUARD_DIRECTORY", self.directory):
+            self.write("first")
+            self.assertEqual(
+                load_validations_file(self.file_path), ["hot_reload_validation"]
+            )
+
+            self.write("second version")
+            self.assertEqual(
+                load_validations_file(self.file_path), ["hot_reload_validation"]
+            )
+            self.assertEqual(
+                VALIDATIONS["hot_reload_validation"]["description"], "second version"
+            )
+
+            os.remove(self.file_path)
+            unload_validations_file(self.file_path)
+
+        self.assertNotIn("hot_reload_validation", VALIDATIONS)
+        self.assertNotIn("hot_reload.example_validation", sys.modules)
+
+    @patch("lifeguard.validations.logger")
+    def test_yaml_command_runs_code_of_reloaded_module(self, _mock_logger):
+        command_path = os.path.join(
+            self.directory, "hot_reload", "commands_validation.py"
+        )
+        yaml_path = os.path.join(self.directory, "command_validation.yaml")
+        with open(yaml_path, "w") as file:
+            file.write(COMMAND_YAML_VALIDATION)
+        self.addCleanup(sys.modules.pop, "hot_reload.commands_validation", None)
+        self.addCleanup(VALIDATIONS.pop, "reloaded_command_validation", None)
+
+        with patch("lifeguard.validations.LIFEGUARD_DIRECTORY", self.directory):
+            for status in [NORMAL, PROBLEM]:
+                with open(command_path, "w") as file:
+                    file.write(COMMAND_MODULE.format(status=status))
+                load_validations_file(command_path)
+                if status == NORMAL:
+                    load_validations_file(yaml_path)
+
+                response = VALIDATIONS["reloaded_command_validation"]["ref"]()
+                self.assertEqual(response.status, status)
+
+    @patch("lifeguard.validations.logger")
+    def test_remove_validations_of_module_that_fails_to_load(self, _mock_logger):
+        with open(self.file_path, "w") as file:
+            file.write(PYTHON_VALIDATION.format(description="broken") + "1 / 0\n")
+
+        with patch("lifeguard.validations.LIFEGUARD_DIRECTORY", self.directory):
+            with self.assertRaises(ZeroDivisionError):
+                load_validations_file(self.file_path)
+
+        self.assertNotIn("hot_reload_validation", VALIDATIONS)
+        self.assertEqual(unload_validations_file(self.file_path), [])
+
+    @patch("lifeguard.validations.logger")
+    def test_remove_validations_of_yaml_that_fails_to_load(self, _mock_logger):
+        file_path = os.path.join(self.directory, "broken_validation.yaml")
+        with open(file_path, "w") as file:
+            file.write(BROKEN_YAML_VALIDATION)
+
+        with self.assertRaises(AttributeError):
+            load_validations_file(file_path)
+
+        self.assertNotIn("loaded_before_error", VALIDATIONS)
+
+
+MANIFEST_VALIDATION = """
+from lifeguard import NORMAL
+from lifeguard.validations import ValidationResponse, validation
+
+
+@validation(description="manifest", group="manifest", schedule={"every": {"minutes": 1}})
+def manifest_validation():
+    return ValidationResponse(NORMAL, {})
+"""
+
+
+class TestValidationsManifest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        validations_directory = os.path.join(self.directory, "validations")
+        os.makedirs(validations_directory)
+        open(os.path.join(validations_directory, "__init__.py"), "w").close()
+        self.file_path = os.path.join(validations_directory, "manifest_validation.py")
+        with open(self.file_path, "w") as file:
+            file.write(MANIFEST_VALIDATION)
+        self.manifest_path = os.path.join(self.directory, "manifest.json")
+
+        sys.path.insert(0, self.directory)
+        modules = patch.dict(sys.modules)
+        modules.start()
+        self.addCleanup(modules.stop)
+        for module in [name for name in sys.modules if name.startswith("validations")]:
+            del sys.modules[module]
+
+    def tearDown(self):
+        sys.path.remove(self.directory)
+        VALIDATIONS.pop("manifest_validation", None)
+        FILE_VALIDATIONS.pop(self.file_path, None)
+        shutil.rmtree(self.directory)
+
+    def __build_manifest(self):
+        self.assertEqual(build_validations_manifest(self.manifest_path), 1)
+        VALIDATIONS.pop("manifest_validation")
+        del sys.modules["validations.manifest_validation"]
+
+    @patch("lifeguard.validations.logger")
+    def test_import_module_on_first_execution(self, _mock_logger):
+        with patch("lifeguard.validations.LIFEGUARD_DIRECTORY", self.directory):
+            self.__build_manifest()
+
+            with patch(
+                "lifeguard.validations.LIFEGUARD_VALIDATIONS_MANIFEST",
+                self.manifest_path,
+            ):
+                load_validations()
+
+            self.assertTrue(VALIDATIONS["manifest_validation"]["lazy"])
+            self.assertEqual(VALIDATIONS["manifest_validation"]["group"], "manifest")
+            self.assertEqual(
+                VALIDATIONS["manifest_validation"]["schedule"],
+                {"every": {"minutes": 1}},
+            )
+            self.assertNotIn("validations.manifest_validation", sys.modules)
+
+            response = VALIDATIONS["manifest_validation"]["ref"]()
+
+        self.assertEqual(response.status, NORMAL)
+        self.assertIn("validations.manifest_validation", sys.modules)
+        self.assertNotIn("lazy", VALIDATIONS["manifest_validation"])
+
+    @patch("lifeguard.validations.logger")
+    def test_import_module_changed_after_manifest(self, _mock_logger):
+        with patch("lifeguard.validations.LIFEGUARD_DIRECTORY", self.directory):
+            self.__build_manifest()
+            os.utime(self.file_path, (0, 0))
+
+            with patch(
+                "lifeguard.validations.LIFEGUARD_VALIDATIONS_MANIFEST",
+                self.manifest_path,
+            ):
+                load_validations()
+
+        self.assertNotIn("lazy", VALIDATIONS["manifest_validation"])
+        self.assertIn("validations.manifest_validation", sys.modules)
@@ -0,0 +1,99 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from lifeguard.watcher import (
+    EVENT_HEADER,
+    IN_Q_OVERFLOW,
+    InotifyWatcher,
+    inotify_available,
+)
+
+
+@unittest.skipUnless(inotify_available(), "inotify not available")
+class TestInotifyWatcher(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.changes = []
+        self.notified = threading.Event()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def callback(self, paths):
+        self.changes.append(paths)
+        self.notified.set()
+
+    def test_notify_changed_files_once_per_burst(self):
+        watcher = InotifyWatcher(
+            self.directory,
+            self.callback,
+            lambda path: path.endswith(".yaml"),
+            debounce=0.1,
+        )
+        watcher.start()
+
+        file_path = os.path.join(self.directory, "example_validation.yaml")
+        for _ in range(5):
+            with open(file_path, "w") as file:
+                file.write("validations: []")
+        with open(os.path.join(self.directory, "ignored.txt"), "w") as file:
+            file.write("ignored")
+
+        self.assertTrue(self.notified.wait(5))
+        watcher.stop()
+        self.assertEqual(self.changes, [{file_path}])
+
+    def test_notify_files_in_new_directories(self):
+        watcher = InotifyWatcher(self.directory, self.callback, debounce=0.1)
+        watcher.start()
+
+        subdir = os.path.join(self.directory, "subdir")
+        os.makedirs(subdir)
+        file_path = os.path.join(subdir, "example_validation.yaml")
+        with open(file_path, "w") as file:
+            file.write("validations: []")
+
+        self.assertTrue(self.notified.wait(5))
+        watcher.stop()
+        self.assertIn(file_path, set.union(*self.changes))
+
+    def __overflow(self, watcher):
+        read_end, write_end = os.pipe()
+        self.addCleanup(os.close, read_end)
+        os.write(write_end, EVENT_HEADER.pack(-1, IN_Q_OVERFLOW, 0, 0))
+        os.close(write_end)
+        watcher._descriptor = read_end
+
+    @patch("lifeguard.watcher.logger")
+    @patch("lifeguard.watcher.LIBC")
+    def test_call_on_overflow_when_events_are_lost(self, mock_libc, mock_logger):
+        mock_libc.inotify_add_watch.return_value = 1
+        on_overflow = MagicMock(name="on_overflow")
+        watcher = InotifyWatcher(self.directory, self.callback, on_overflow=on_overflow)
+        self.__overflow(watcher)
+
+        watcher._InotifyWatcher__read_events()
+
+        on_overflow.assert_called_once_with()
+        mock_logger.warning.assert_called_with(
+            "inotify queue overflow, rescanning %s", self.directory
+        )
+
+    @patch("lifeguard.watcher.logger")
+    @patch("lifeguard.watcher.LIBC")
+    def test_report_all_files_on_overflow_without_callback(
+        self, mock_libc, _mock_logger
+    ):
+        mock_libc.inotify_add_watch.return_value = 1
+        file_path = os.path.join(self.directory, "example_validation.yaml")
+        open(file_path, "w").close()
+        watcher = InotifyWatcher(self.directory, self.callback)
+        self.__overflow(watcher)
+
+        watcher._InotifyWatcher__read_events()
+
+        self.assertEqual(watcher._changed, {file_path})